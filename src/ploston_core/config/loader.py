@@ -10,6 +10,7 @@ import yaml
 
 from ploston_core.errors import create_error
 from ploston_core.types import ValidationIssue, ValidationResult
+from ploston_core.utils.yaml_loader import SafeLoader
 
 from .models import AELConfig
 
@@ -175,7 +176,7 @@ class ConfigLoader:
         # Load YAML
         try:
             with config_path.open() as f:
-                data = yaml.safe_load(f) or {}
+                data = yaml.load(f, Loader=SafeLoader) or {}
         except yaml.YAMLError as e:
             raise create_error(
                 "CONFIG_INVALID",
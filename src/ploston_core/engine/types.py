@@ -57,14 +57,16 @@ class StepResult:
         error_str: str | None = None
         if self.error is not None:
             error_str = str(self.error)
+        # Positional arguments (output, success, duration_ms, step_id, status,
+        # error, debug_log): this runs once per completed step
         return StepOutput(
-            output=self.output,
-            success=self.status == StepStatus.COMPLETED,
-            duration_ms=self.duration_ms or 0,
-            step_id=self.step_id,
-            status=self.status.value,
-            error=error_str,
-            debug_log=list(self.debug_log),
+            self.output,
+            self.status == StepStatus.COMPLETED,
+            self.duration_ms or 0,
+            self.step_id,
+            self.status.value,
+            error_str,
+            list(self.debug_log),
         )
 
 
@@ -201,13 +203,35 @@ class ExecutionContext:
     # Workflow start time (ISO 8601 string, set by execute_workflow)
     started_at: str = ""
 
+    # TemplateContext cache, keyed by the fields it was built from
+    _template_context: Any = field(default=None, init=False, repr=False, compare=False)
+    _template_sources: tuple[Any, ...] = field(default=(), init=False, repr=False, compare=False)
+
     def add_step_result(self, result: StepResult) -> None:
         """Add a step result to the context."""
         self.step_results[result.step_id] = result
         self.step_outputs[result.step_id] = result.to_step_output()
 
     def get_template_context(self) -> Any:  # TemplateContext
-        """Get context for template rendering."""
+        """Get context for template rendering.
+
+        The context is built once and reused for every step: its ``steps`` is
+        the live ``step_outputs`` dict, so later results show through. It is
+        rebuilt only if one of the fields it was built from is reassigned.
+        """
+        sources = (
+            self.workflow,
+            self.inputs,
+            self.config,
+            self.execution_id,
+            self.started_at,
+            self.step_outputs,
+        )
+        if self._template_context is not None and all(
+            a is b for a, b in zip(sources, self._template_sources, strict=True)
+        ):
+            return self._template_context
+
         from ploston_core.template.types import TemplateContext
 
         workflow_meta: dict[str, str] | None = None
@@ -218,13 +242,15 @@ class ExecutionContext:
                 "start_time": self.started_at,
             }
 
-        return TemplateContext(
+        self._template_context = TemplateContext(
             inputs=self.inputs,
             steps=self.step_outputs,
             config=self.config,
             execution_id=self.execution_id,
             workflow=workflow_meta,
         )
+        self._template_sources = sources
+        return self._template_context
 
 
 @dataclass
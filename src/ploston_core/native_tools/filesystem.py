@@ -11,6 +11,8 @@ from typing import Any
 
 import yaml
 
+from ploston_core.utils.yaml_loader import SafeLoader
+
 
 def read_file_content(
     path: str, workspace_dir: str | None = None, encoding: str = "utf-8", format: str = "text"
@@ -82,7 +84,7 @@ def read_file_content(
             raise ValueError(f"Invalid JSON format: {e}")
     elif file_format == "yaml":
         try:
-            parsed_content = yaml.safe_load(content)
+            parsed_content = yaml.load(content, Loader=SafeLoader)
         except yaml.YAMLError as e:
             raise ValueError(f"Invalid YAML format: {e}")
 
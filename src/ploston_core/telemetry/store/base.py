@@ -114,6 +114,17 @@ class TelemetryStore(ABC):
         """
         ...
 
+    async def get_earliest_started_at(self) -> datetime | None:
+        """Get the start time of the oldest execution.
+
+        Used to schedule retention cleanup. Stores that cannot answer cheaply
+        may keep this default.
+
+        Returns:
+            Earliest started_at, or None if unknown or the store is empty
+        """
+        return None
+
     async def close(self) -> None:
         """Close any open connections."""
         pass
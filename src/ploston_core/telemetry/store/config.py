@@ -2,9 +2,16 @@
 
 import re
 from dataclasses import dataclass, field
+from functools import lru_cache
 
 
-@dataclass
+@lru_cache(maxsize=256)
+def _compile_pattern(pattern: str) -> re.Pattern[str]:
+    """Compile a redaction pattern, reusing earlier compilations."""
+    return re.compile(pattern)
+
+
+@dataclass(slots=True, frozen=True)
 class RedactionPattern:
     """Pattern-based redaction rule."""
 
@@ -14,54 +21,68 @@ class RedactionPattern:
     @classmethod
     def from_string(cls, pattern: str, replacement: str) -> "RedactionPattern":
         """Create from string pattern."""
-        return cls(regex=re.compile(pattern), replacement=replacement)
+        return cls(regex=_compile_pattern(pattern), replacement=replacement)
 
 
-@dataclass
+@dataclass(slots=True)
 class RedactionConfig:
     """Redaction configuration."""
 
     enabled: bool = True
 
-    # Field names to always redact (case-insensitive)
-    fields: list[str] = field(
-        default_factory=lambda: [
-            "password",
-            "secret",
-            "api_key",
-            "token",
-            "authorization",
-            "credential",
-            "private_key",
-        ]
+    # Field names to always redact (case-insensitive; stored lowercased)
+    fields: frozenset[str] = field(
+        default_factory=lambda: frozenset(
+            {
+                "password",
+                "secret",
+                "api_key",
+                "token",
+                "authorization",
+                "credential",
+                "private_key",
+            }
+        )
     )
 
     # Regex patterns to redact
     patterns: list[RedactionPattern] = field(default_factory=list)
 
+    def __post_init__(self) -> None:
+        """Normalize fields to a lowercased frozenset (lists are accepted)."""
+        self.fields = frozenset(f.lower() for f in self.fields)
+
     @classmethod
     def default(cls) -> "RedactionConfig":
-        """Create default redaction config with common patterns."""
+        """Create default redaction config with common patterns.
+
+        The patterns are ASCII-only and written to match in linear time: the
+        email pattern only starts at the beginning of a local-part run, so
+        long runs without an ``@`` are not rescanned from every offset.
+        """
         return cls(
             enabled=True,
             patterns=[
                 RedactionPattern(
-                    regex=re.compile(r"sk-[a-zA-Z0-9]{32,}"),
+                    regex=re.compile(r"sk-[a-zA-Z0-9]{32,}", re.ASCII),
                     replacement="[REDACTED_API_KEY]",
                 ),
                 RedactionPattern(
-                    regex=re.compile(r"\b[0-9]{13,16}\b"),
+                    regex=re.compile(r"\b[0-9]{13,16}\b", re.ASCII),
                     replacement="[REDACTED_CARD]",
                 ),
                 RedactionPattern(
-                    regex=re.compile(r"[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}"),
+                    regex=re.compile(
+                        r"(?<![a-zA-Z0-9._%+-])[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}",
+                        re.ASCII,
+                    ),
                     replacement="[REDACTED_EMAIL]",
                 ),
             ],
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class RetentionConfig:
     """Retention policy configuration."""
 
@@ -70,7 +91,7 @@ class RetentionConfig:
     cleanup_interval_seconds: int = 3600  # 1 hour
 
 
-@dataclass
+@dataclass(slots=True)
 class OTLPExportConfig:
     """OpenTelemetry export configuration."""
 
@@ -82,7 +103,7 @@ class OTLPExportConfig:
     metrics: bool = True
 
 
-@dataclass
+@dataclass(slots=True)
 class TelemetryStoreConfig:
     """Complete telemetry store configuration."""
 
@@ -1,17 +1,53 @@
 """In-memory telemetry store with LRU eviction."""
 
 import asyncio
-from collections import OrderedDict
+import bisect
+import itertools
+from collections import OrderedDict, defaultdict
+from collections.abc import Iterable
 from datetime import datetime
+from operator import itemgetter
+from typing import Any
 
 from .base import TelemetryStore
 from .types import ExecutionRecord, ExecutionStatus, ExecutionType
 
+# Sort key for records without a start time (oldest possible)
+_NO_TIME = float("-inf")
+
+# Time index entry: (started_at POSIX timestamp, -insertion sequence, execution_id)
+_TimeEntry = tuple[float, int, str]
+_entry_time = itemgetter(0)
+
+# Records removed per event-loop turn by delete_before
+_DELETE_BATCH_SIZE = 1000
+
+# Record fields with an equality index for list filtering
+_INDEXED_FIELDS = (
+    "execution_type",
+    "workflow_id",
+    "tool_name",
+    "status",
+    "caller_id",
+    "session_id",
+)
+
 
 class MemoryTelemetryStore(TelemetryStore):
     """In-memory telemetry store with LRU eviction.
 
     Data is lost on restart. Suitable for development/testing.
+
+    Records are kept in a time index sorted by ``started_at`` so listing
+    walks newest-first without sorting on every query, plus equality
+    indexes on the filterable fields so selective filters only visit
+    matching records. Tool call statistics are counted once per save and
+    kept as running totals. Indexes and statistics reflect each record as
+    of its last save.
+
+    Mutations contain no await points, so each one runs to completion on
+    the event loop without needing a lock, and readers never observe a
+    half-updated index.
     """
 
     def __init__(self, max_records: int = 1000) -> None:
@@ -21,21 +57,38 @@ class MemoryTelemetryStore(TelemetryStore):
             max_records: Maximum number of records to keep (LRU eviction)
         """
         self._max_records = max_records
+        # LRU order; OrderedDict's move_to_end/popitem are O(1) C operations
         self._records: OrderedDict[str, ExecutionRecord] = OrderedDict()
-        self._lock = asyncio.Lock()
+
+        # Sorted ascending; ties keep save order when walked in reverse
+        self._by_time: list[_TimeEntry] = []
+        self._time_entries: dict[str, _TimeEntry] = {}
+        self._sequence = itertools.count()
+
+        # field name -> field value -> execution IDs
+        self._field_index: dict[str, defaultdict[Any, set[str]]] = {
+            name: defaultdict(set) for name in _INDEXED_FIELDS
+        }
+        self._field_values: dict[str, tuple[Any, ...]] = {}
+
+        # Tool call counts per execution, and summed over all executions
+        self._tool_counts: dict[str, dict[str, dict[str, int]]] = {}
+        self._tool_totals: dict[str, dict[str, int]] = {}
 
     async def save_execution(self, record: ExecutionRecord) -> None:
         """Save or update an execution record."""
-        async with self._lock:
-            # Move to end if exists (LRU)
-            if record.execution_id in self._records:
-                self._records.move_to_end(record.execution_id)
+        # Move to end if exists (LRU)
+        if record.execution_id in self._records:
+            self._records.move_to_end(record.execution_id)
+            self._unindex(record.execution_id)
 
-            self._records[record.execution_id] = record
+        self._records[record.execution_id] = record
+        self._index(record)
 
-            # Evict oldest if over limit
-            while len(self._records) > self._max_records:
-                self._records.popitem(last=False)
+        # Evict oldest if over limit
+        while len(self._records) > self._max_records:
+            evicted_id, _ = self._records.popitem(last=False)
+            self._unindex(evicted_id)
 
     async def get_execution(self, execution_id: str) -> ExecutionRecord | None:
         """Get execution by ID."""
@@ -54,10 +107,45 @@ class MemoryTelemetryStore(TelemetryStore):
         page: int = 1,
         page_size: int = 20,
     ) -> tuple[list[ExecutionRecord], int]:
-        """List executions with filtering."""
-        # Filter
-        filtered = []
-        for record in self._records.values():
+        """List executions with filtering.
+
+        Runs without await points, so it sees a consistent view of the
+        indexes without copying them, even while a batched delete_before
+        is in progress.
+        """
+        start = (page - 1) * page_size
+        end = start + page_size
+
+        # Start from the smallest matching index bucket, if any field filter is set
+        filters = {
+            name: value
+            for name, value in (
+                ("execution_type", execution_type),
+                ("workflow_id", workflow_id),
+                ("tool_name", tool_name),
+                ("status", status),
+                ("caller_id", caller_id),
+                ("session_id", session_id),
+            )
+            if value
+        }
+        candidates: Iterable[_TimeEntry]
+        if filters:
+            smallest = min(
+                (self._field_index[name].get(value, set()) for name, value in filters.items()),
+                key=len,
+            )
+            candidates = sorted((self._time_entries[eid] for eid in smallest), reverse=True)
+        else:
+            candidates = reversed(self._by_time)
+
+        # Walk newest-first; only the requested page is materialized
+        page_records: list[ExecutionRecord] = []
+        total = 0
+        since_ts = since.timestamp() if since else None
+        until_ts = until.timestamp() if until else None
+        for ts, _, eid in candidates:
+            record = self._records[eid]
             if execution_type and record.execution_type != execution_type:
                 continue
             if workflow_id and record.workflow_id != workflow_id:
@@ -66,45 +154,54 @@ class MemoryTelemetryStore(TelemetryStore):
                 continue
             if status and record.status != status:
                 continue
-            if since and record.started_at and record.started_at < since:
+            if since_ts is not None and ts != _NO_TIME and ts < since_ts:
                 continue
-            if until and record.started_at and record.started_at > until:
+            if until_ts is not None and ts != _NO_TIME and ts > until_ts:
                 continue
             if caller_id and record.caller_id != caller_id:
                 continue
             if session_id and record.session_id != session_id:
                 continue
-            filtered.append(record)
-
-        # Sort by started_at descending
-        filtered.sort(key=lambda r: r.started_at or datetime.min, reverse=True)
-
-        # Paginate
-        total = len(filtered)
-        start = (page - 1) * page_size
-        end = start + page_size
+            if start <= total < end:
+                page_records.append(record)
+            total += 1
 
-        return filtered[start:end], total
+        return page_records, total
 
     async def delete_execution(self, execution_id: str) -> bool:
         """Delete an execution."""
-        async with self._lock:
-            if execution_id in self._records:
-                del self._records[execution_id]
-                return True
-            return False
+        if execution_id in self._records:
+            del self._records[execution_id]
+            self._unindex(execution_id)
+            return True
+        return False
 
     async def delete_before(self, cutoff: datetime) -> int:
-        """Delete executions before cutoff."""
-        async with self._lock:
-            to_delete = [
-                eid
-                for eid, record in self._records.items()
-                if record.started_at and record.started_at < cutoff
-            ]
-            for eid in to_delete:
+        """Delete executions before cutoff.
+
+        Expired records are removed from the head of the time index in
+        batches, yielding to the event loop between batches so large
+        sweeps don't stall other tasks. The store is consistent at every
+        yield.
+        """
+        deleted = 0
+        while True:
+            # Records without a start time are never expired
+            lo = self._first_timed_entry()
+            hi = max(lo, bisect.bisect_left(self._by_time, cutoff.timestamp(), key=_entry_time))
+            batch_end = min(hi, lo + _DELETE_BATCH_SIZE)
+
+            for _, _, eid in itertools.islice(self._by_time, lo, batch_end):
                 del self._records[eid]
-            return len(to_delete)
+                del self._time_entries[eid]
+                self._unindex_fields(eid)
+                _add_tool_counts(self._tool_totals, self._tool_counts.pop(eid), -1)
+            del self._by_time[lo:batch_end]
+            deleted += batch_end - lo
+
+            if batch_end == hi:
+                return deleted
+            await asyncio.sleep(0)
 
     async def get_tool_call_stats(
         self,
@@ -112,23 +209,109 @@ class MemoryTelemetryStore(TelemetryStore):
         until: datetime | None = None,
     ) -> dict[str, dict[str, int]]:
         """Get tool call statistics."""
+        if since is None and until is None:
+            return {tool: dict(counts) for tool, counts in self._tool_totals.items()}
+
+        # Records without a start time match any range
+        lo = self._first_timed_entry()
+        entries = self._by_time[:lo]
+        start = (
+            lo
+            if since is None
+            else bisect.bisect_left(self._by_time, since.timestamp(), lo, key=_entry_time)
+        )
+        end = (
+            len(self._by_time)
+            if until is None
+            else bisect.bisect_right(self._by_time, until.timestamp(), lo, key=_entry_time)
+        )
+        entries += self._by_time[start:end]
+
         stats: dict[str, dict[str, int]] = {}
+        for _, _, eid in entries:
+            _add_tool_counts(stats, self._tool_counts[eid], 1)
+        return stats
 
-        for record in self._records.values():
-            if since and record.started_at and record.started_at < since:
-                continue
-            if until and record.started_at and record.started_at > until:
+    async def get_earliest_started_at(self) -> datetime | None:
+        """Get the start time of the oldest execution."""
+        pos = self._first_timed_entry()
+        if pos == len(self._by_time):
+            return None
+        return self._records[self._by_time[pos][2]].started_at
+
+    # ─────────────────────────────────────────────────────────────────
+    # Index maintenance
+    # ─────────────────────────────────────────────────────────────────
+
+    def _first_timed_entry(self) -> int:
+        """Return the time index position after records without a start time."""
+        return bisect.bisect_right(self._by_time, _NO_TIME, key=_entry_time)
+
+    def _index(self, record: ExecutionRecord) -> None:
+        """Add a record to the time and field indexes."""
+        eid = record.execution_id
+        ts = record.started_at.timestamp() if record.started_at else _NO_TIME
+        entry = (ts, -next(self._sequence), eid)
+        bisect.insort(self._by_time, entry)
+        self._time_entries[eid] = entry
+
+        values = tuple(getattr(record, name) for name in _INDEXED_FIELDS)
+        for name, value in zip(_INDEXED_FIELDS, values, strict=True):
+            if value is not None:
+                self._field_index[name][value].add(eid)
+        self._field_values[eid] = values
+
+        counts = _count_tool_calls(record)
+        self._tool_counts[eid] = counts
+        _add_tool_counts(self._tool_totals, counts, 1)
+
+    def _unindex(self, execution_id: str) -> None:
+        """Remove a record from the time and field indexes."""
+        entry = self._time_entries.pop(execution_id, None)
+        if entry is None:
+            return
+        pos = bisect.bisect_left(self._by_time, entry)
+        del self._by_time[pos]
+        self._unindex_fields(execution_id)
+        _add_tool_counts(self._tool_totals, self._tool_counts.pop(execution_id), -1)
+
+    def _unindex_fields(self, execution_id: str) -> None:
+        """Remove a record from the field indexes."""
+        values = self._field_values.pop(execution_id)
+        for name, value in zip(_INDEXED_FIELDS, values, strict=True):
+            if value is None:
                 continue
+            bucket = self._field_index[name][value]
+            bucket.discard(execution_id)
+            if not bucket:
+                del self._field_index[name][value]
 
-            for step in record.steps:
-                for call in step.tool_calls:
-                    if call.tool_name not in stats:
-                        stats[call.tool_name] = {"total": 0, "success": 0, "error": 0}
 
-                    stats[call.tool_name]["total"] += 1
-                    if call.error:
-                        stats[call.tool_name]["error"] += 1
-                    else:
-                        stats[call.tool_name]["success"] += 1
+def _count_tool_calls(record: ExecutionRecord) -> dict[str, dict[str, int]]:
+    """Count tool calls in a record by tool name and outcome."""
+    counts: dict[str, dict[str, int]] = {}
+    for step in record.steps:
+        for call in step.tool_calls:
+            if call.tool_name not in counts:
+                counts[call.tool_name] = {"total": 0, "success": 0, "error": 0}
 
-        return stats
+            counts[call.tool_name]["total"] += 1
+            if call.error:
+                counts[call.tool_name]["error"] += 1
+            else:
+                counts[call.tool_name]["success"] += 1
+    return counts
+
+
+def _add_tool_counts(
+    target: dict[str, dict[str, int]],
+    counts: dict[str, dict[str, int]],
+    sign: int,
+) -> None:
+    """Add (sign=1) or subtract (sign=-1) tool call counts into target."""
+    for tool, tool_counts in counts.items():
+        totals = target.setdefault(tool, {"total": 0, "success": 0, "error": 0})
+        for key, value in tool_counts.items():
+            totals[key] += sign * value
+        if not totals["total"]:
+            del target[tool]
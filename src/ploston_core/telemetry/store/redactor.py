@@ -1,9 +1,153 @@
 """Redactor for sensitive data before storage."""
 
+import re
+from collections.abc import Callable, Iterator
+from datetime import datetime
+from functools import lru_cache
 from typing import Any
 
 from .config import RedactionConfig
 
+# Upper bound on remembered field-name decisions per Redactor
+_KEY_CACHE_SIZE = 1024
+
+# Value kinds for redaction dispatch
+_LEAF, _STR, _DICT, _LIST = 1, 2, 3, 4
+_KIND_BY_TYPE: dict[type, int] = {
+    str: _STR,
+    dict: _DICT,
+    list: _LIST,
+    # Common scalars pass through without isinstance checks
+    int: _LEAF,
+    float: _LEAF,
+    bool: _LEAF,
+    type(None): _LEAF,
+    bytes: _LEAF,
+    datetime: _LEAF,
+}
+
+
+def _subclass_kind(value: Any) -> int:
+    """Classify values whose exact type is not in the dispatch table."""
+    if isinstance(value, str):
+        return _STR
+    if isinstance(value, dict):
+        return _DICT
+    if isinstance(value, list):
+        return _LIST
+    return _LEAF
+
+
+# (compiled pattern, replacement) pairs, hashable for caching
+_PatternSpec = tuple[tuple[re.Pattern[str], str], ...]
+
+
+def _combine_patterns(specs: _PatternSpec) -> re.Pattern[str] | None:
+    """Combine redaction patterns into a single alternation.
+
+    Each pattern is wrapped in a named group ``g<index>`` so the match can be
+    mapped back to its replacement. Patterns that cannot be safely combined
+    (mixed flags, backreferences, template replacements, clashing group
+    names) return None and are applied one at a time instead.
+
+    Args:
+        specs: Redaction patterns and replacements to combine
+
+    Returns:
+        Compiled alternation, or None if the patterns cannot be combined
+    """
+    if not specs:
+        return None
+
+    flags = specs[0][0].flags
+    if any(regex.flags != flags for regex, _ in specs):
+        return None
+    if any(regex.groups and re.search(r"\\[1-9]|\(\?P=", regex.pattern) for regex, _ in specs):
+        return None
+    if any("\\" in replacement for _, replacement in specs):
+        return None
+
+    try:
+        return re.compile(
+            "|".join(f"(?P<g{i}>{regex.pattern})" for i, (regex, _) in enumerate(specs)),
+            flags,
+        )
+    except re.error:
+        return None
+
+
+def _min_match_length(regex: re.Pattern[str]) -> int:
+    """Return the shortest text length a pattern can match.
+
+    Uses the stdlib regex parser to compute the pattern width. Falls back to
+    0 (always scan) if the width cannot be determined.
+
+    Args:
+        regex: Compiled pattern
+
+    Returns:
+        Minimum match length
+    """
+    parser = getattr(re, "_parser", None)
+    try:
+        return int(parser.parse(regex.pattern, regex.flags).getwidth()[0])  # type: ignore[union-attr]
+    except Exception:
+        return 0
+
+
+def _return_text(text: str) -> str:
+    """Pattern redactor used when no patterns are configured."""
+    return text
+
+
+@lru_cache(maxsize=32)
+def _build_pattern_redactor(specs: _PatternSpec) -> Callable[[str], str]:
+    """Build a string redactor specialized for a fixed pattern set.
+
+    All decisions that depend only on the configuration (combining the
+    patterns, the minimum match length, which substitution strategy to use)
+    are made here once, so the returned function has no per-call branching
+    on configuration. Results are cached, so redactors sharing a pattern set
+    (typically ``RedactionConfig.default()``) share one function.
+
+    Args:
+        specs: Redaction patterns and replacements
+
+    Returns:
+        Function applying the patterns to a string
+    """
+    if not specs:
+        return _return_text
+
+    # Strings shorter than every pattern's minimum match can't be redacted
+    min_len = min(_min_match_length(regex) for regex, _ in specs)
+
+    combined = _combine_patterns(specs)
+    if combined is not None:
+        combined_sub = combined.sub
+        replacements = [replacement for _, replacement in specs]
+
+        def replace_match(match: re.Match[str]) -> str:
+            return replacements[int(match.lastgroup[1:])]  # type: ignore[index]
+
+        def redact_combined(text: str) -> str:
+            if len(text) < min_len:
+                return text
+            return combined_sub(replace_match, text)
+
+        return redact_combined
+
+    subs = [(regex.sub, replacement) for regex, replacement in specs]
+
+    def redact_each(text: str) -> str:
+        if len(text) < min_len:
+            return text
+        for sub, replacement in subs:
+            text = sub(replacement, text)
+        return text
+
+    return redact_each
+
 
 class Redactor:
     """Redacts sensitive data before storage."""
@@ -17,10 +161,20 @@ class Redactor:
             config: Redaction configuration
         """
         self._config = config
-        self._field_set = {f.lower() for f in config.fields}
+        self._field_set: frozenset[str] = config.fields
+        # Field name -> whether it is sensitive; field names repeat across records
+        self._key_cache: dict[str, bool] = {}
+        # Applies the configured patterns to a string in a single call
+        self._redact_patterns: Callable[[str], str] = _build_pattern_redactor(
+            tuple((p.regex, p.replacement) for p in config.patterns)
+        )
 
     def redact(self, data: Any) -> Any:
-        """Recursively redact sensitive data.
+        """Redact sensitive data in nested dicts and lists.
+
+        Containers are walked with an explicit stack rather than recursion.
+        A container is copied only when something inside it is redacted;
+        containers with nothing to redact are returned as-is, not copied.
 
         Args:
             data: Data to redact (dict, list, str, or other)
@@ -31,28 +185,66 @@ class Redactor:
         if not self._config.enabled:
             return data
 
-        if isinstance(data, dict):
-            return {
-                key: (self.REDACTED if key.lower() in self._field_set else self.redact(value))
-                for key, value in data.items()
-            }
-        elif isinstance(data, list):
-            return [self.redact(item) for item in data]
-        elif isinstance(data, str):
+        kind_by_type = _KIND_BY_TYPE
+        kind = kind_by_type.get(type(data)) or _subclass_kind(data)
+        if kind == _STR:
             return self._redact_patterns(data)
-        else:
+        if kind == _LEAF:
             return data
 
-    def _redact_patterns(self, text: str) -> str:
-        """Apply regex patterns to redact.
+        key_cache = self._key_cache
+        field_set = self._field_set
+        redact_patterns = self._redact_patterns
 
-        Args:
-            text: Text to apply patterns to
+        # Frames: [source, (slot, value) iterator, kind, slot in parent, copy or None]
+        stack: list[list[Any]] = [[data, _children(data, kind), kind, None, None]]
+        while stack:
+            frame = stack[-1]
+            source, children, kind = frame[0], frame[1], frame[2]
+            for slot, value in children:
+                if kind == _DICT:
+                    sensitive = key_cache.get(slot)
+                    if sensitive is None:
+                        sensitive = slot.lower() in field_set
+                        if len(key_cache) < _KEY_CACHE_SIZE:
+                            key_cache[slot] = sensitive
+                    if sensitive:
+                        new_value: Any = self.REDACTED
+                        if frame[4] is None:
+                            frame[4] = _copy(source, kind)
+                        frame[4][slot] = new_value
+                        continue
 
-        Returns:
-            Text with patterns replaced
-        """
-        result = text
-        for pattern in self._config.patterns:
-            result = pattern.regex.sub(pattern.replacement, result)
-        return result
+                value_kind = kind_by_type.get(type(value)) or _subclass_kind(value)
+                if value_kind == _STR:
+                    new_value = redact_patterns(value)
+                    if new_value is not value:
+                        if frame[4] is None:
+                            frame[4] = _copy(source, kind)
+                        frame[4][slot] = new_value
+                elif value_kind != _LEAF:
+                    # Descend; this frame resumes from its iterator afterwards
+                    stack.append([value, _children(value, value_kind), value_kind, slot, None])
+                    break
+            else:
+                stack.pop()
+                result = source if frame[4] is None else frame[4]
+                if not stack:
+                    return result
+                if result is not source:
+                    parent = stack[-1]
+                    if parent[4] is None:
+                        parent[4] = _copy(parent[0], parent[2])
+                    parent[4][frame[3]] = result
+
+        return data
+
+
+def _children(container: Any, kind: int) -> Iterator[tuple[Any, Any]]:
+    """Iterate (slot, value) pairs of a dict or list."""
+    return iter(container.items()) if kind == _DICT else enumerate(container)
+
+
+def _copy(container: Any, kind: int) -> Any:
+    """Make a shallow plain-dict or plain-list copy of a container."""
+    return dict(container) if kind == _DICT else list(container)
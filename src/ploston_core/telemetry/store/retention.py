@@ -2,6 +2,7 @@
 
 import asyncio
 import logging
+import random
 from datetime import UTC, datetime, timedelta
 
 from .base import TelemetryStore
@@ -9,11 +10,17 @@ from .config import RetentionConfig
 
 logger = logging.getLogger(__name__)
 
+# Upper bound on the random delay added to each cleanup sleep
+MAX_JITTER_SECONDS = 30.0
+
 
 class RetentionManager:
     """Manages retention policy for telemetry records.
 
-    Periodically deletes records older than the retention period.
+    Periodically deletes records older than the retention period. Between
+    runs it sleeps at least ``cleanup_interval_seconds``, longer if the
+    store reports that its oldest record won't expire before then, plus a
+    small random jitter so multiple instances don't clean up in lockstep.
     """
 
     def __init__(
@@ -29,6 +36,7 @@ class RetentionManager:
         """
         self._store = store
         self._config = config
+        self._retention = timedelta(days=config.retention_days)
         self._task: asyncio.Task[None] | None = None
         self._running = False
 
@@ -66,13 +74,29 @@ class RetentionManager:
                 logger.error("Retention cleanup failed: %s", e)
 
             try:
-                await asyncio.sleep(self._config.cleanup_interval_seconds)
+                await asyncio.sleep(await self._next_delay())
             except asyncio.CancelledError:
                 break
 
+    async def _next_delay(self) -> float:
+        """Compute seconds to sleep before the next cleanup."""
+        delay = float(self._config.cleanup_interval_seconds)
+        try:
+            earliest = await self._store.get_earliest_started_at()
+        except Exception as e:
+            logger.warning("Could not read earliest execution time: %s", e)
+            earliest = None
+
+        # Nothing can expire before the oldest record does
+        if earliest is not None:
+            expires_at = earliest + self._retention
+            delay = max(delay, (expires_at - datetime.now(UTC)).total_seconds())
+
+        return delay + random.uniform(0, min(MAX_JITTER_SECONDS, delay * 0.1))
+
     async def _cleanup(self) -> None:
         """Perform cleanup of old records."""
-        cutoff = datetime.now(UTC) - timedelta(days=self._config.retention_days)
+        cutoff = datetime.now(UTC) - self._retention
         deleted = await self._store.delete_before(cutoff)
 
         if deleted > 0:
@@ -88,5 +112,5 @@ class RetentionManager:
         Returns:
             Number of records deleted
         """
-        cutoff = datetime.now(UTC) - timedelta(days=self._config.retention_days)
+        cutoff = datetime.now(UTC) - self._retention
         return await self._store.delete_before(cutoff)
@@ -2,11 +2,16 @@
 
 import asyncio
 import json
+import queue
 import sqlite3
+import zlib
+from collections.abc import Callable
 from concurrent.futures import ThreadPoolExecutor
-from datetime import datetime
+from dataclasses import fields, is_dataclass
+from datetime import date, datetime, timedelta
+from functools import lru_cache
 from pathlib import Path
-from typing import Any
+from typing import Any, TypeVar
 
 from .base import TelemetryStore
 from .config import RedactionConfig
@@ -23,6 +28,630 @@ from .types import (
     ToolCallSource,
 )
 
+_T = TypeVar("_T")
+
+# Number of pooled read connections.
+READ_POOL_SIZE = 4
+
+# Executions removed per transaction by delete_before.
+DELETE_BATCH_SIZE = 1000
+
+# Payload columns (inputs, outputs, tool params and results) of at least this
+# many bytes of JSON are stored zlib-compressed.
+PAYLOAD_COMPRESS_MIN_SIZE = 256
+PAYLOAD_COMPRESS_LEVEL = 1
+
+# Prepared statements kept per connection (sqlite3 defaults to 128).
+STATEMENT_CACHE_SIZE = 256
+
+
+def _dataclass_fields(value: Any) -> dict[str, Any]:
+    """``json.dumps`` default that encodes dataclasses as their fields.
+
+    Nested dataclasses (e.g. an error's ``cause``) are visited by the encoder
+    in turn, so no intermediate dict tree is built.
+    """
+    if is_dataclass(value) and not isinstance(value, type):
+        if hasattr(value, "__dict__"):
+            return vars(value)
+        return {f.name: getattr(value, f.name) for f in fields(value)}
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+
+def _dumps_record(value: Any) -> str:
+    """Serialize an ``error`` or ``metrics`` column.
+
+    ErrorRecord and ExecutionMetrics dataclasses are encoded directly.
+    """
+    return json.dumps(value, default=_dataclass_fields)
+
+
+def _loads(data: str) -> Any:
+    """Deserialize a JSON column."""
+    return json.loads(data)
+
+
+def _dumps_payload(value: Any) -> str | bytes:
+    """Serialize a payload column, compressing it when that saves space.
+
+    Small payloads stay plain JSON text; larger ones are stored as a zlib
+    BLOB, which the columns' TEXT affinity leaves untouched.
+    """
+    text = json.dumps(value)
+    if len(text) < PAYLOAD_COMPRESS_MIN_SIZE:
+        return text
+    data = text.encode()
+    packed = zlib.compress(data, PAYLOAD_COMPRESS_LEVEL)
+    return packed if len(packed) < len(data) else text
+
+
+def _loads_payload(data: str | bytes) -> Any:
+    """Deserialize a payload column written by ``_dumps_payload``."""
+    if isinstance(data, bytes):
+        return _loads(zlib.decompress(data).decode())
+    return _loads(data)
+
+
+# ─────────────────────────────────────────────────────────────────
+# SQL statements
+# ─────────────────────────────────────────────────────────────────
+#
+# Statements are kept as fixed strings so sqlite3's per-connection
+# statement cache, which is keyed by the exact SQL text, reuses the
+# prepared statement instead of re-parsing it on every call.
+
+_SQL_UPSERT_EXECUTION = """
+    INSERT INTO executions (
+        execution_id, execution_type, workflow_id, workflow_version,
+        tool_name, status, started_at, completed_at, duration_ms,
+        inputs, outputs, error, metrics, source, caller_id,
+        tenant_id, session_id, runner_id, bridge_session_id
+    ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+    ON CONFLICT(execution_id) DO UPDATE SET
+        execution_type = excluded.execution_type,
+        workflow_id = excluded.workflow_id,
+        workflow_version = excluded.workflow_version,
+        tool_name = excluded.tool_name,
+        status = excluded.status,
+        started_at = excluded.started_at,
+        completed_at = excluded.completed_at,
+        duration_ms = excluded.duration_ms,
+        inputs = excluded.inputs,
+        outputs = excluded.outputs,
+        error = excluded.error,
+        metrics = excluded.metrics,
+        source = excluded.source,
+        caller_id = excluded.caller_id,
+        tenant_id = excluded.tenant_id,
+        session_id = excluded.session_id,
+        runner_id = excluded.runner_id,
+        bridge_session_id = excluded.bridge_session_id
+"""
+# Step and tool call upserts skip the write entirely when the stored row
+# already matches, so re-saving a growing execution only touches new rows.
+_SQL_UPSERT_STEP = """
+    INSERT INTO steps (
+        execution_id, step_id, step_type, status, skip_reason,
+        started_at, completed_at, duration_ms, tool_name,
+        tool_params, tool_result, code_hash, error, attempt, max_attempts, position
+    ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+    ON CONFLICT(execution_id, step_id, attempt) DO UPDATE SET
+        step_type = excluded.step_type,
+        status = excluded.status,
+        skip_reason = excluded.skip_reason,
+        started_at = excluded.started_at,
+        completed_at = excluded.completed_at,
+        duration_ms = excluded.duration_ms,
+        tool_name = excluded.tool_name,
+        tool_params = excluded.tool_params,
+        tool_result = excluded.tool_result,
+        code_hash = excluded.code_hash,
+        error = excluded.error,
+        max_attempts = excluded.max_attempts,
+        position = excluded.position
+    WHERE (
+        steps.step_type, steps.status, steps.skip_reason, steps.started_at,
+        steps.completed_at, steps.duration_ms, steps.tool_name, steps.tool_params,
+        steps.tool_result, steps.code_hash, steps.error, steps.max_attempts, steps.position
+    ) IS NOT (
+        excluded.step_type, excluded.status, excluded.skip_reason, excluded.started_at,
+        excluded.completed_at, excluded.duration_ms, excluded.tool_name, excluded.tool_params,
+        excluded.tool_result, excluded.code_hash, excluded.error, excluded.max_attempts,
+        excluded.position
+    )
+"""
+_SQL_UPSERT_TOOL_CALL = """
+    INSERT INTO tool_calls (
+        execution_id, step_id, call_id, tool_name,
+        started_at, completed_at, duration_ms,
+        params, result, error, source, sequence
+    ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+    ON CONFLICT(execution_id, step_id, call_id) DO UPDATE SET
+        tool_name = excluded.tool_name,
+        started_at = excluded.started_at,
+        completed_at = excluded.completed_at,
+        duration_ms = excluded.duration_ms,
+        params = excluded.params,
+        result = excluded.result,
+        error = excluded.error,
+        source = excluded.source,
+        sequence = excluded.sequence
+    WHERE (
+        tool_calls.tool_name, tool_calls.started_at, tool_calls.completed_at,
+        tool_calls.duration_ms, tool_calls.params, tool_calls.result,
+        tool_calls.error, tool_calls.source, tool_calls.sequence
+    ) IS NOT (
+        excluded.tool_name, excluded.started_at, excluded.completed_at,
+        excluded.duration_ms, excluded.params, excluded.result,
+        excluded.error, excluded.source, excluded.sequence
+    )
+"""
+_SQL_SELECT_STEP_KEYS = "SELECT step_id, attempt FROM steps WHERE execution_id = ?"
+_SQL_SELECT_TOOL_CALL_KEYS = "SELECT step_id, call_id FROM tool_calls WHERE execution_id = ?"
+_SQL_DELETE_STEP = "DELETE FROM steps WHERE execution_id = ? AND step_id = ? AND attempt = ?"
+_SQL_DELETE_TOOL_CALL = (
+    "DELETE FROM tool_calls WHERE execution_id = ? AND step_id = ? AND call_id = ?"
+)
+_SQL_SELECT_EXECUTION = "SELECT * FROM executions WHERE execution_id = ?"
+# Steps with their tool calls, one row per (step, call); tool call columns
+# are prefixed with ``tc_`` and are NULL for steps without calls.
+_SQL_SELECT_STEPS_WITH_CALLS = """
+    SELECT s.*,
+           tc.call_id AS tc_call_id, tc.tool_name AS tc_tool_name,
+           tc.started_at AS tc_started_at, tc.completed_at AS tc_completed_at,
+           tc.duration_ms AS tc_duration_ms, tc.params AS tc_params,
+           tc.result AS tc_result, tc.error AS tc_error, tc.source AS tc_source,
+           tc.sequence AS tc_sequence
+    FROM steps s
+    LEFT JOIN tool_calls tc ON tc.execution_id = s.execution_id AND tc.step_id = s.step_id
+    WHERE s.execution_id = ?
+    ORDER BY s.position, tc.sequence
+"""
+_SQL_DELETE_EXECUTION = "DELETE FROM executions WHERE execution_id = ?"
+_SQL_DELETE_BEFORE_BATCH = """
+    DELETE FROM executions WHERE rowid IN (
+        SELECT rowid FROM executions WHERE started_at < ? ORDER BY started_at LIMIT ?
+    )
+"""
+_SQL_EARLIEST = "SELECT MIN(started_at) FROM executions"
+
+# Enum columns are stored as INTEGER codes. The codes are part of the on-disk
+# format: new members get new codes, existing codes never change.
+_EXECUTION_TYPE_CODES = {ExecutionType.WORKFLOW: 0, ExecutionType.DIRECT: 1}
+_EXECUTION_STATUS_CODES = {
+    ExecutionStatus.PENDING: 0,
+    ExecutionStatus.RUNNING: 1,
+    ExecutionStatus.COMPLETED: 2,
+    ExecutionStatus.FAILED: 3,
+    ExecutionStatus.CANCELLED: 4,
+}
+_STEP_TYPE_CODES = {StepType.TOOL: 0, StepType.CODE: 1}
+_STEP_STATUS_CODES = {
+    StepStatus.PENDING: 0,
+    StepStatus.RUNNING: 1,
+    StepStatus.COMPLETED: 2,
+    StepStatus.FAILED: 3,
+    StepStatus.SKIPPED: 4,
+}
+_TOOL_CALL_SOURCE_CODES = {ToolCallSource.TOOL_STEP: 0, ToolCallSource.CODE_BLOCK: 1}
+_EXECUTION_TYPES = {c: m for m, c in _EXECUTION_TYPE_CODES.items()}
+_EXECUTION_STATUSES = {c: m for m, c in _EXECUTION_STATUS_CODES.items()}
+_STEP_TYPES = {c: m for m, c in _STEP_TYPE_CODES.items()}
+_STEP_STATUSES = {c: m for m, c in _STEP_STATUS_CODES.items()}
+_TOOL_CALL_SOURCES = {c: m for m, c in _TOOL_CALL_SOURCE_CODES.items()}
+
+
+@lru_cache(maxsize=4096)
+def _isoformat(value: datetime, offset: timedelta | None) -> str:
+    """Cached ``isoformat``.
+
+    The offset is part of the key because datetimes for the same instant in
+    different zones compare (and hash) equal but format differently.
+    """
+    return value.isoformat()
+
+
+def _format_time(value: datetime | None) -> str | None:
+    """Format a timestamp column.
+
+    Re-saving an execution repeats the timestamps of all its earlier steps
+    and tool calls, so most calls are cache hits. (A ``register_adapter``
+    for datetime would still call into Python per bound value, uncached,
+    and would change binding for every sqlite3 user in the process.)
+    """
+    return None if value is None else _isoformat(value, value.utcoffset())
+
+
+_parse_time_cached = lru_cache(maxsize=4096)(datetime.fromisoformat)
+
+
+def _parse_time(value: str | None) -> datetime | None:
+    """Parse a timestamp column (datetimes are immutable, so sharing is safe)."""
+    return _parse_time_cached(value) if value else None
+
+
+def _pack_hash(value: str | None) -> bytes | str | None:
+    """Store a hex digest as its raw bytes, half the size of the hex text.
+
+    Anything that does not round-trip through ``bytes.hex`` (e.g. upper case
+    digits) is stored as given.
+    """
+    if not value:
+        return value
+    try:
+        packed = bytes.fromhex(value)
+    except ValueError:
+        return value
+    return packed if packed.hex() == value else value
+
+
+def _unpack_hash(value: bytes | str | None) -> str | None:
+    """Read a code_hash column, which holds text in rows written before BLOBs."""
+    return value.hex() if isinstance(value, bytes) else value
+
+
+# ─────────────────────────────────────────────────────────────────
+# Schema
+# ─────────────────────────────────────────────────────────────────
+
+# Bumped with each entry in _MIGRATIONS; stored in PRAGMA user_version.
+SCHEMA_VERSION = 2
+
+_TABLES = {
+    "executions": """
+    CREATE TABLE IF NOT EXISTS executions (
+        execution_id TEXT PRIMARY KEY,
+        execution_type INTEGER NOT NULL,
+        workflow_id TEXT,
+        workflow_version TEXT,
+        tool_name TEXT,
+        status INTEGER NOT NULL,
+        started_at TEXT NOT NULL,
+        completed_at TEXT,
+        duration_ms INTEGER,
+        inputs TEXT,
+        outputs TEXT,
+        error TEXT,
+        metrics TEXT,
+        source TEXT,
+        caller_id TEXT,
+        tenant_id TEXT,
+        session_id TEXT,
+        created_at TEXT DEFAULT CURRENT_TIMESTAMP,
+        runner_id TEXT,
+        bridge_session_id TEXT
+    )
+    """,
+    "steps": """
+    CREATE TABLE IF NOT EXISTS steps (
+        execution_id TEXT NOT NULL REFERENCES executions(execution_id) ON DELETE CASCADE,
+        step_id TEXT NOT NULL,
+        step_type INTEGER NOT NULL,
+        status INTEGER NOT NULL,
+        skip_reason TEXT,
+        started_at TEXT,
+        completed_at TEXT,
+        duration_ms INTEGER,
+        tool_name TEXT,
+        tool_params TEXT,
+        tool_result TEXT,
+        code_hash BLOB,
+        error TEXT,
+        attempt INTEGER NOT NULL DEFAULT 1,
+        max_attempts INTEGER DEFAULT 1,
+        position INTEGER NOT NULL,
+        PRIMARY KEY (execution_id, step_id, attempt)
+    ) WITHOUT ROWID
+    """,
+    "tool_calls": """
+    CREATE TABLE IF NOT EXISTS tool_calls (
+        execution_id TEXT NOT NULL REFERENCES executions(execution_id) ON DELETE CASCADE,
+        step_id TEXT NOT NULL,
+        call_id TEXT NOT NULL,
+        tool_name TEXT NOT NULL,
+        started_at TEXT NOT NULL,
+        completed_at TEXT,
+        duration_ms INTEGER,
+        params TEXT,
+        result TEXT,
+        error TEXT,
+        source INTEGER NOT NULL,
+        sequence INTEGER NOT NULL,
+        PRIMARY KEY (execution_id, step_id, call_id)
+    ) WITHOUT ROWID
+    """,
+}
+
+_INDEXES = (
+    # list_executions filters, each ending in started_at so the newest-first
+    # page is read straight off the index
+    """CREATE INDEX IF NOT EXISTS idx_exec_type_status_started
+        ON executions(execution_type, status, started_at DESC)""",
+    "CREATE INDEX IF NOT EXISTS idx_exec_status_started ON executions(status, started_at DESC)",
+    """CREATE INDEX IF NOT EXISTS idx_exec_workflow_started
+        ON executions(workflow_id, started_at DESC)""",
+    "CREATE INDEX IF NOT EXISTS idx_exec_tool_started ON executions(tool_name, started_at DESC)",
+    """CREATE INDEX IF NOT EXISTS idx_exec_caller_started
+        ON executions(caller_id, started_at DESC)""",
+    """CREATE INDEX IF NOT EXISTS idx_exec_session_started
+        ON executions(session_id, started_at DESC)""",
+    "CREATE INDEX IF NOT EXISTS idx_executions_started ON executions(started_at)",
+    # superseded by the composite indexes above
+    "DROP INDEX IF EXISTS idx_executions_type",
+    "DROP INDEX IF EXISTS idx_executions_workflow",
+    "DROP INDEX IF EXISTS idx_executions_status",
+    "DROP INDEX IF EXISTS idx_executions_session",
+    # steps and tool_calls are clustered on their primary keys, which also
+    # serve lookups by execution and step
+    "CREATE INDEX IF NOT EXISTS idx_tool_calls_tool ON tool_calls(tool_name)",
+    "CREATE INDEX IF NOT EXISTS idx_tool_calls_started ON tool_calls(started_at)",
+)
+
+
+def _rebuild_table(conn: sqlite3.Connection, table: str, convert: dict[str, str]) -> None:
+    """Recreate a table from its current definition in ``_TABLES``.
+
+    Columns of the new table that the old one has, or that ``convert``
+    gives an SQL expression over the old row for, are copied over. The
+    table's indexes and triggers are dropped along with the old table and
+    have to be created again afterwards.
+
+    Args:
+        conn: Connection with a transaction open and foreign keys off
+        table: Table name
+        convert: Column -> SQL expression its value is copied from
+    """
+    old_columns = {row[1] for row in conn.execute(f"PRAGMA table_info({table})")}
+    conn.execute(
+        _TABLES[table].replace(
+            f"CREATE TABLE IF NOT EXISTS {table} (", f"CREATE TABLE {table}_new ("
+        )
+    )
+    columns = [
+        row[1]
+        for row in conn.execute(f"PRAGMA table_info({table}_new)")
+        if row[1] in old_columns or row[1] in convert
+    ]
+    conn.execute(
+        f"INSERT INTO {table}_new ({', '.join(columns)}) "
+        f"SELECT {', '.join(convert.get(c, c) for c in columns)} FROM {table}"
+    )
+    conn.execute(f"DROP TABLE {table}")
+    conn.execute(f"ALTER TABLE {table}_new RENAME TO {table}")
+
+
+def _enum_codes(column: str, codes: dict[Any, int]) -> str:
+    """SQL expression mapping a column of enum values to their codes."""
+    cases = " ".join(f"WHEN '{member.value}' THEN {code}" for member, code in codes.items())
+    return f"CASE {column} {cases} END"
+
+
+def _migrate_enum_codes(conn: sqlite3.Connection, tables: set[str]) -> dict[str, dict[str, str]]:
+    """Version 1: enum columns hold INTEGER codes instead of their values."""
+    return {
+        "executions": {
+            "execution_type": _enum_codes("execution_type", _EXECUTION_TYPE_CODES),
+            "status": _enum_codes("status", _EXECUTION_STATUS_CODES),
+        },
+        "steps": {
+            "step_type": _enum_codes("step_type", _STEP_TYPE_CODES),
+            "status": _enum_codes("status", _STEP_STATUS_CODES),
+        },
+        "tool_calls": {"source": _enum_codes("source", _TOOL_CALL_SOURCE_CODES)},
+    }
+
+
+def _migrate_without_rowid(conn: sqlite3.Connection, tables: set[str]) -> dict[str, dict[str, str]]:
+    """Version 2: steps and tool_calls are keyed WITHOUT ROWID tables.
+
+    Steps keep their insertion order in ``position``. Rows the new keys
+    cannot hold are dropped first: rows without an execution and all but
+    the most recently inserted copy of duplicated tool calls. Rows whose
+    execution was deleted are dropped too; earlier versions ran with
+    foreign keys off, so ``ON DELETE CASCADE`` never removed them.
+    """
+    for table in ("steps", "tool_calls"):
+        if table not in tables:
+            continue
+        if "executions" in tables:
+            conn.execute(
+                f"""
+                DELETE FROM {table} WHERE execution_id IS NULL OR NOT EXISTS (
+                    SELECT 1 FROM executions e WHERE e.execution_id = {table}.execution_id
+                )
+            """
+            )
+        else:
+            conn.execute(f"DELETE FROM {table} WHERE execution_id IS NULL")
+    if "tool_calls" in tables:
+        conn.execute(
+            """
+            DELETE FROM tool_calls WHERE id NOT IN (
+                SELECT MAX(id) FROM tool_calls GROUP BY execution_id, step_id, call_id
+            )
+        """
+        )
+    return {
+        "steps": {"attempt": "COALESCE(attempt, 1)", "position": "id"},
+        "tool_calls": {},
+    }
+
+
+# Schema version -> migration that brings the previous version up to it.
+# Migrations get the tables that exist, may clean up their rows in place and
+# return, per table, the columns to convert when the table is rebuilt.
+# Tables are rebuilt once, after all pending migrations ran, so conversions
+# are expressions over the row as it was stored before migrating.
+_MIGRATIONS: dict[int, Callable[[sqlite3.Connection, set[str]], dict[str, dict[str, str]]]] = {
+    1: _migrate_enum_codes,
+    2: _migrate_without_rowid,
+}
+
+
+def _migrate(conn: sqlite3.Connection, version: int, tables: set[str]) -> None:
+    """Bring the existing ``tables`` from schema ``version`` up to ``SCHEMA_VERSION``."""
+    convert: dict[str, dict[str, str]] = {}
+    for target in range(version + 1, SCHEMA_VERSION + 1):
+        for table, columns in _MIGRATIONS[target](conn, tables).items():
+            convert.setdefault(table, {}).update(columns)
+    for table, columns in convert.items():
+        if table in tables:
+            _rebuild_table(conn, table, columns)
+
+
+# list_executions returns summaries: the potentially large inputs/outputs
+# and the metrics blob are neither read from disk nor decoded, and come back
+# empty as they would for a record that never set them.
+_SUMMARY_COLUMNS = """
+    e.execution_id, e.execution_type, e.workflow_id, e.workflow_version, e.tool_name,
+    e.status, e.started_at, e.completed_at, e.duration_ms,
+    NULL AS inputs, NULL AS outputs, e.error, NULL AS metrics,
+    e.source, e.caller_id, e.tenant_id, e.session_id, e.runner_id, e.bridge_session_id
+"""
+
+# Tool call stats are kept per (tool, day) by triggers on tool_calls, where
+# the day is the date prefix of the stored started_at. Stats over a time
+# range sum the whole days inside it and count only the partial first and
+# last days from tool_calls itself.
+_TOOL_CALL_STATS_TABLE = (
+    """
+    CREATE TABLE tool_call_daily_stats (
+        tool_name TEXT NOT NULL,
+        day TEXT NOT NULL,
+        total INTEGER NOT NULL,
+        success INTEGER NOT NULL,
+        error INTEGER NOT NULL,
+        PRIMARY KEY (tool_name, day)
+    ) WITHOUT ROWID
+    """,
+    """
+    INSERT INTO tool_call_daily_stats (tool_name, day, total, success, error)
+    SELECT tool_name, substr(started_at, 1, 10), COUNT(*),
+           SUM(error IS NULL), SUM(error IS NOT NULL)
+    FROM tool_calls
+    GROUP BY tool_name, substr(started_at, 1, 10)
+    """,
+)
+# Triggers are dropped whenever tool_calls is rebuilt, so they are created
+# independently of the table.
+_TOOL_CALL_STATS_TRIGGERS = (
+    """
+    CREATE TRIGGER IF NOT EXISTS trg_tool_calls_stats_insert AFTER INSERT ON tool_calls
+    BEGIN
+        INSERT INTO tool_call_daily_stats (tool_name, day, total, success, error)
+        VALUES (
+            NEW.tool_name, substr(NEW.started_at, 1, 10), 1,
+            NEW.error IS NULL, NEW.error IS NOT NULL
+        )
+        ON CONFLICT (tool_name, day) DO UPDATE SET
+            total = total + 1,
+            success = success + excluded.success,
+            error = error + excluded.error;
+    END
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS trg_tool_calls_stats_delete AFTER DELETE ON tool_calls
+    BEGIN
+        UPDATE tool_call_daily_stats SET
+            total = total - 1,
+            success = success - (OLD.error IS NULL),
+            error = error - (OLD.error IS NOT NULL)
+        WHERE tool_name = OLD.tool_name AND day = substr(OLD.started_at, 1, 10);
+        DELETE FROM tool_call_daily_stats
+        WHERE tool_name = OLD.tool_name AND day = substr(OLD.started_at, 1, 10)
+          AND total <= 0;
+    END
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS trg_tool_calls_stats_update
+    AFTER UPDATE OF tool_name, started_at, error ON tool_calls
+    BEGIN
+        UPDATE tool_call_daily_stats SET
+            total = total - 1,
+            success = success - (OLD.error IS NULL),
+            error = error - (OLD.error IS NOT NULL)
+        WHERE tool_name = OLD.tool_name AND day = substr(OLD.started_at, 1, 10);
+        DELETE FROM tool_call_daily_stats
+        WHERE tool_name = OLD.tool_name AND day = substr(OLD.started_at, 1, 10)
+          AND total <= 0;
+        INSERT INTO tool_call_daily_stats (tool_name, day, total, success, error)
+        VALUES (
+            NEW.tool_name, substr(NEW.started_at, 1, 10), 1,
+            NEW.error IS NULL, NEW.error IS NOT NULL
+        )
+        ON CONFLICT (tool_name, day) DO UPDATE SET
+            total = total + 1,
+            success = success + excluded.success,
+            error = error + excluded.error;
+    END
+    """,
+)
+# Whole days strictly between the optional bounding days.
+_SQL_STATS_DAYS = """
+    SELECT tool_name, SUM(total) AS total, SUM(success) AS success, SUM(error) AS error
+    FROM tool_call_daily_stats
+    WHERE (:lo_day IS NULL OR day > :lo_day) AND (:hi_day IS NULL OR day < :hi_day)
+    GROUP BY tool_name
+"""
+# Raw tool calls in started_at >= ?, < ? (day end) and <= ? (range end).
+_SQL_STATS_RANGE = """
+    SELECT tool_name, COUNT(*) AS total,
+           SUM(error IS NULL) AS success, SUM(error IS NOT NULL) AS error
+    FROM tool_calls
+    WHERE started_at >= ? AND started_at < ? AND started_at <= ?
+    GROUP BY tool_name
+"""
+
+
+def _next_day(day: str) -> str:
+    """The ``YYYY-MM-DD`` day after ``day``, which sorts after every time on ``day``."""
+    return (date.fromisoformat(day) + timedelta(days=1)).isoformat()
+
+
+# Optional list_executions filters, in parameter order.
+_LIST_CONDITIONS = (
+    "execution_type = ?",
+    "workflow_id = ?",
+    "tool_name = ?",
+    "status = ?",
+    "started_at >= ?",
+    "started_at <= ?",
+    "caller_id = ?",
+    "session_id = ?",
+)
+
+
+def _where(conditions: tuple[str, ...], active: tuple[bool, ...]) -> str:
+    """Join the active conditions into a WHERE clause body."""
+    return " AND ".join(c for c, on in zip(conditions, active, strict=True) if on) or "1=1"
+
+
+@lru_cache(maxsize=256)
+def _list_queries(active: tuple[bool, ...]) -> tuple[str, str]:
+    """Build the count and page queries for a combination of active filters.
+
+    The page query picks rowids from a covering index scan first and only
+    then reads the full rows, so rows skipped by OFFSET are never loaded.
+
+    Args:
+        active: One flag per entry in ``_LIST_CONDITIONS``
+
+    Returns:
+        Tuple of (count SQL, page SQL)
+    """
+    where = _where(_LIST_CONDITIONS, active)
+    return (
+        f"SELECT COUNT(*) FROM executions WHERE {where}",
+        f"""
+        SELECT {_SUMMARY_COLUMNS} FROM (
+            SELECT rowid AS rid FROM executions WHERE {where}
+            ORDER BY started_at DESC LIMIT ? OFFSET ?
+        ) AS page
+        JOIN executions e ON e.rowid = page.rid
+        ORDER BY e.started_at DESC
+        """,
+    )
+
 
 class SQLiteTelemetryStore(TelemetryStore):
     """SQLite-based telemetry store.
@@ -43,240 +672,249 @@ class SQLiteTelemetryStore(TelemetryStore):
         """
         self._db_path = db_path
         self._redaction = redaction
+        # All writes go through one connection on one thread; reads borrow a
+        # pooled connection from a worker thread, which WAL lets run
+        # alongside a save.
         self._executor = ThreadPoolExecutor(max_workers=1)
         self._conn: sqlite3.Connection | None = None
+        self._read_pool: queue.SimpleQueue[sqlite3.Connection] = queue.SimpleQueue()
+        self._read_conns: list[sqlite3.Connection] = []
 
         # Ensure directory exists
         Path(db_path).parent.mkdir(parents=True, exist_ok=True)
 
         # Initialize database
         self._init_db()
+        self._init_read_pool()
 
     def _init_db(self) -> None:
         """Initialize SQLite database schema."""
-        self._conn = sqlite3.connect(self._db_path, check_same_thread=False)
+        # Autocommit mode: sqlite3 issues no implicit BEGINs, transactions
+        # are opened explicitly where several statements must be atomic.
+        self._conn = sqlite3.connect(
+            self._db_path,
+            check_same_thread=False,
+            isolation_level=None,
+            cached_statements=STATEMENT_CACHE_SIZE,
+        )
         self._conn.row_factory = sqlite3.Row
+        self._configure_connection(self._conn)
 
-        self._conn.executescript(
-            """
-            CREATE TABLE IF NOT EXISTS executions (
-                execution_id TEXT PRIMARY KEY,
-                execution_type TEXT NOT NULL,
-                workflow_id TEXT,
-                workflow_version TEXT,
-                tool_name TEXT,
-                status TEXT NOT NULL,
-                started_at TEXT NOT NULL,
-                completed_at TEXT,
-                duration_ms INTEGER,
-                inputs TEXT,
-                outputs TEXT,
-                error TEXT,
-                metrics TEXT,
-                source TEXT,
-                caller_id TEXT,
-                tenant_id TEXT,
-                session_id TEXT,
-                created_at TEXT DEFAULT CURRENT_TIMESTAMP
-            );
-
-            CREATE TABLE IF NOT EXISTS steps (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                execution_id TEXT REFERENCES executions(execution_id) ON DELETE CASCADE,
-                step_id TEXT NOT NULL,
-                step_type TEXT NOT NULL,
-                status TEXT NOT NULL,
-                skip_reason TEXT,
-                started_at TEXT,
-                completed_at TEXT,
-                duration_ms INTEGER,
-                tool_name TEXT,
-                tool_params TEXT,
-                tool_result TEXT,
-                code_hash TEXT,
-                error TEXT,
-                attempt INTEGER DEFAULT 1,
-                max_attempts INTEGER DEFAULT 1,
-                UNIQUE(execution_id, step_id, attempt)
-            );
-
-            CREATE TABLE IF NOT EXISTS tool_calls (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                execution_id TEXT REFERENCES executions(execution_id) ON DELETE CASCADE,
-                step_id TEXT NOT NULL,
-                call_id TEXT NOT NULL,
-                tool_name TEXT NOT NULL,
-                started_at TEXT NOT NULL,
-                completed_at TEXT,
-                duration_ms INTEGER,
-                params TEXT,
-                result TEXT,
-                error TEXT,
-                source TEXT NOT NULL,
-                sequence INTEGER NOT NULL
-            );
-
-            CREATE INDEX IF NOT EXISTS idx_executions_type ON executions(execution_type);
-            CREATE INDEX IF NOT EXISTS idx_executions_workflow ON executions(workflow_id);
-            CREATE INDEX IF NOT EXISTS idx_executions_status ON executions(status);
-            CREATE INDEX IF NOT EXISTS idx_executions_started ON executions(started_at);
-            CREATE INDEX IF NOT EXISTS idx_executions_session ON executions(session_id);
-            CREATE INDEX IF NOT EXISTS idx_steps_execution ON steps(execution_id);
-            CREATE INDEX IF NOT EXISTS idx_tool_calls_execution ON tool_calls(execution_id);
-            CREATE INDEX IF NOT EXISTS idx_tool_calls_tool ON tool_calls(tool_name);
+        conn = self._conn
+        # Table rebuilds need foreign keys off, which cannot be toggled
+        # inside a transaction.
+        conn.execute("PRAGMA foreign_keys=OFF")
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            existing = {
+                row[0]
+                for row in conn.execute("SELECT name FROM sqlite_master WHERE type = 'table'")
+            } & _TABLES.keys()
+            version = conn.execute("PRAGMA user_version").fetchone()[0]
+            if existing:
+                # DEC-145: add columns if missing (safe for existing DBs)
+                for col_def in ["runner_id TEXT", "bridge_session_id TEXT"]:
+                    try:
+                        conn.execute(f"ALTER TABLE executions ADD COLUMN {col_def}")
+                    except sqlite3.OperationalError:
+                        pass  # column already exists
+                _migrate(conn, version, existing)
+            for statement in _TABLES.values():
+                conn.execute(statement)
+            for statement in _INDEXES:
+                conn.execute(statement)
+            self._ensure_tool_call_stats(conn)
+            conn.execute(f"PRAGMA user_version = {SCHEMA_VERSION}")
+        except BaseException:
+            conn.execute("ROLLBACK")
+            raise
+        else:
+            conn.execute("COMMIT")
+        finally:
+            conn.execute("PRAGMA foreign_keys=ON")
+
+        # Refresh planner statistics so the composite indexes get picked;
+        # analysis_limit keeps this cheap on large databases.
+        self._conn.execute("PRAGMA analysis_limit=1000")
+        self._conn.execute("ANALYZE")
+
+    def _init_read_pool(self) -> None:
+        """Open the read connections.
+
+        An in-memory database is private to its connection, so reads then
+        share the writer connection and thread instead.
         """
-        )
-        # DEC-145: add columns if missing (safe for existing DBs)
-        for col_def in ["runner_id TEXT", "bridge_session_id TEXT"]:
-            try:
-                self._conn.execute(f"ALTER TABLE executions ADD COLUMN {col_def}")
-            except sqlite3.OperationalError:
-                pass  # column already exists
+        if self._db_path == ":memory:":
+            return
+        for _ in range(READ_POOL_SIZE):
+            conn = sqlite3.connect(
+                self._db_path,
+                check_same_thread=False,
+                isolation_level=None,
+                cached_statements=STATEMENT_CACHE_SIZE,
+            )
+            conn.row_factory = sqlite3.Row
+            self._configure_connection(conn)
+            conn.execute("PRAGMA query_only=ON")
+            self._read_conns.append(conn)
+            self._read_pool.put(conn)
+
+    async def _write(self, func: Callable[..., _T], *args: Any) -> _T:
+        """Run a function on the writer thread."""
+        return await asyncio.get_running_loop().run_in_executor(self._executor, func, *args)
+
+    async def _read(self, func: Callable[..., _T], *args: Any) -> _T:
+        """Run a read query function on a pooled read connection."""
+        if not self._read_conns:
+            return await self._write(func, self._conn, *args)
+        return await asyncio.to_thread(self._with_reader, func, *args)
+
+    def _with_reader(self, func: Callable[..., _T], *args: Any) -> _T:
+        """Borrow a read connection for the duration of ``func``."""
+        conn = self._read_pool.get()
+        try:
+            return func(conn, *args)
+        finally:
+            self._read_pool.put(conn)
+
+    def _ensure_tool_call_stats(self, conn: sqlite3.Connection) -> None:
+        """Create the per-day tool call stats table, its triggers and backfill."""
+        exists = conn.execute(
+            "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'tool_call_daily_stats'"
+        ).fetchone()
+        if not exists:
+            for statement in _TOOL_CALL_STATS_TABLE:
+                conn.execute(statement)
+        for statement in _TOOL_CALL_STATS_TRIGGERS:
+            conn.execute(statement)
+
+    def _configure_connection(self, conn: sqlite3.Connection) -> None:
+        """Apply connection PRAGMAs.
 
-        self._conn.commit()
+        WAL journaling lets readers proceed while a save is in flight, and
+        with WAL ``synchronous=NORMAL`` is durable across application
+        crashes while avoiding an fsync per commit. Foreign keys are enabled
+        so deletes cascade to steps and tool calls.
+        """
+        if self._db_path != ":memory:":
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            conn.execute("PRAGMA mmap_size=10737418240")
+        conn.execute("PRAGMA temp_store=MEMORY")
+        conn.execute("PRAGMA cache_size=-65536")  # 64 MiB
+        conn.execute("PRAGMA busy_timeout=3000")
+        conn.execute("PRAGMA foreign_keys=ON")
 
     async def save_execution(self, record: ExecutionRecord) -> None:
         """Save execution record with steps and tool calls."""
-        loop = asyncio.get_event_loop()
-        await loop.run_in_executor(self._executor, self._save_sync, record)
+        await self._write(self._save_sync, record)
 
     def _save_sync(self, record: ExecutionRecord) -> None:
-        """Synchronous save (runs in thread pool)."""
+        """Synchronous save (runs in thread pool).
+
+        The execution, its steps and its tool calls are written in a single
+        ``BEGIN IMMEDIATE`` transaction, so a save costs one commit however
+        many rows it touches. Steps and tool calls are upserted in place;
+        rows no longer present in the record are deleted.
+        """
         if not self._conn:
             return
-        cursor = self._conn.cursor()
+        step_rows = [
+            self._step_row(record.execution_id, position, step)
+            for position, step in enumerate(record.steps)
+        ]
+        call_rows = [
+            self._tool_call_row(record.execution_id, step.step_id, call)
+            for step in record.steps
+            for call in step.tool_calls
+        ]
 
-        # Upsert execution
-        cursor.execute(
-            """
-            INSERT OR REPLACE INTO executions (
-                execution_id, execution_type, workflow_id, workflow_version,
-                tool_name, status, started_at, completed_at, duration_ms,
-                inputs, outputs, error, metrics, source, caller_id,
-                tenant_id, session_id, runner_id, bridge_session_id
-            ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-        """,
-            (
-                record.execution_id,
-                record.execution_type.value,
-                record.workflow_id,
-                record.workflow_version,
-                record.tool_name,
-                record.status.value,
-                record.started_at.isoformat() if record.started_at else None,
-                record.completed_at.isoformat() if record.completed_at else None,
-                record.duration_ms,
-                json.dumps(record.inputs),
-                json.dumps(record.outputs),
-                json.dumps(self._error_to_dict(record.error)) if record.error else None,
-                json.dumps(self._metrics_to_dict(record.metrics)),
-                record.source,
-                record.caller_id,
-                record.tenant_id,
-                record.session_id,
-                record.runner_id,
-                record.bridge_session_id,
-            ),
-        )
-
-        # Delete existing steps and tool calls (for updates)
-        cursor.execute("DELETE FROM steps WHERE execution_id = ?", (record.execution_id,))
-        cursor.execute("DELETE FROM tool_calls WHERE execution_id = ?", (record.execution_id,))
-
-        # Insert steps
-        for step in record.steps:
+        cursor = self._conn.cursor()
+        cursor.execute("BEGIN IMMEDIATE")
+        try:
+            # Upsert execution
             cursor.execute(
-                """
-                INSERT INTO steps (
-                    execution_id, step_id, step_type, status, skip_reason,
-                    started_at, completed_at, duration_ms, tool_name,
-                    tool_params, tool_result, code_hash, error, attempt, max_attempts
-                ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-            """,
+                _SQL_UPSERT_EXECUTION,
                 (
                     record.execution_id,
-                    step.step_id,
-                    step.step_type.value,
-                    step.status.value,
-                    step.skip_reason,
-                    step.started_at.isoformat() if step.started_at else None,
-                    step.completed_at.isoformat() if step.completed_at else None,
-                    step.duration_ms,
-                    step.tool_name,
-                    json.dumps(step.tool_params) if step.tool_params else None,
-                    json.dumps(step.tool_result) if step.tool_result else None,
-                    step.code_hash,
-                    json.dumps(self._error_to_dict(step.error)) if step.error else None,
-                    step.attempt,
-                    step.max_attempts,
+                    _EXECUTION_TYPE_CODES[record.execution_type],
+                    record.workflow_id,
+                    record.workflow_version,
+                    record.tool_name,
+                    _EXECUTION_STATUS_CODES[record.status],
+                    _format_time(record.started_at),
+                    _format_time(record.completed_at),
+                    record.duration_ms,
+                    _dumps_payload(record.inputs),
+                    _dumps_payload(record.outputs),
+                    _dumps_record(record.error) if record.error else None,
+                    _dumps_record(record.metrics),
+                    record.source,
+                    record.caller_id,
+                    record.tenant_id,
+                    record.session_id,
+                    record.runner_id,
+                    record.bridge_session_id,
                 ),
             )
 
-            # Insert tool calls
-            for call in step.tool_calls:
-                cursor.execute(
-                    """
-                    INSERT INTO tool_calls (
-                        execution_id, step_id, call_id, tool_name,
-                        started_at, completed_at, duration_ms,
-                        params, result, error, source, sequence
-                    ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-                """,
-                    (
-                        record.execution_id,
-                        step.step_id,
-                        call.call_id,
-                        call.tool_name,
-                        call.started_at.isoformat(),
-                        call.completed_at.isoformat() if call.completed_at else None,
-                        call.duration_ms,
-                        json.dumps(call.params) if call.params else None,
-                        json.dumps(call.result) if call.result else None,
-                        (json.dumps(self._error_to_dict(call.error)) if call.error else None),
-                        call.source.value,
-                        call.sequence,
-                    ),
-                )
+            # Drop steps and tool calls removed since the last save
+            stale_steps = {
+                (row[0], row[1])
+                for row in cursor.execute(_SQL_SELECT_STEP_KEYS, (record.execution_id,))
+            }.difference((step.step_id, step.attempt) for step in record.steps)
+            stale_calls = {
+                (row[0], row[1])
+                for row in cursor.execute(_SQL_SELECT_TOOL_CALL_KEYS, (record.execution_id,))
+            }.difference(
+                (step.step_id, call.call_id) for step in record.steps for call in step.tool_calls
+            )
+            cursor.executemany(
+                _SQL_DELETE_STEP, [(record.execution_id, *key) for key in stale_steps]
+            )
+            cursor.executemany(
+                _SQL_DELETE_TOOL_CALL, [(record.execution_id, *key) for key in stale_calls]
+            )
 
-        self._conn.commit()
+            # executemany iterates the rows in C; unpacking a single JSON array
+            # parameter with json_each was measured slower, since every ->>
+            # column extraction re-parses the row's JSON.
+            cursor.executemany(_SQL_UPSERT_STEP, step_rows)
+            cursor.executemany(_SQL_UPSERT_TOOL_CALL, call_rows)
+        except BaseException:
+            cursor.execute("ROLLBACK")
+            raise
+        cursor.execute("COMMIT")
 
     async def get_execution(self, execution_id: str) -> ExecutionRecord | None:
         """Get execution by ID."""
-        loop = asyncio.get_event_loop()
-        return await loop.run_in_executor(self._executor, self._get_sync, execution_id)
+        return await self._read(self._get_sync, execution_id)
 
-    def _get_sync(self, execution_id: str) -> ExecutionRecord | None:
+    def _get_sync(
+        self, conn: sqlite3.Connection | None, execution_id: str
+    ) -> ExecutionRecord | None:
         """Synchronous get."""
-        if not self._conn:
+        if not conn:
             return None
-        cursor = self._conn.cursor()
+        cursor = conn.cursor()
 
         # Get execution
-        row = cursor.execute(
-            "SELECT * FROM executions WHERE execution_id = ?", (execution_id,)
-        ).fetchone()
+        row = cursor.execute(_SQL_SELECT_EXECUTION, (execution_id,)).fetchone()
 
         if not row:
             return None
 
         record = self._row_to_execution(row)
 
-        # Get steps
-        step_rows = cursor.execute(
-            "SELECT * FROM steps WHERE execution_id = ? ORDER BY id", (execution_id,)
-        ).fetchall()
-
-        for step_row in step_rows:
-            step = self._row_to_step(step_row)
-
-            # Get tool calls for step
-            call_rows = cursor.execute(
-                "SELECT * FROM tool_calls WHERE execution_id = ? AND step_id = ? ORDER BY sequence",
-                (execution_id, step.step_id),
-            ).fetchall()
-
-            step.tool_calls = [self._row_to_tool_call(r) for r in call_rows]
-            record.steps.append(step)
+        # Get steps and their tool calls in one query
+        step_key = None
+        for row in cursor.execute(_SQL_SELECT_STEPS_WITH_CALLS, (execution_id,)):
+            if (row["step_id"], row["attempt"]) != step_key:
+                step_key = (row["step_id"], row["attempt"])
+                step = self._row_to_step(row)
+                record.steps.append(step)
+            if row["tc_call_id"] is not None:
+                step.tool_calls.append(self._row_to_tool_call(row))
 
         return record
 
@@ -293,10 +931,12 @@ class SQLiteTelemetryStore(TelemetryStore):
         page: int = 1,
         page_size: int = 20,
     ) -> tuple[list[ExecutionRecord], int]:
-        """List executions with filtering."""
-        loop = asyncio.get_event_loop()
-        return await loop.run_in_executor(
-            self._executor,
+        """List executions with filtering.
+
+        Records are summaries without steps, inputs, outputs or metrics;
+        use ``get_execution`` for the full record.
+        """
+        return await self._read(
             self._list_sync,
             execution_type,
             workflow_id,
@@ -312,6 +952,7 @@ class SQLiteTelemetryStore(TelemetryStore):
 
     def _list_sync(
         self,
+        conn: sqlite3.Connection | None,
         execution_type: ExecutionType | None,
         workflow_id: str | None,
         tool_name: str | None,
@@ -324,162 +965,156 @@ class SQLiteTelemetryStore(TelemetryStore):
         page_size: int,
     ) -> tuple[list[ExecutionRecord], int]:
         """Synchronous list."""
-        if not self._conn:
+        if not conn:
             return [], 0
-        cursor = self._conn.cursor()
+        cursor = conn.cursor()
 
-        # Build query
-        conditions = []
-        params: list[Any] = []
-
-        if execution_type:
-            conditions.append("execution_type = ?")
-            params.append(execution_type.value)
-        if workflow_id:
-            conditions.append("workflow_id = ?")
-            params.append(workflow_id)
-        if tool_name:
-            conditions.append("tool_name = ?")
-            params.append(tool_name)
-        if status:
-            conditions.append("status = ?")
-            params.append(status.value)
-        if since:
-            conditions.append("started_at >= ?")
-            params.append(since.isoformat())
-        if until:
-            conditions.append("started_at <= ?")
-            params.append(until.isoformat())
-        if caller_id:
-            conditions.append("caller_id = ?")
-            params.append(caller_id)
-        if session_id:
-            conditions.append("session_id = ?")
-            params.append(session_id)
-
-        where = " AND ".join(conditions) if conditions else "1=1"
-
-        # Count total
-        count_row = cursor.execute(
-            f"SELECT COUNT(*) FROM executions WHERE {where}", params
-        ).fetchone()
-        total = count_row[0] if count_row else 0
+        # Codes can be 0, so unset filters are None rather than falsy
+        values = (
+            _EXECUTION_TYPE_CODES[execution_type] if execution_type else None,
+            workflow_id or None,
+            tool_name or None,
+            _EXECUTION_STATUS_CODES[status] if status else None,
+            since.isoformat() if since else None,
+            until.isoformat() if until else None,
+            caller_id or None,
+            session_id or None,
+        )
+        params = [v for v in values if v is not None]
+        count_sql, page_sql = _list_queries(tuple(v is not None for v in values))
 
         # Get page
         offset = (page - 1) * page_size
-        rows = cursor.execute(
-            f"SELECT * FROM executions WHERE {where} ORDER BY started_at DESC LIMIT ? OFFSET ?",
-            params + [page_size, offset],
-        ).fetchall()
+        rows = cursor.execute(page_sql, [*params, page_size, offset]).fetchall()
+
+        # A short page that is not past the end already gives the total
+        if len(rows) < page_size and (rows or offset == 0):
+            total = offset + len(rows)
+        else:
+            count_row = cursor.execute(count_sql, params).fetchone()
+            total = count_row[0] if count_row else 0
 
         records = [self._row_to_execution(row) for row in rows]
         return records, total
 
     async def delete_execution(self, execution_id: str) -> bool:
         """Delete an execution."""
-        loop = asyncio.get_event_loop()
-        return await loop.run_in_executor(self._executor, self._delete_sync, execution_id)
+        return await self._write(self._delete_sync, execution_id)
 
     def _delete_sync(self, execution_id: str) -> bool:
         """Synchronous delete."""
         if not self._conn:
             return False
         cursor = self._conn.cursor()
-        cursor.execute("DELETE FROM executions WHERE execution_id = ?", (execution_id,))
-        self._conn.commit()
+        # A single statement (with its cascades) commits atomically on its own
+        cursor.execute(_SQL_DELETE_EXECUTION, (execution_id,))
         return cursor.rowcount > 0
 
     async def delete_before(self, cutoff: datetime) -> int:
-        """Delete executions before cutoff."""
-        loop = asyncio.get_event_loop()
-        return await loop.run_in_executor(self._executor, self._delete_before_sync, cutoff)
+        """Delete executions before cutoff.
 
-    def _delete_before_sync(self, cutoff: datetime) -> int:
-        """Synchronous delete before."""
+        Executions are deleted oldest first in batches of
+        ``DELETE_BATCH_SIZE``, each its own transaction and writer task, so
+        saves queued during a large retention run get in between batches
+        rather than waiting for the whole cascade.
+        """
+        cutoff_str = cutoff.isoformat()
+        total = 0
+        while True:
+            deleted = await self._write(self._delete_batch_sync, cutoff_str)
+            total += deleted
+            if deleted < DELETE_BATCH_SIZE:
+                break
+        if total:
+            await self._write(self._checkpoint_sync)
+        return total
+
+    def _delete_batch_sync(self, cutoff: str) -> int:
+        """Delete up to ``DELETE_BATCH_SIZE`` executions started before cutoff."""
         if not self._conn:
             return 0
         cursor = self._conn.cursor()
-        cursor.execute("DELETE FROM executions WHERE started_at < ?", (cutoff.isoformat(),))
-        self._conn.commit()
+        cursor.execute(_SQL_DELETE_BEFORE_BATCH, (cutoff, DELETE_BATCH_SIZE))
         return cursor.rowcount
 
+    def _checkpoint_sync(self) -> None:
+        """Checkpoint and truncate the WAL after a bulk delete."""
+        if self._conn and self._db_path != ":memory:":
+            self._conn.execute("PRAGMA wal_checkpoint(TRUNCATE)")
+
     async def get_tool_call_stats(
         self,
         since: datetime | None = None,
         until: datetime | None = None,
     ) -> dict[str, dict[str, int]]:
         """Get tool call statistics."""
-        loop = asyncio.get_event_loop()
-        return await loop.run_in_executor(self._executor, self._stats_sync, since, until)
+        return await self._read(self._stats_sync, since, until)
 
     def _stats_sync(
         self,
+        conn: sqlite3.Connection | None,
         since: datetime | None,
         until: datetime | None,
     ) -> dict[str, dict[str, int]]:
         """Synchronous stats."""
-        if not self._conn:
+        if not conn:
             return {}
-        cursor = self._conn.cursor()
+        cursor = conn.cursor()
 
-        conditions = []
-        params: list[Any] = []
-
-        if since:
-            conditions.append("started_at >= ?")
-            params.append(since.isoformat())
-        if until:
-            conditions.append("started_at <= ?")
-            params.append(until.isoformat())
-
-        where = " AND ".join(conditions) if conditions else "1=1"
-
-        rows = cursor.execute(
-            f"""
-            SELECT tool_name,
-                   COUNT(*) as total,
-                   SUM(CASE WHEN error IS NULL THEN 1 ELSE 0 END) as success,
-                   SUM(CASE WHEN error IS NOT NULL THEN 1 ELSE 0 END) as error
-            FROM tool_calls
-            WHERE {where}
-            GROUP BY tool_name
-        """,
-            params,
-        ).fetchall()
-
-        return {
-            row["tool_name"]: {
-                "total": row["total"],
-                "success": row["success"],
-                "error": row["error"],
-            }
-            for row in rows
-        }
+        lo = since.isoformat() if since else None
+        hi = until.isoformat() if until else None
+        lo_day = lo[:10] if lo else None
+        hi_day = hi[:10] if hi else None
+
+        # Partial days at the ends of the range, as (start, day end, range end)
+        edges = []
+        if lo and lo_day:
+            lo_end = _next_day(lo_day)
+            edges.append((lo, lo_end, hi or lo_end))
+        if hi and hi_day and hi_day != lo_day:
+            hi_start = max(lo, hi_day) if lo else hi_day
+            edges.append((hi_start, _next_day(hi_day), hi))
+
+        stats: dict[str, dict[str, int]] = {}
+        for query, params in (
+            (_SQL_STATS_DAYS, [{"lo_day": lo_day, "hi_day": hi_day}]),
+            (_SQL_STATS_RANGE, edges),
+        ):
+            for args in params:
+                for row in cursor.execute(query, args):
+                    entry = stats.setdefault(
+                        row["tool_name"], {"total": 0, "success": 0, "error": 0}
+                    )
+                    entry["total"] += row["total"]
+                    entry["success"] += row["success"]
+                    entry["error"] += row["error"]
+        return stats
+
+    async def get_earliest_started_at(self) -> datetime | None:
+        """Get the start time of the oldest execution."""
+        return await self._read(self._earliest_sync)
+
+    def _earliest_sync(self, conn: sqlite3.Connection | None) -> datetime | None:
+        """Synchronous earliest started_at."""
+        if not conn:
+            return None
+        row = conn.execute(_SQL_EARLIEST).fetchone()
+        return datetime.fromisoformat(row[0]) if row and row[0] else None
 
     async def close(self) -> None:
-        """Close database connection."""
+        """Close database connections."""
         if self._conn:
             self._conn.close()
             self._conn = None
+        for conn in self._read_conns:
+            conn.close()
+        self._read_conns.clear()
         self._executor.shutdown(wait=False)
 
     # ─────────────────────────────────────────────────────────────────
     # Helper methods
     # ─────────────────────────────────────────────────────────────────
 
-    def _error_to_dict(self, error: ErrorRecord) -> dict[str, Any]:
-        """Convert ErrorRecord to dict."""
-        return {
-            "code": error.code,
-            "category": error.category,
-            "message": error.message,
-            "detail": error.detail,
-            "retryable": error.retryable,
-            "step_id": error.step_id,
-            "tool_name": error.tool_name,
-            "cause": self._error_to_dict(error.cause) if error.cause else None,
-        }
-
     def _dict_to_error(self, data: dict[str, Any]) -> ErrorRecord:
         """Convert dict to ErrorRecord."""
         return ErrorRecord(
@@ -493,18 +1128,45 @@ class SQLiteTelemetryStore(TelemetryStore):
             cause=self._dict_to_error(data["cause"]) if data.get("cause") else None,
         )
 
-    def _metrics_to_dict(self, metrics: ExecutionMetrics) -> dict[str, Any]:
-        """Convert ExecutionMetrics to dict."""
-        return {
-            "total_steps": metrics.total_steps,
-            "completed_steps": metrics.completed_steps,
-            "failed_steps": metrics.failed_steps,
-            "skipped_steps": metrics.skipped_steps,
-            "total_tool_calls": metrics.total_tool_calls,
-            "tool_call_breakdown": metrics.tool_call_breakdown,
-            "total_duration_ms": metrics.total_duration_ms,
-            "step_durations_ms": metrics.step_durations_ms,
-        }
+    def _step_row(self, execution_id: str, position: int, step: StepRecord) -> tuple[Any, ...]:
+        """Convert StepRecord to a ``steps`` row."""
+        return (
+            execution_id,
+            step.step_id,
+            _STEP_TYPE_CODES[step.step_type],
+            _STEP_STATUS_CODES[step.status],
+            step.skip_reason,
+            _format_time(step.started_at),
+            _format_time(step.completed_at),
+            step.duration_ms,
+            step.tool_name,
+            _dumps_payload(step.tool_params) if step.tool_params else None,
+            _dumps_payload(step.tool_result) if step.tool_result else None,
+            _pack_hash(step.code_hash),
+            _dumps_record(step.error) if step.error else None,
+            step.attempt,
+            step.max_attempts,
+            position,
+        )
+
+    def _tool_call_row(
+        self, execution_id: str, step_id: str, call: ToolCallRecord
+    ) -> tuple[Any, ...]:
+        """Convert ToolCallRecord to a ``tool_calls`` row."""
+        return (
+            execution_id,
+            step_id,
+            call.call_id,
+            call.tool_name,
+            _format_time(call.started_at),
+            _format_time(call.completed_at),
+            call.duration_ms,
+            _dumps_payload(call.params) if call.params else None,
+            _dumps_payload(call.result) if call.result else None,
+            _dumps_record(call.error) if call.error else None,
+            _TOOL_CALL_SOURCE_CODES[call.source],
+            call.sequence,
+        )
 
     def _dict_to_metrics(self, data: dict[str, Any]) -> ExecutionMetrics:
         """Convert dict to ExecutionMetrics."""
@@ -523,21 +1185,19 @@ class SQLiteTelemetryStore(TelemetryStore):
         """Convert database row to ExecutionRecord."""
         return ExecutionRecord(
             execution_id=row["execution_id"],
-            execution_type=ExecutionType(row["execution_type"]),
+            execution_type=_EXECUTION_TYPES[row["execution_type"]],
             workflow_id=row["workflow_id"],
             workflow_version=row["workflow_version"],
             tool_name=row["tool_name"],
-            status=ExecutionStatus(row["status"]),
-            started_at=(datetime.fromisoformat(row["started_at"]) if row["started_at"] else None),
-            completed_at=(
-                datetime.fromisoformat(row["completed_at"]) if row["completed_at"] else None
-            ),
+            status=_EXECUTION_STATUSES[row["status"]],
+            started_at=_parse_time(row["started_at"]),
+            completed_at=_parse_time(row["completed_at"]),
             duration_ms=row["duration_ms"],
-            inputs=json.loads(row["inputs"]) if row["inputs"] else {},
-            outputs=json.loads(row["outputs"]) if row["outputs"] else {},
-            error=(self._dict_to_error(json.loads(row["error"])) if row["error"] else None),
+            inputs=_loads_payload(row["inputs"]) if row["inputs"] else {},
+            outputs=_loads_payload(row["outputs"]) if row["outputs"] else {},
+            error=(self._dict_to_error(_loads(row["error"])) if row["error"] else None),
             metrics=(
-                self._dict_to_metrics(json.loads(row["metrics"]))
+                self._dict_to_metrics(_loads(row["metrics"]))
                 if row["metrics"]
                 else ExecutionMetrics()
             ),
@@ -553,38 +1213,34 @@ class SQLiteTelemetryStore(TelemetryStore):
         """Convert database row to StepRecord."""
         return StepRecord(
             step_id=row["step_id"],
-            step_type=StepType(row["step_type"]),
-            status=StepStatus(row["status"]),
+            step_type=_STEP_TYPES[row["step_type"]],
+            status=_STEP_STATUSES[row["status"]],
             skip_reason=row["skip_reason"],
-            started_at=(datetime.fromisoformat(row["started_at"]) if row["started_at"] else None),
-            completed_at=(
-                datetime.fromisoformat(row["completed_at"]) if row["completed_at"] else None
-            ),
+            started_at=_parse_time(row["started_at"]),
+            completed_at=_parse_time(row["completed_at"]),
             duration_ms=row["duration_ms"],
             tool_name=row["tool_name"],
-            tool_params=json.loads(row["tool_params"]) if row["tool_params"] else None,
-            tool_result=json.loads(row["tool_result"]) if row["tool_result"] else None,
-            code_hash=row["code_hash"],
-            error=(self._dict_to_error(json.loads(row["error"])) if row["error"] else None),
+            tool_params=_loads_payload(row["tool_params"]) if row["tool_params"] else None,
+            tool_result=_loads_payload(row["tool_result"]) if row["tool_result"] else None,
+            code_hash=_unpack_hash(row["code_hash"]),
+            error=(self._dict_to_error(_loads(row["error"])) if row["error"] else None),
             attempt=row["attempt"],
             max_attempts=row["max_attempts"],
         )
 
     def _row_to_tool_call(self, row: sqlite3.Row) -> ToolCallRecord:
-        """Convert database row to ToolCallRecord."""
+        """Convert a joined step/tool call row to ToolCallRecord."""
         return ToolCallRecord(
-            call_id=row["call_id"],
-            tool_name=row["tool_name"],
-            started_at=datetime.fromisoformat(row["started_at"]),
-            completed_at=(
-                datetime.fromisoformat(row["completed_at"]) if row["completed_at"] else None
-            ),
-            duration_ms=row["duration_ms"],
-            params=json.loads(row["params"]) if row["params"] else None,
-            result=json.loads(row["result"]) if row["result"] else None,
-            error=(self._dict_to_error(json.loads(row["error"])) if row["error"] else None),
+            call_id=row["tc_call_id"],
+            tool_name=row["tc_tool_name"],
+            started_at=_parse_time_cached(row["tc_started_at"]),
+            completed_at=_parse_time(row["tc_completed_at"]),
+            duration_ms=row["tc_duration_ms"],
+            params=_loads_payload(row["tc_params"]) if row["tc_params"] else None,
+            result=_loads_payload(row["tc_result"]) if row["tc_result"] else None,
+            error=(self._dict_to_error(_loads(row["tc_error"])) if row["tc_error"] else None),
             execution_id=row["execution_id"],
             step_id=row["step_id"],
-            source=ToolCallSource(row["source"]),
-            sequence=row["sequence"],
+            source=_TOOL_CALL_SOURCES[row["tc_source"]],
+            sequence=row["tc_sequence"],
         )
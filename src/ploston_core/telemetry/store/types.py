@@ -55,8 +55,33 @@ class ToolCallSource(str, Enum):
 # Records
 # ─────────────────────────────────────────────────────────────────
 
+_PRIMITIVES = (str, int, float, bool, type(None))
 
-@dataclass
+
+def _to_plain(value: Any) -> Any:
+    """Convert a record field to a JSON-friendly value.
+
+    Enums become their values, datetimes ISO strings and nested records
+    their ``to_dict()``. Payload dicts are shared, not copied.
+    """
+    if type(value) in _PRIMITIVES:
+        return value
+    if isinstance(value, Enum):
+        return value.value
+    if isinstance(value, datetime):
+        return value.isoformat()
+    if isinstance(value, list):
+        return [_to_plain(item) for item in value]
+    to_dict = getattr(value, "to_dict", None)
+    return to_dict() if to_dict is not None else value
+
+
+def _record_to_dict(record: Any) -> dict[str, Any]:
+    """Convert a record to a dict without the deep copies of ``asdict``."""
+    return {name: _to_plain(getattr(record, name)) for name in record.__dataclass_fields__}
+
+
+@dataclass(slots=True)
 class ErrorRecord:
     """Error information."""
 
@@ -69,8 +94,12 @@ class ErrorRecord:
     tool_name: str | None = None
     cause: Optional["ErrorRecord"] = None  # Cause chain (max depth 3)
 
+    def to_dict(self) -> dict[str, Any]:
+        """Convert to a JSON-friendly dict."""
+        return _record_to_dict(self)
 
-@dataclass
+
+@dataclass(slots=True)
 class ToolCallRecord:
     """Individual tool call within a step."""
 
@@ -87,8 +116,12 @@ class ToolCallRecord:
     source: ToolCallSource = ToolCallSource.TOOL_STEP
     sequence: int = 0  # Order within step
 
+    def to_dict(self) -> dict[str, Any]:
+        """Convert to a JSON-friendly dict."""
+        return _record_to_dict(self)
+
 
-@dataclass
+@dataclass(slots=True)
 class StepRecord:
     """Workflow step execution."""
 
@@ -118,8 +151,12 @@ class StepRecord:
     attempt: int = 1
     max_attempts: int = 1
 
+    def to_dict(self) -> dict[str, Any]:
+        """Convert to a JSON-friendly dict."""
+        return _record_to_dict(self)
+
 
-@dataclass
+@dataclass(slots=True)
 class ExecutionMetrics:
     """Aggregated execution metrics."""
 
@@ -132,8 +169,12 @@ class ExecutionMetrics:
     total_duration_ms: int = 0
     step_durations_ms: dict[str, int] = field(default_factory=dict)
 
+    def to_dict(self) -> dict[str, Any]:
+        """Convert to a JSON-friendly dict."""
+        return _record_to_dict(self)
 
-@dataclass
+
+@dataclass(slots=True)
 class ExecutionRecord:
     """Complete execution record."""
 
@@ -179,5 +220,9 @@ class ExecutionRecord:
     # Metrics
     metrics: ExecutionMetrics = field(default_factory=ExecutionMetrics)
 
-    # Logs (in-memory only, not persisted to DB)
-    logs: list[dict[str, Any]] = field(default_factory=list)
+    # Logs (in-memory only, not persisted to DB); None until logs are attached
+    logs: list[dict[str, Any]] | None = None
+
+    def to_dict(self) -> dict[str, Any]:
+        """Convert to a JSON-friendly dict."""
+        return _record_to_dict(self)
@@ -11,7 +11,10 @@ The estimation model is based on typical LLM context patterns:
 """
 
 import json
+from collections import Counter
+from collections.abc import Mapping
 from dataclasses import dataclass, field
+from functools import lru_cache
 from typing import TYPE_CHECKING
 
 from opentelemetry import metrics
@@ -20,6 +23,22 @@ if TYPE_CHECKING:
     from ploston_core.engine import ExecutionResult
 
 
+# json.dumps builds a new encoder per call whenever an option such as
+# ``default`` is passed; this one is built once.
+_encode_output = json.JSONEncoder(default=str).encode
+
+
+@lru_cache(maxsize=1024)
+def _metric_attributes(workflow_name: str, model: str | None = None) -> Mapping[str, str]:
+    """Metric attributes for a workflow (and model), shared across emissions.
+
+    Workflow and model names are few, so each attribute set is built once.
+    """
+    if model is None:
+        return {"workflow_name": workflow_name}
+    return {"workflow_name": workflow_name, "model": model}
+
+
 # Default pricing per million tokens (USD)
 DEFAULT_PRICING: dict[str, dict[str, float]] = {
     "claude_sonnet": {"input": 3.0, "output": 15.0},
@@ -62,6 +81,16 @@ class TokenSavingsResult:
     savings_percentage: float  # Percentage saved
     cost_saved_usd: float  # Estimated cost saved
 
+    def to_dict(self) -> dict[str, int | float]:
+        """Convert to a dict."""
+        return {
+            "raw_mcp_tokens": self.raw_mcp_tokens,
+            "ploston_tokens": self.ploston_tokens,
+            "tokens_saved": self.tokens_saved,
+            "savings_percentage": self.savings_percentage,
+            "cost_saved_usd": self.cost_saved_usd,
+        }
+
 
 class TokenEstimator:
     """Estimate token savings from using Ploston workflows.
@@ -85,30 +114,43 @@ class TokenEstimator:
         """
         self._config = config or TokenEstimationConfig()
         self._meter = meter
+
+        # Running totals behind the observable counters, read at collection
+        self._tokens_saved: Counter[str] = Counter()  # workflow_name -> tokens
+        self._cost_saved_cents: Counter[tuple[str, str]] = Counter()  # (workflow, model)
+        self._raw_mcp_estimate: Counter[str] = Counter()  # workflow_name -> tokens
+
         self._setup_metrics()
 
     def _setup_metrics(self) -> None:
-        """Set up Prometheus metrics."""
+        """Set up Prometheus metrics.
+
+        The counters are observable: executions only bump in-process totals,
+        which the SDK reads once per collection instead of on every execution.
+        """
         if not self._meter:
             return
 
         # Counter: Total tokens saved
-        self._tokens_saved_total = self._meter.create_counter(
+        self._tokens_saved_total = self._meter.create_observable_counter(
             name="ploston_tokens_saved_total",
+            callbacks=[self._tokens_saved_callback],
             description="Total estimated tokens saved by using Ploston workflows",
             unit="1",
         )
 
         # Counter: Total cost saved (in cents for precision)
-        self._cost_saved_cents_total = self._meter.create_counter(
+        self._cost_saved_cents_total = self._meter.create_observable_counter(
             name="ploston_cost_saved_cents_total",
+            callbacks=[self._cost_saved_callback],
             description="Total estimated cost saved in cents",
             unit="1",
         )
 
         # Counter: Raw MCP estimate (for calculating savings rate)
-        self._raw_mcp_estimate_total = self._meter.create_counter(
+        self._raw_mcp_estimate_total = self._meter.create_observable_counter(
             name="ploston_raw_mcp_estimate_total",
+            callbacks=[self._raw_mcp_estimate_callback],
             description="Estimated tokens if using raw MCP (for comparison)",
             unit="1",
         )
@@ -120,6 +162,36 @@ class TokenEstimator:
             unit="1",
         )
 
+    def _tokens_saved_callback(
+        self,
+        options: metrics.CallbackOptions,  # noqa: ARG002
+    ) -> list[metrics.Observation]:
+        """Yield total tokens saved per workflow."""
+        return [
+            metrics.Observation(value=total, attributes=_metric_attributes(workflow_name))
+            for workflow_name, total in list(self._tokens_saved.items())
+        ]
+
+    def _cost_saved_callback(
+        self,
+        options: metrics.CallbackOptions,  # noqa: ARG002
+    ) -> list[metrics.Observation]:
+        """Yield total cost saved in cents per workflow and model."""
+        return [
+            metrics.Observation(value=total, attributes=_metric_attributes(workflow_name, model))
+            for (workflow_name, model), total in list(self._cost_saved_cents.items())
+        ]
+
+    def _raw_mcp_estimate_callback(
+        self,
+        options: metrics.CallbackOptions,  # noqa: ARG002
+    ) -> list[metrics.Observation]:
+        """Yield total raw MCP token estimate per workflow."""
+        return [
+            metrics.Observation(value=total, attributes=_metric_attributes(workflow_name))
+            for workflow_name, total in list(self._raw_mcp_estimate.items())
+        ]
+
     def estimate_raw_mcp_tokens(self, steps: int) -> int:
         """Estimate tokens if agent orchestrated directly via MCP.
 
@@ -134,8 +206,11 @@ class TokenEstimator:
         Returns:
             Estimated token count
         """
-        # Context grows with each step: step 1 adds 500, step 2 adds 1000, etc.
-        context_growth = sum(self._config.tokens_per_step * i for i in range(1, steps + 1))
+        if steps <= 0:
+            return self._config.base_tokens
+        # Context grows with each step: step 1 adds 500, step 2 adds 1000, etc.,
+        # so the total growth is tokens_per_step * (1 + 2 + ... + steps).
+        context_growth = self._config.tokens_per_step * steps * (steps + 1) // 2
         return self._config.base_tokens + context_growth
 
     def estimate_ploston_tokens(self, output_size: int) -> int:
@@ -225,8 +300,7 @@ class TokenEstimator:
             TokenSavingsResult with all savings metrics
         """
         # Calculate output size
-        output_str = json.dumps(execution_result.outputs, default=str)
-        output_size = len(output_str)
+        output_size = len(_encode_output(execution_result.outputs))
 
         # Count steps (completed + failed, not skipped)
         steps = execution_result.steps_completed + execution_result.steps_failed
@@ -239,24 +313,18 @@ class TokenEstimator:
             workflow_name = execution_result.workflow_id
             model_name = model or self._config.default_model
 
-            self._tokens_saved_total.add(
-                savings.tokens_saved,
-                {"workflow_name": workflow_name},
-            )
-
-            self._cost_saved_cents_total.add(
-                int(savings.cost_saved_usd * 100),
-                {"workflow_name": workflow_name, "model": model_name},
-            )
-
-            self._raw_mcp_estimate_total.add(
-                savings.raw_mcp_tokens,
-                {"workflow_name": workflow_name},
-            )
+            # Counters only count up: negative savings are not added, as
+            # Counter.add would reject them
+            cost_saved_cents = int(savings.cost_saved_usd * 100)
+            if savings.tokens_saved >= 0:
+                self._tokens_saved[workflow_name] += savings.tokens_saved
+            if cost_saved_cents >= 0:
+                self._cost_saved_cents[workflow_name, model_name] += cost_saved_cents
+            self._raw_mcp_estimate[workflow_name] += savings.raw_mcp_tokens
 
             self._tokens_saved_per_execution.record(
                 savings.tokens_saved,
-                {"workflow_name": workflow_name},
+                _metric_attributes(workflow_name),
             )
 
         return savings
@@ -0,0 +1,358 @@
+"""Template compilation.
+
+Template strings are static across executions, so each one is parsed once
+into a plan: literal chunks alternating with compiled expressions, whose
+variable paths are pre-split into access steps and whose filters are
+pre-resolved to their functions with pre-parsed arguments. Rendering then
+only walks the plan.
+
+Errors keep their render-time behaviour: an unknown namespace, invalid
+index or unknown filter is recorded at compile time and raised when the
+expression is evaluated, after any earlier lookup failure.
+"""
+
+import sys
+from collections.abc import Callable
+from dataclasses import dataclass, is_dataclass
+from functools import lru_cache
+from operator import attrgetter
+from typing import Any
+
+from ploston_core.errors import create_error
+
+from .filters import FILTERS
+from .parser import ParsedTemplate, parse_template, template_spans
+from .types import TemplateContext
+
+# Namespace root -> getter for its value on a context
+_NAMESPACES: dict[str, Callable[[TemplateContext], Any]] = {
+    "inputs": attrgetter("inputs"),
+    "steps": attrgetter("steps"),
+    "config": attrgetter("config"),
+    "execution_id": attrgetter("execution_id"),  # a scalar: the path is ignored
+    "workflow": lambda context: context.workflow or {},
+}
+
+
+def access_attribute(obj: Any, attr: str) -> Any:
+    """Access an attribute on an object safely.
+
+    Handles dict, dataclass, and regular objects.
+    Prevents returning builtin methods on primitive types.
+
+    Args:
+        obj: Object to access attribute on
+        attr: Attribute name
+
+    Returns:
+        Attribute value
+
+    Raises:
+        KeyError: If attribute doesn't exist or is a builtin method
+    """
+    # Dict: use key access
+    if isinstance(obj, dict):
+        if attr not in obj:
+            raise KeyError(f"Key '{attr}' not found in dict")
+        return obj[attr]
+
+    # Dataclass: use getattr for defined fields
+    if is_dataclass(obj):
+        if hasattr(obj, attr):
+            return getattr(obj, attr)
+        raise KeyError(f"Attribute '{attr}' not found on {type(obj).__name__}")
+
+    # Regular object with __dict__ (custom classes)
+    if hasattr(obj, "__dict__") and attr in obj.__dict__:
+        return getattr(obj, attr)
+
+    # Check if it's a property or defined attribute (not a builtin method)
+    if hasattr(obj, attr):
+        value = getattr(obj, attr)
+        # Reject builtin methods (like str.count, list.append, etc.)
+        if callable(value) and not hasattr(value, "__self__"):
+            # It's a function, not a bound method - allow it
+            return value
+        if callable(value) and isinstance(getattr(type(obj), attr, None), (property, type(None))):
+            # It's a property or doesn't exist on the type - allow it
+            return value
+        if callable(value):
+            # It's a method on a builtin type - reject it
+            raise KeyError(
+                f"Cannot access method '{attr}' on {type(obj).__name__}. "
+                f"Template variables must be data attributes, not methods."
+            )
+        return value
+
+    raise KeyError(f"Attribute '{attr}' not found on {type(obj).__name__}")
+
+
+def parse_filter_arg(arg_str: str) -> Any:
+    """Parse a filter argument.
+
+    Args:
+        arg_str: Argument string
+
+    Returns:
+        Parsed value (str, int, float, or bool)
+    """
+    arg_str = arg_str.strip()
+
+    # String literal
+    if (arg_str.startswith("'") and arg_str.endswith("'")) or (
+        arg_str.startswith('"') and arg_str.endswith('"')
+    ):
+        return arg_str[1:-1]
+
+    # Boolean
+    if arg_str == "true":
+        return True
+    if arg_str == "false":
+        return False
+
+    # Number
+    try:
+        if "." in arg_str:
+            return float(arg_str)
+        return int(arg_str)
+    except ValueError:
+        # Return as string if can't parse
+        return arg_str
+
+
+@dataclass(slots=True, frozen=True)
+class PathStep:
+    """One access in a variable path: ``index`` into a list or tuple if set,
+    else ``key`` on a dict or object."""
+
+    key: str
+    index: int | None = None
+
+
+@dataclass(slots=True, frozen=True)
+class FilterOp:
+    """A filter with its function and arguments resolved."""
+
+    name: str
+    func: Callable[..., Any] | None  # None for an unknown filter
+    args: tuple[Any, ...] = ()
+    malformed: bool = False  # "name(" without a closing parenthesis
+
+    def apply(self, value: Any) -> Any:
+        """Apply the filter to a value.
+
+        Raises:
+            AELError(TEMPLATE_ERROR) if filter is unknown
+        """
+        if self.malformed:
+            raise ValueError("substring not found")
+        if self.func is None:
+            raise create_error(
+                "TEMPLATE_ERROR",
+                filter_name=self.name,
+                supported_filters=", ".join(FILTERS.keys()),
+            )
+        return self.func(value, *self.args)
+
+
+@dataclass(slots=True, frozen=True)
+class CompiledExpression:
+    """A ``{{ }}`` expression: a variable path followed by filters.
+
+    ``getter`` fetches the root namespace from a context; it is None for an
+    unknown namespace. ``path_error`` is the KeyError message for an invalid
+    index, raised once the steps before it have resolved.
+    """
+
+    expression: str
+    variable: str
+    root: str
+    path: tuple[PathStep, ...]
+    filters: tuple[FilterOp, ...]
+    getter: Callable[[TemplateContext], Any] | None = None
+    path_error: str | None = None
+
+    def evaluate(self, context: TemplateContext) -> Any:
+        """Evaluate the expression.
+
+        Raises:
+            AELError(TEMPLATE_ERROR) on evaluation errors
+        """
+        try:
+            value = self.resolve(context)
+        except (KeyError, AttributeError, IndexError) as e:
+            err = create_error(
+                "TEMPLATE_ERROR",
+                variable=self.variable,
+            )
+            # S-292 P4d: stash the failing variable + full expression on
+            # the exception so the engine can build a structured
+            # error_metadata block (template_expression, available_steps,
+            # suggested_fix). AELError is a frozen dataclass so we use a
+            # plain attribute on the underlying Exception instance.
+            err._template_variable = self.variable  # type: ignore[attr-defined]
+            err._template_expression = self.expression  # type: ignore[attr-defined]
+            raise err from e
+
+        for op in self.filters:
+            value = op.apply(value)
+        return value
+
+    def resolve(self, context: TemplateContext) -> Any:
+        """Resolve the variable path against a context.
+
+        Raises:
+            KeyError, AttributeError, IndexError if path is invalid
+        """
+        if self.getter is None:
+            raise KeyError(f"Unknown namespace: {self.root}")
+        current = self.getter(context)
+
+        for step in self.path:
+            if step.index is not None:
+                # Index into list/tuple
+                if isinstance(current, list | tuple):
+                    current = current[step.index]
+                else:
+                    raise TypeError(f"Cannot index {type(current)} with integer")
+            elif type(current) is dict:
+                # Plain dicts (inputs, config and most step outputs) are
+                # looked up directly
+                try:
+                    current = current[step.key]
+                except KeyError:
+                    raise KeyError(f"Key '{step.key}' not found in dict") from None
+            else:
+                # Regular attribute/key access
+                current = access_attribute(current, step.key)
+        if self.path_error is not None:
+            raise KeyError(self.path_error)
+        return current
+
+
+@dataclass(slots=True, frozen=True)
+class CompiledTemplate:
+    """A template string as literal chunks around compiled expressions.
+
+    ``literals`` has one more entry than ``slots``, which index into the
+    distinct ``expressions`` (in order of first use), so an expression used
+    several times in one string is evaluated once per render. A pure
+    template renders to its single expression's value, preserving its type.
+    ``parsed`` carries the string's templates and syntax errors.
+    """
+
+    literals: tuple[str, ...]
+    expressions: tuple[CompiledExpression, ...]
+    slots: tuple[int, ...]
+    parsed: ParsedTemplate
+
+    def render(self, context: TemplateContext) -> Any:
+        """Render the template against a context.
+
+        Raises:
+            AELError(TEMPLATE_ERROR) on rendering errors
+        """
+        if self.parsed.is_pure:
+            return self.expressions[0].evaluate(context)
+
+        # Convert to string for interpolation
+        values = [
+            "" if value is None else str(value)
+            for value in (expression.evaluate(context) for expression in self.expressions)
+        ]
+        chunks = [self.literals[0]]
+        for slot, literal in zip(self.slots, self.literals[1:], strict=True):
+            chunks.append(values[slot])
+            chunks.append(literal)
+        return "".join(chunks)
+
+
+def _compile_path(parts: list[str]) -> tuple[tuple[PathStep, ...], str | None]:
+    """Compile the dot-separated parts of a variable path after its root.
+
+    An indexed part such as ``items[0]`` becomes a key step (unless the key
+    is empty) followed by an index step. Compilation stops at an invalid
+    index, whose error message is returned alongside the steps before it.
+    Keys are interned: equal keys across templates share one string, and a
+    lookup in a dict whose key is that same object skips the string compare.
+    """
+    path: list[PathStep] = []
+    for part in parts:
+        if "[" in part and "]" in part:
+            key = part[: part.index("[")]
+            index_str = part[part.index("[") + 1 : part.index("]")]
+            try:
+                index = int(index_str)
+            except ValueError:
+                return tuple(path), f"Invalid array index: {index_str}"
+            if key:
+                path.append(PathStep(sys.intern(key)))
+            path.append(PathStep("", index))
+        else:
+            path.append(PathStep(sys.intern(part)))
+    return tuple(path), None
+
+
+def compile_filter(filter_expr: str) -> FilterOp:
+    """Compile a filter expression such as ``default(0)`` or ``length``."""
+    if "(" in filter_expr:
+        filter_name = filter_expr[: filter_expr.index("(")].strip()
+        if ")" not in filter_expr:
+            return FilterOp(filter_name, None, malformed=True)
+        args_str = filter_expr[filter_expr.index("(") + 1 : filter_expr.rindex(")")].strip()
+        # Simple arg parsing (just handle single values for now)
+        args = (parse_filter_arg(args_str),) if args_str else ()
+    else:
+        filter_name = filter_expr.strip()
+        args = ()
+    return FilterOp(filter_name, FILTERS.get(filter_name), args)
+
+
+@lru_cache(maxsize=4096)
+def compile_expression(expression: str) -> CompiledExpression:
+    """Compile a template expression (without ``{{ }}``).
+
+    Args:
+        expression: Expression such as ``inputs.items | length``
+
+    Returns:
+        CompiledExpression for the expression
+    """
+    parts = [p.strip() for p in expression.split("|")]
+    variable = parts[0]
+    root, *rest = variable.split(".")
+    getter = _NAMESPACES.get(root)
+    if getter is None or root == "execution_id":
+        rest = []
+    path, path_error = _compile_path(rest)
+    filters = tuple(compile_filter(f) for f in parts[1:])
+    return CompiledExpression(expression, variable, root, path, filters, getter, path_error)
+
+
+@lru_cache(maxsize=4096)
+def compile_template(text: str) -> CompiledTemplate:
+    """Compile a template string into a render plan.
+
+    Args:
+        text: String with {{ }} templates
+
+    Returns:
+        CompiledTemplate for the string
+    """
+    parsed = parse_template(text)
+    slot_of: dict[str, int] = {}  # expression -> slot, in order of first use
+    slots = tuple(slot_of.setdefault(t, len(slot_of)) for t in parsed.templates)
+    # Literal chunks between (and around) the templates
+    chunks: list[str] = []
+    end = 0
+    for start, next_end in template_spans(text):
+        chunks.append(text[end:start])
+        end = next_end
+    chunks.append(text[end:])
+    literals = tuple(chunks)
+    return CompiledTemplate(
+        literals,
+        tuple(compile_expression(expression) for expression in slot_of),
+        slots,
+        parsed,
+    )
@@ -1,5 +1,6 @@
 """Template context builder."""
 
+from dataclasses import replace
 from typing import Any
 
 from ploston_core.types import StepOutput
@@ -61,7 +62,7 @@ class ContextBuilder:
         Returns:
             Self for chaining
         """
-        self._context.workflow = workflow
+        self._context = replace(self._context, workflow=workflow)
         return self
 
     def get_context(self) -> TemplateContext:
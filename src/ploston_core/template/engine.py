@@ -1,19 +1,43 @@
 """Template Engine implementation."""
 
+from functools import lru_cache
 from typing import Any
 
 from ploston_core.errors import create_error
 
-from .filters import FILTERS
-from .parser import (
-    extract_all_references,
-    extract_templates,
-    has_templates,
-    is_pure_template,
-    validate_syntax,
+from .compiler import (
+    CompiledTemplate,
+    access_attribute,
+    compile_expression,
+    compile_filter,
+    compile_template,
+    parse_filter_arg,
 )
+from .filters import FILTERS
+from .parser import extract_all_references, has_any_reference
 from .types import RenderResult, TemplateContext
 
+# Exact types rendered unchanged without any further checks.
+_LEAF_TYPES = frozenset({int, float, bool, type(None)})
+
+# Deepest dict/list nesting render() accepts; also stops self-referencing
+# values (e.g. recursive YAML aliases).
+MAX_RENDER_DEPTH = 1000
+_TOO_DEEP = f"Template value nested deeper than {MAX_RENDER_DEPTH} levels"
+
+
+@lru_cache(maxsize=4096)
+def _string_errors(text: str) -> tuple[str, ...]:
+    """Validation errors for one string, cached as unchanged workflows are
+    validated again on every re-register."""
+    compiled = compile_template(text)
+    return compiled.parsed.errors + tuple(
+        f"Unknown filter '{op.name}' in template: {expression.expression}"
+        for expression in compiled.expressions
+        for op in expression.filters
+        if op.func is None and not op.malformed
+    )
+
 
 class TemplateEngine:
     """Render template expressions in workflow values.
@@ -54,44 +78,73 @@ class TemplateEngine:
             references undefined variables
         """
         templates_found: list[str] = []
+        rendered = self._render(template, context, templates_found)
+        return RenderResult(
+            value=rendered,
+            had_templates=len(templates_found) > 0,
+            templates_rendered=templates_found,
+        )
 
-        def render_value(value: Any) -> Any:
-            """Recursively render a value."""
-            if isinstance(value, str):
-                if not has_templates(value):
-                    return value
+    def _render(
+        self,
+        template: Any,
+        context: TemplateContext,
+        templates_found: list[str] | None,
+    ) -> Any:
+        """Render a value, collecting the templates found into
+        ``templates_found`` unless it is None."""
+        # Iterative depth-first walk, children left to right as recursion
+        # would visit them. Each frame renders ``value`` into
+        # ``container[key]``; containers are copied as they are entered.
+        root: list[Any] = [None]
+        stack: list[tuple[Any, Any, Any, int]] = [(root, 0, template, 0)]
+        while stack:
+            container, key, value, depth = stack.pop()
+            value_type = type(value)
+            if value_type in _LEAF_TYPES:
+                # Most common leaves - return as-is without further checks
+                container[key] = value
+
+            elif value_type is str or isinstance(value, str):
+                compiled = self.compile(value)
+                parsed = compiled.parsed
+                if not parsed.has_templates:
+                    container[key] = value
+                    continue
 
                 # Track templates
-                templates = extract_templates(value)
-                templates_found.extend(templates)
+                if templates_found is not None:
+                    templates_found.extend(parsed.templates)
 
                 # Validate syntax
-                errors = validate_syntax(value)
-                if errors:
+                if parsed.errors:
                     raise create_error(
                         "TEMPLATE_ERROR",
-                        detail="; ".join(errors),
+                        detail="; ".join(parsed.errors),
                     )
 
                 # Render
-                return self.render_string(value, context)
-
-            elif isinstance(value, dict):
-                return {k: render_value(v) for k, v in value.items()}
-
-            elif isinstance(value, list):
-                return [render_value(item) for item in value]
+                container[key] = compiled.render(context)
+
+            elif value_type is dict or isinstance(value, dict):
+                if depth >= MAX_RENDER_DEPTH:
+                    raise create_error("TEMPLATE_ERROR", detail=_TOO_DEEP)
+                out: dict[Any, Any] = dict.fromkeys(value)
+                container[key] = out
+                stack.extend((out, k, v, depth + 1) for k, v in reversed(value.items()))
+
+            elif value_type is list or isinstance(value, list):
+                if depth >= MAX_RENDER_DEPTH:
+                    raise create_error("TEMPLATE_ERROR", detail=_TOO_DEEP)
+                items: list[Any] = [None] * len(value)
+                container[key] = items
+                stack.extend((items, i, value[i], depth + 1) for i in reversed(range(len(value))))
 
             else:
-                # Primitive types - return as-is
-                return value
+                # Other types - return as-is
+                container[key] = value
 
-        rendered = render_value(template)
-        return RenderResult(
-            value=rendered,
-            had_templates=len(templates_found) > 0,
-            templates_rendered=templates_found,
-        )
+        return root[0]
 
     def render_string(
         self,
@@ -116,24 +169,7 @@ class TemplateEngine:
         Raises:
             AELError(TEMPLATE_ERROR) on rendering errors
         """
-        # Check if pure template (type preservation)
-        if is_pure_template(template_str):
-            templates = extract_templates(template_str)
-            if templates:
-                return self._evaluate_expression(templates[0], context)
-
-        # Mixed content - string interpolation
-        result = template_str
-        templates = extract_templates(template_str)
-
-        for template in templates:
-            value = self._evaluate_expression(template, context)
-            # Convert to string for interpolation
-            str_value = str(value) if value is not None else ""
-            result = result.replace("{{ " + template + " }}", str_value)
-            result = result.replace("{{" + template + "}}", str_value)
-
-        return result
+        return self.compile(template_str).render(context)
 
     def render_params(
         self,
@@ -151,13 +187,14 @@ class TemplateEngine:
         Returns:
             Rendered params dict
         """
-        result = self.render(params, context)
-        return result.value  # type: ignore
+        # Only the value is needed, so templates are not collected
+        return self._render(params, context, None)  # type: ignore[no-any-return]
 
     def validate(self, template: Any) -> list[str]:
         """Validate template syntax without rendering.
 
-        Returns list of errors (empty if valid).
+        Returns list of errors (empty if valid), including unknown filters,
+        which would otherwise only fail once the template is rendered.
         Does NOT check variable existence.
 
         Args:
@@ -171,7 +208,7 @@ class TemplateEngine:
         def validate_value(value: Any) -> None:
             """Recursively validate a value."""
             if isinstance(value, str):
-                errors.extend(validate_syntax(value))
+                errors.extend(_string_errors(value))
             elif isinstance(value, dict):
                 for v in value.values():
                     validate_value(v)
@@ -197,6 +234,31 @@ class TemplateEngine:
         """
         return extract_all_references(template)
 
+    def has_references(self, template: Any) -> bool:
+        """Check if a value contains any template, without extracting them.
+
+        Args:
+            template: Value to check
+
+        Returns:
+            True if any template is found
+        """
+        return has_any_reference(template)
+
+    def compile(self, template_str: str) -> CompiledTemplate:
+        """Compile a template string into a reusable render plan.
+
+        Plans are cached per string, so each workflow template is parsed
+        once and then rendered against any number of contexts.
+
+        Args:
+            template_str: String with {{ }} templates
+
+        Returns:
+            CompiledTemplate whose ``render(context)`` renders the string
+        """
+        return compile_template(template_str)
+
     def _evaluate_expression(self, expression: str, context: TemplateContext) -> Any:
         """Evaluate a template expression.
 
@@ -210,33 +272,7 @@ class TemplateEngine:
         Raises:
             AELError(TEMPLATE_ERROR) on evaluation errors
         """
-        # Split into variable and filters
-        parts = [p.strip() for p in expression.split("|")]
-        var_path = parts[0]
-        filters = parts[1:] if len(parts) > 1 else []
-
-        # Resolve variable
-        try:
-            value = self._resolve_variable(var_path, context)
-        except (KeyError, AttributeError, IndexError) as e:
-            err = create_error(
-                "TEMPLATE_ERROR",
-                variable=var_path,
-            )
-            # S-292 P4d: stash the failing variable + full expression on
-            # the exception so the engine can build a structured
-            # error_metadata block (template_expression, available_steps,
-            # suggested_fix). AELError is a frozen dataclass so we use a
-            # plain attribute on the underlying Exception instance.
-            err._template_variable = var_path  # type: ignore[attr-defined]
-            err._template_expression = expression  # type: ignore[attr-defined]
-            raise err from e
-
-        # Apply filters
-        for filter_expr in filters:
-            value = self._apply_filter(filter_expr, value)
-
-        return value
+        return compile_expression(expression).evaluate(context)
 
     def _resolve_variable(self, path: str, context: TemplateContext) -> Any:
         """Resolve a variable path like 'inputs.url' or 'steps.fetch.output'.
@@ -251,104 +287,11 @@ class TemplateEngine:
         Raises:
             KeyError, AttributeError, IndexError if path is invalid
         """
-        parts = path.split(".")
-        if not parts:
-            raise KeyError(f"Empty variable path: {path}")
-
-        # Start with root namespace
-        root = parts[0]
-        if root == "inputs":
-            current = context.inputs
-        elif root == "steps":
-            current = context.steps
-        elif root == "config":
-            current = context.config
-        elif root == "execution_id":
-            return context.execution_id
-        elif root == "workflow":
-            current = context.workflow or {}
-        else:
-            raise KeyError(f"Unknown namespace: {root}")
-
-        # Navigate path
-        for part in parts[1:]:
-            # Handle array indexing
-            if "[" in part and "]" in part:
-                key = part[: part.index("[")]
-                index_str = part[part.index("[") + 1 : part.index("]")]
-                try:
-                    index = int(index_str)
-                except ValueError as e:
-                    raise KeyError(f"Invalid array index: {index_str}") from e
-
-                if key:
-                    current = self._access_attribute(current, key)
-                # Index into list/tuple
-                if isinstance(current, list | tuple):
-                    current = current[index]
-                else:
-                    raise TypeError(f"Cannot index {type(current)} with integer")
-            else:
-                # Regular attribute/key access
-                current = self._access_attribute(current, part)
-
-        return current
+        return compile_expression(path).resolve(context)
 
     def _access_attribute(self, obj: Any, attr: str) -> Any:
-        """Access an attribute on an object safely.
-
-        Handles dict, dataclass, and regular objects.
-        Prevents returning builtin methods on primitive types.
-
-        Args:
-            obj: Object to access attribute on
-            attr: Attribute name
-
-        Returns:
-            Attribute value
-
-        Raises:
-            KeyError: If attribute doesn't exist or is a builtin method
-        """
-        from dataclasses import is_dataclass
-
-        # Dict: use key access
-        if isinstance(obj, dict):
-            if attr not in obj:
-                raise KeyError(f"Key '{attr}' not found in dict")
-            return obj[attr]
-
-        # Dataclass: use getattr for defined fields
-        if is_dataclass(obj):
-            if hasattr(obj, attr):
-                return getattr(obj, attr)
-            raise KeyError(f"Attribute '{attr}' not found on {type(obj).__name__}")
-
-        # Regular object with __dict__ (custom classes)
-        if hasattr(obj, "__dict__") and attr in obj.__dict__:
-            return getattr(obj, attr)
-
-        # Check if it's a property or defined attribute (not a builtin method)
-        if hasattr(obj, attr):
-            value = getattr(obj, attr)
-            # Reject builtin methods (like str.count, list.append, etc.)
-            if callable(value) and not hasattr(value, "__self__"):
-                # It's a function, not a bound method - allow it
-                return value
-            if callable(value) and isinstance(
-                getattr(type(obj), attr, None), (property, type(None))
-            ):
-                # It's a property or doesn't exist on the type - allow it
-                return value
-            if callable(value):
-                # It's a method on a builtin type - reject it
-                raise KeyError(
-                    f"Cannot access method '{attr}' on {type(obj).__name__}. "
-                    f"Template variables must be data attributes, not methods."
-                )
-            return value
-
-        raise KeyError(f"Attribute '{attr}' not found on {type(obj).__name__}")
+        """Access an attribute on an object safely (see ``access_attribute``)."""
+        return access_attribute(obj, attr)
 
     def _apply_filter(self, filter_expr: str, value: Any) -> Any:
         """Apply a filter to a value.
@@ -363,26 +306,7 @@ class TemplateEngine:
         Raises:
             AELError(TEMPLATE_ERROR) if filter is unknown
         """
-        # Parse filter name and args
-        if "(" in filter_expr:
-            filter_name = filter_expr[: filter_expr.index("(")].strip()
-            args_str = filter_expr[filter_expr.index("(") + 1 : filter_expr.rindex(")")].strip()
-            # Simple arg parsing (just handle single values for now)
-            args = [self._parse_filter_arg(args_str)] if args_str else []
-        else:
-            filter_name = filter_expr.strip()
-            args = []
-
-        # Get filter function
-        if filter_name not in self._filters:
-            raise create_error(
-                "TEMPLATE_ERROR",
-                filter_name=filter_name,
-                supported_filters=", ".join(self._filters.keys()),
-            )
-
-        filter_func = self._filters[filter_name]
-        return filter_func(value, *args)
+        return compile_filter(filter_expr).apply(value)
 
     def _parse_filter_arg(self, arg_str: str) -> Any:
         """Parse a filter argument.
@@ -393,25 +317,4 @@ class TemplateEngine:
         Returns:
             Parsed value (str, int, float, or bool)
         """
-        arg_str = arg_str.strip()
-
-        # String literal
-        if (arg_str.startswith("'") and arg_str.endswith("'")) or (
-            arg_str.startswith('"') and arg_str.endswith('"')
-        ):
-            return arg_str[1:-1]
-
-        # Boolean
-        if arg_str == "true":
-            return True
-        if arg_str == "false":
-            return False
-
-        # Number
-        try:
-            if "." in arg_str:
-                return float(arg_str)
-            return int(arg_str)
-        except ValueError:
-            # Return as string if can't parse
-            return arg_str
+        return parse_filter_arg(arg_str)
@@ -1,11 +1,94 @@
 """Template parsing utilities."""
 
 import re
-from typing import Any
+import sys
+from collections.abc import Iterator
+from functools import lru_cache
+from typing import Any, NamedTuple
 
-# Regex to find {{ }} expressions
+# Regex to find {{ }} expressions. The parser scans with template_spans(),
+# which finds exactly the same matches in linear time.
 TEMPLATE_PATTERN = re.compile(r"\{\{(.+?)\}\}")
 
+# Control flow keywords as whole words (e.g., "transform" contains "for"
+# but is not control flow)
+CONTROL_FLOW_PATTERN = re.compile(r"\b(?:if|for|while|import)\b")
+
+# A whole (stripped) string that is one template, spaced "{{ x }}" or "{{x}}"
+_PURE_TEMPLATE_PATTERN = re.compile(r"\{\{(?: (?:\S(?:[^\n]*?\S)?)? |\S(?:[^\n]*?\S)?)\}\}")
+
+# Arithmetic operator characters ("**" is caught by "*")
+ARITHMETIC_PATTERN = re.compile(r"[-+*/%]")
+
+# A parenthesis or arithmetic operator, either of which may make a template
+# expression invalid
+_SUSPECT_CHAR_PATTERN = re.compile(r"[-+*/%(]")
+
+
+class ParsedTemplate(NamedTuple):
+    """Everything the engine needs to know about a template string."""
+
+    templates: tuple[str, ...]  # Template expressions (without {{ }})
+    is_pure: bool  # Text is entirely a single template
+    errors: tuple[str, ...]  # Syntax errors (empty if valid)
+
+    @property
+    def has_templates(self) -> bool:
+        """True if the text contains any {{ }} templates."""
+        return bool(self.templates)
+
+
+@lru_cache(maxsize=4096)
+def parse_template(text: str) -> ParsedTemplate:
+    """Scan a template string once for templates, purity and syntax errors.
+
+    Workflow template strings are static across executions, so results are
+    cached per string.
+
+    Args:
+        text: Text to parse
+
+    Returns:
+        ParsedTemplate for the text
+    """
+    templates = tuple(extract_templates(text))
+    stripped = text.strip()
+    is_pure = len(templates) == 1 and stripped in (
+        "{{ " + templates[0] + " }}",
+        "{{" + templates[0] + "}}",
+    )
+    return ParsedTemplate(templates, is_pure, tuple(_template_errors(templates)))
+
+
+def template_spans(text: str) -> Iterator[tuple[int, int]]:
+    """Find the ``(start, end)`` of each {{ }} template in text.
+
+    Yields the same spans as ``TEMPLATE_PATTERN.finditer``, whose lazy
+    ``.+?`` rescans the rest of the line from every ``{{`` that has no
+    closing ``}}`` (quadratic on e.g. ``"{{" * 20000``). Here each start
+    is resolved with two ``str.find`` calls: a start fails only if a
+    newline comes before the next ``}}``, and then so does every other
+    start before that newline.
+
+    Args:
+        text: Text to search
+
+    Yields:
+        Span of each template, including its braces
+    """
+    pos = 0
+    while (start := text.find("{{", pos)) != -1:
+        # The expression is at least one character long
+        close = text.find("}}", start + 3)
+        if close == -1:
+            return
+        newline = text.find("\n", start + 2, close)
+        if newline != -1:
+            pos = newline + 1
+            continue
+        yield start, close + 2
+        pos = close + 2
+
 
 def extract_templates(text: str) -> list[str]:
     """Extract all {{ }} template expressions from text.
@@ -16,7 +99,7 @@ def extract_templates(text: str) -> list[str]:
     Returns:
         List of template expressions (without {{ }})
     """
-    return [match.group(1).strip() for match in TEMPLATE_PATTERN.finditer(text)]
+    return [text[start + 2 : end - 2].strip() for start, end in template_spans(text)]
 
 
 def has_templates(text: str) -> bool:
@@ -28,7 +111,7 @@ def has_templates(text: str) -> bool:
     Returns:
         True if templates found
     """
-    return bool(TEMPLATE_PATTERN.search(text))
+    return next(template_spans(text), None) is not None
 
 
 def is_pure_template(text: str) -> bool:
@@ -43,46 +126,94 @@ def is_pure_template(text: str) -> bool:
         True if text is a single template with no surrounding text
     """
     text = text.strip()
-    if not text.startswith("{{") or not text.endswith("}}"):
-        return False
-
-    # Check if there's only one template and it spans the entire string
-    templates = extract_templates(text)
-    if len(templates) != 1:
+    if _PURE_TEMPLATE_PATTERN.fullmatch(text) is None:
         return False
-
-    # Reconstruct and compare
-    reconstructed = "{{ " + templates[0] + " }}"
-    return text == reconstructed or text == "{{" + templates[0] + "}}"
+    # The template must end at the final "}}", not at an earlier one
+    return "}}" not in text[3:-1]
 
 
 def extract_all_references(value: Any) -> list[str]:
-    """Extract all variable references from a value (recursively).
+    """Extract all variable references from a value, including nested values.
 
     Args:
         value: Value to extract from (can be str, dict, list, or primitive)
 
     Returns:
         List of variable references (e.g., ["inputs.url", "steps.fetch.output"])
+
+    Raises:
+        RecursionError: If nesting exceeds the recursion limit, e.g. for a
+            value that contains itself
     """
     references: list[str] = []
+    max_depth = sys.getrecursionlimit()
+
+    # Iterative walk; children are pushed in reverse so they pop in order
+    stack = [(value, 0)]
+    while stack:
+        item, depth = stack.pop()
+        item_type = type(item)
+        if item_type is str or isinstance(item, str):
+            if "{{" in item:
+                references.extend(_string_references(item))
+            continue
+        if item_type is dict or isinstance(item, dict):
+            children = reversed(item.values())
+        elif item_type is list or isinstance(item, list):
+            children = reversed(item)
+        else:
+            continue
+        if depth >= max_depth:
+            raise RecursionError("Value nested too deeply to extract references")
+        stack.extend((child, depth + 1) for child in children)
 
-    if isinstance(value, str):
-        templates = extract_templates(value)
-        for template in templates:
-            # Extract the variable part (before any filter)
-            var_part = template.split("|")[0].strip()
-            references.append(var_part)
+    return references
 
-    elif isinstance(value, dict):
-        for v in value.values():
-            references.extend(extract_all_references(v))
 
-    elif isinstance(value, list):
-        for item in value:
-            references.extend(extract_all_references(item))
+def has_any_reference(value: Any) -> bool:
+    """Check if a value contains any {{ }} template, including nested values.
 
-    return references
+    Stops at the first template found.
+
+    Args:
+        value: Value to check (can be str, dict, list, or primitive)
+
+    Returns:
+        True if any string in the value contains a template
+
+    Raises:
+        RecursionError: If nesting exceeds the recursion limit, e.g. for a
+            value that contains itself
+    """
+    max_depth = sys.getrecursionlimit()
+    stack = [(value, 0)]
+    while stack:
+        item, depth = stack.pop()
+        item_type = type(item)
+        if item_type is str or isinstance(item, str):
+            if has_templates(item):
+                return True
+            continue
+        if item_type is dict or isinstance(item, dict):
+            children = item.values()
+        elif item_type is list or isinstance(item, list):
+            children = item
+        else:
+            continue
+        if depth >= max_depth:
+            raise RecursionError("Value nested too deeply to check for references")
+        stack.extend((child, depth + 1) for child in children)
+    return False
+
+
+@lru_cache(maxsize=4096)
+def _string_references(text: str) -> tuple[str, ...]:
+    """Variable references in one string, cached as the same template
+    strings recur across steps and validation passes."""
+    # Extract the variable part (before any filter)
+    return tuple(
+        text[start + 2 : end - 2].partition("|")[0].strip() for start, end in template_spans(text)
+    )
 
 
 def validate_syntax(text: str) -> list[str]:
@@ -94,38 +225,45 @@ def validate_syntax(text: str) -> list[str]:
     Returns:
         List of error messages (empty if valid)
     """
-    errors: list[str] = []
+    return _template_errors(extract_templates(text))
+
 
-    templates = extract_templates(text)
+def _template_errors(templates: tuple[str, ...] | list[str]) -> list[str]:
+    """Collect syntax errors for extracted template expressions."""
+    errors: list[str] = []
     for template in templates:
-        # Check for disallowed patterns
-        if "(" in template and ")" in template:
-            # Check if it's a filter call (allowed) or function call (not allowed)
+        # Most expressions are plain paths: a character class scan and
+        # substring checks for the control-flow keywords clear them
+        suspect_char = _SUSPECT_CHAR_PATTERN.search(template)
+        if suspect_char is None:
+            if not (
+                "if" in template or "for" in template or "while" in template or "import" in template
+            ):
+                continue
+        else:
+            # Only a parenthesis or operator can trip these checks
             parts = template.split("|")
-            if len(parts) > 1:
-                # Has filters - check filter syntax
-                for part in parts[1:]:
-                    filter_part = part.strip()
-                    if not filter_part:
-                        errors.append(f"Empty filter in template: {template}")
-            else:
-                # No filters but has parentheses - likely function call
-                if "(" in parts[0]:
-                    errors.append(f"Function calls not supported: {template}")
-
-        # Check for arithmetic operators
-        var_part = template.split("|")[0].strip()
-        if any(op in var_part for op in ["+", "-", "*", "/", "%", "**"]):
-            errors.append(f"Arithmetic expressions not supported: {template}")
-
-        # Check for control flow - use word boundaries to avoid false positives
-        # (e.g., "transform" contains "for" but is not control flow)
-        import re
-
-        for kw in ["if", "for", "while", "import"]:
-            # Match keyword as a whole word (not part of another word)
-            if re.search(rf"\b{kw}\b", template):
-                errors.append(f"Control flow not supported: {template}")
-                break
+
+            # Check for disallowed patterns
+            if "(" in template and ")" in template:
+                # Check if it's a filter call (allowed) or function call (not allowed)
+                if len(parts) > 1:
+                    # Has filters - check filter syntax
+                    for part in parts[1:]:
+                        filter_part = part.strip()
+                        if not filter_part:
+                            errors.append(f"Empty filter in template: {template}")
+                else:
+                    # No filters but has parentheses - likely function call
+                    if "(" in parts[0]:
+                        errors.append(f"Function calls not supported: {template}")
+
+            # Check for arithmetic operators
+            if ARITHMETIC_PATTERN.search(parts[0]):
+                errors.append(f"Arithmetic expressions not supported: {template}")
+
+        # Check for control flow
+        if CONTROL_FLOW_PATTERN.search(template):
+            errors.append(f"Control flow not supported: {template}")
 
     return errors
@@ -6,10 +6,13 @@ from typing import Any
 from ploston_core.types import StepOutput
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class TemplateContext:
     """Context available to templates.
 
+    Frozen so one context can be shared by concurrent renders; the dicts it
+    holds may still grow (e.g. ``steps`` as steps complete).
+
     Access patterns:
     - {{ inputs.url }} → self.inputs["url"]
     - {{ steps.fetch.output }} → self.steps["fetch"].output
@@ -23,7 +26,7 @@ class TemplateContext:
     workflow: dict[str, str] | None = None  # Workflow metadata (name, version, start_time)
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class RenderResult:
     """Result of template rendering."""
 
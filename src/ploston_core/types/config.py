@@ -5,7 +5,7 @@ from dataclasses import dataclass
 from .enums import BackoffType
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class RetryConfig:
     """Retry configuration for steps and tools."""
 
@@ -1,9 +1,9 @@
 """Shared enumerations for AEL."""
 
-from enum import Enum
+from enum import StrEnum
 
 
-class LogLevel(str, Enum):
+class LogLevel(StrEnum):
     """Log verbosity level."""
 
     DEBUG = "DEBUG"
@@ -12,21 +12,21 @@ class LogLevel(str, Enum):
     ERROR = "ERROR"
 
 
-class LogFormat(str, Enum):
+class LogFormat(StrEnum):
     """Log output format."""
 
     COLORED = "colored"
     JSON = "json"
 
 
-class BackoffType(str, Enum):
+class BackoffType(StrEnum):
     """Retry backoff strategy."""
 
     FIXED = "fixed"
     EXPONENTIAL = "exponential"
 
 
-class OnError(str, Enum):
+class OnError(StrEnum):
     """Step error handling strategy."""
 
     FAIL = "fail"
@@ -34,35 +34,35 @@ class OnError(str, Enum):
     RETRY = "retry"
 
 
-class OnMissingTool(str, Enum):
+class OnMissingTool(StrEnum):
     """Behaviour when a step's tool is not registered."""
 
     FAIL = "fail"  # Default: raise TOOL_UNAVAILABLE
     SKIP = "skip"  # Skip the step silently
 
 
-class PackageProfile(str, Enum):
+class PackageProfile(StrEnum):
     """Python sandbox package profile."""
 
     STANDARD = "standard"
     COMMON = "common"
 
 
-class MCPTransport(str, Enum):
+class MCPTransport(StrEnum):
     """MCP connection transport type."""
 
     STDIO = "stdio"
     HTTP = "http"
 
 
-class StepType(str, Enum):
+class StepType(StrEnum):
     """Workflow step type."""
 
     TOOL = "tool"
     CODE = "code"
 
 
-class ExecutionStatus(str, Enum):
+class ExecutionStatus(StrEnum):
     """Workflow execution status."""
 
     PENDING = "pending"
@@ -72,7 +72,7 @@ class ExecutionStatus(str, Enum):
     CANCELLED = "cancelled"
 
 
-class StepStatus(str, Enum):
+class StepStatus(StrEnum):
     """Individual step status."""
 
     PENDING = "pending"
@@ -82,7 +82,7 @@ class StepStatus(str, Enum):
     SKIPPED = "skipped"
 
 
-class ToolSource(str, Enum):
+class ToolSource(StrEnum):
     """Where a tool comes from."""
 
     MCP = "mcp"
@@ -91,7 +91,7 @@ class ToolSource(str, Enum):
     NATIVE = "native"  # Native tools (filesystem, kafka, etc.)
 
 
-class ToolStatus(str, Enum):
+class ToolStatus(StrEnum):
     """Tool availability status."""
 
     AVAILABLE = "available"
@@ -99,7 +99,7 @@ class ToolStatus(str, Enum):
     UNKNOWN = "unknown"
 
 
-class ConnectionStatus(str, Enum):
+class ConnectionStatus(StrEnum):
     """MCP server connection status."""
 
     CONNECTED = "connected"
@@ -4,7 +4,7 @@ from dataclasses import dataclass, field
 from typing import Any, Protocol
 
 
-@dataclass
+@dataclass(slots=True)
 class StepOutput:
     """Output from a completed workflow step.
 
@@ -26,7 +26,7 @@ class StepOutput:
     debug_log: list[str] = field(default_factory=list)  # context.log() entries
 
 
-@dataclass
+@dataclass(slots=True)
 class ToolCallContext:
     """Context for a tool call (for logging/tracing)."""
 
@@ -3,7 +3,7 @@
 from dataclasses import dataclass, field
 
 
-@dataclass
+@dataclass(slots=True)
 class ValidationIssue:
     """Single validation issue (error or warning).
 
@@ -18,7 +18,7 @@ class ValidationIssue:
     line: int | None = None  # Line number in source file (if available)
 
 
-@dataclass
+@dataclass(slots=True)
 class ValidationResult:
     """Result of validation (config or workflow).
 
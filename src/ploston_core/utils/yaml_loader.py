@@ -0,0 +1,14 @@
+"""YAML loader selection.
+
+Usage:
+    from ploston_core.utils.yaml_loader import SafeLoader
+
+    data = yaml.load(text, Loader=SafeLoader)
+"""
+
+try:
+    from yaml import CSafeLoader as SafeLoader
+except ImportError:  # PyYAML built without libyaml
+    from yaml import SafeLoader
+
+__all__ = ["SafeLoader"]
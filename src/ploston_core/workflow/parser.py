@@ -1,5 +1,6 @@
 """YAML workflow parsing."""
 
+from enum import Enum
 from pathlib import Path
 from typing import Any
 
@@ -7,6 +8,7 @@ import yaml
 
 from ploston_core.errors import create_error
 from ploston_core.types import BackoffType, OnError, OnMissingTool, RetryConfig
+from ploston_core.utils.yaml_loader import SafeLoader
 
 from .types import (
     InputDefinition,
@@ -17,6 +19,21 @@ from .types import (
     WorkflowDefinition,
 )
 
+# Value -> member tables for the enums parsed from YAML strings
+_BACKOFF_TYPES = {member.value: member for member in BackoffType}
+_ON_ERRORS = {member.value: member for member in OnError}
+_ON_MISSING_TOOLS = {member.value: member for member in OnMissingTool}
+
+
+def _to_enum[E: Enum](table: dict[Any, E], enum_type: type[E], value: Any) -> E:
+    """Look up an enum member by value, skipping the Enum constructor.
+
+    Other values (including non-strings) still go through
+    ``enum_type(value)``, so an invalid one raises the same ValueError.
+    """
+    member = table.get(value) if isinstance(value, str) else None
+    return member if member is not None else enum_type(value)
+
 
 def parse_workflow_yaml(
     yaml_content: str,
@@ -37,7 +54,7 @@ def parse_workflow_yaml(
         AELError(INPUT_INVALID) if YAML is invalid
     """
     try:
-        data = yaml.safe_load(yaml_content)
+        data = yaml.load(yaml_content, Loader=SafeLoader)
     except yaml.YAMLError as e:
         raise create_error("INPUT_INVALID", detail=f"Invalid YAML: {e}") from e
 
@@ -61,22 +78,20 @@ def parse_workflow_yaml(
             additional=pkg_data.get("additional", []),
         )
 
+    # Equal retry policies share one (frozen) RetryConfig
+    retry_configs: dict[tuple[Any, ...], RetryConfig] = {}
+
     # Parse defaults
     defaults = None
     if "defaults" in data:
         def_data = data["defaults"]
         retry = None
         if "retry" in def_data:
-            retry_data = def_data["retry"]
-            retry = RetryConfig(
-                max_attempts=retry_data.get("max_attempts", 3),
-                backoff=BackoffType(retry_data.get("backoff", "fixed")),
-                delay_seconds=retry_data.get("delay_seconds", 1.0),
-            )
+            retry = _parse_retry(def_data["retry"], retry_configs)
 
         defaults = WorkflowDefaults(
             timeout=def_data.get("timeout", 30),
-            on_error=OnError(def_data.get("on_error", "fail")),
+            on_error=_to_enum(_ON_ERRORS, OnError, def_data.get("on_error", "fail")),
             retry=retry,
             runner=def_data.get("runner"),
         )
@@ -89,15 +104,14 @@ def parse_workflow_yaml(
     for step_data in data.get("steps", []):
         retry = None
         if "retry" in step_data:
-            retry_data = step_data["retry"]
-            retry = RetryConfig(
-                max_attempts=retry_data.get("max_attempts", 3),
-                backoff=BackoffType(retry_data.get("backoff", "fixed")),
-                delay_seconds=retry_data.get("delay_seconds", 1.0),
-            )
+            retry = _parse_retry(step_data["retry"], retry_configs)
 
         on_missing_tool_raw = step_data.get("on_missing_tool")
-        on_missing_tool = OnMissingTool(on_missing_tool_raw) if on_missing_tool_raw else None
+        on_missing_tool = (
+            _to_enum(_ON_MISSING_TOOLS, OnMissingTool, on_missing_tool_raw)
+            if on_missing_tool_raw
+            else None
+        )
 
         step = StepDefinition(
             id=step_data["id"],
@@ -106,7 +120,11 @@ def parse_workflow_yaml(
             mcp=step_data.get("mcp"),
             params=step_data.get("params", {}),
             depends_on=step_data.get("depends_on"),
-            on_error=OnError(step_data["on_error"]) if "on_error" in step_data else None,
+            on_error=(
+                _to_enum(_ON_ERRORS, OnError, step_data["on_error"])
+                if "on_error" in step_data
+                else None
+            ),
             timeout=step_data.get("timeout"),
             retry=retry,
             on_missing_tool=on_missing_tool,
@@ -115,32 +133,33 @@ def parse_workflow_yaml(
         steps.append(step)
 
     # Parse outputs - handle both list and dict formats
-    outputs: list[OutputDefinition] = []
     raw_outputs = data.get("outputs", [])
+    outputs: list[OutputDefinition]
     if isinstance(raw_outputs, dict):
         # Dict format: {output_name: {from: ..., value: ...}}
-        for output_name, output_data in raw_outputs.items():
-            if isinstance(output_data, dict):
-                output = OutputDefinition(
-                    name=output_name,
-                    from_path=output_data.get("from") or output_data.get("from_path"),
-                    value=output_data.get("value"),
-                    description=output_data.get("description"),
-                )
-            else:
-                # Simple value
-                output = OutputDefinition(name=output_name, value=output_data)
-            outputs.append(output)
+        outputs = [
+            OutputDefinition(
+                name=output_name,
+                from_path=output_data.get("from") or output_data.get("from_path"),
+                value=output_data.get("value"),
+                description=output_data.get("description"),
+            )
+            if type(output_data) is dict or isinstance(output_data, dict)
+            # Simple value
+            else OutputDefinition(name=output_name, value=output_data)
+            for output_name, output_data in raw_outputs.items()
+        ]
     else:
         # List format: [{name: ..., from_path: ...}]
-        for output_data in raw_outputs:
-            output = OutputDefinition(
+        outputs = [
+            OutputDefinition(
                 name=output_data["name"],
                 from_path=output_data.get("from_path"),
                 value=output_data.get("value"),
                 description=output_data.get("description"),
             )
-            outputs.append(output)
+            for output_data in raw_outputs
+        ]
 
     return WorkflowDefinition(
         name=workflow_name,
@@ -156,6 +175,33 @@ def parse_workflow_yaml(
     )
 
 
+def _parse_retry(
+    retry_data: dict[str, Any],
+    shared: dict[tuple[Any, ...], RetryConfig],
+) -> RetryConfig:
+    """Parse a retry block, reusing an equal RetryConfig from ``shared``.
+
+    Args:
+        retry_data: Retry block from the workflow YAML
+        shared: RetryConfigs already parsed from the same workflow
+
+    Returns:
+        RetryConfig for the block
+    """
+    max_attempts = retry_data.get("max_attempts", 3)
+    backoff = _to_enum(_BACKOFF_TYPES, BackoffType, retry_data.get("backoff", "fixed"))
+    delay_seconds = retry_data.get("delay_seconds", 1.0)
+    # Types are part of the key so e.g. a delay of 1 and 1.0 stay distinct
+    key = (type(max_attempts), max_attempts, backoff, type(delay_seconds), delay_seconds)
+    try:
+        retry = shared.get(key)
+    except TypeError:  # unhashable YAML value, left for validation to report
+        return RetryConfig(max_attempts, backoff, delay_seconds)
+    if retry is None:
+        retry = shared[key] = RetryConfig(max_attempts, backoff, delay_seconds)
+    return retry
+
+
 def normalize_inputs(raw_inputs: Any) -> list[InputDefinition]:
     """Normalize input definitions.
 
@@ -175,14 +221,16 @@ def normalize_inputs(raw_inputs: Any) -> list[InputDefinition]:
 
     inputs: list[InputDefinition] = []
 
+    # The YAML loader yields exact str/dict objects, so exact type checks
+    # decide almost every item; isinstance still admits subclasses
     for item in raw_inputs:
-        if isinstance(item, str):
+        if type(item) is str or isinstance(item, str):
             # Simple string: required input
             inputs.append(InputDefinition(name=item, required=True))
-        elif isinstance(item, dict):
+        elif type(item) is dict or isinstance(item, dict):
             # Dict with single key-value
             for name, value in item.items():
-                if isinstance(value, dict):
+                if type(value) is dict or isinstance(value, dict):
                     # Full definition
                     inputs.append(
                         InputDefinition(
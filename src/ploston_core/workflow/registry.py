@@ -1,6 +1,7 @@
 """Workflow Registry implementation."""
 
 import asyncio
+import os
 import secrets
 import time
 from collections.abc import Awaitable, Callable
@@ -42,6 +43,11 @@ if TYPE_CHECKING:
     from ploston_core.telemetry.metrics import AELMetrics
 
 
+def _load_workflow_file(path: Path) -> WorkflowDefinition:
+    """Read and parse a workflow file (run in a worker thread)."""
+    return parse_workflow_yaml(path.read_text(), path)
+
+
 class WorkflowRegistry:
     """Registry of workflow definitions.
 
@@ -173,14 +179,24 @@ class WorkflowRegistry:
         count = 0
         workflows_dir = Path(self._config.directory)
         if workflows_dir.exists():
-            for yaml_file in workflows_dir.glob("*.yaml"):
+            # Files are read and parsed concurrently in worker threads, off
+            # the event loop, then registered one by one in directory order
+            with os.scandir(workflows_dir) as entries:
+                yaml_files = [
+                    Path(entry.path)
+                    for entry in entries
+                    if entry.name.endswith(".yaml") and entry.is_file()
+                ]
+            loaded = await asyncio.gather(
+                *(asyncio.to_thread(_load_workflow_file, path) for path in yaml_files),
+                return_exceptions=True,
+            )
+            for yaml_file, workflow in zip(yaml_files, loaded, strict=True):
                 try:
-                    yaml_content = yaml_file.read_text()
-                    self.register_from_yaml(
-                        yaml_content,
-                        source_path=yaml_file,
-                        validate=False,
-                    )
+                    if isinstance(workflow, BaseException):
+                        raise workflow
+                    self.register(workflow, validate=False)
+                    self._workflows[workflow.name].source = "file"
                     count += 1
                 except Exception as e:
                     if self._logger:
@@ -527,33 +543,7 @@ class WorkflowRegistry:
         tools: list[dict[str, Any]] = []
 
         for workflow in self.list_workflows():
-            # Build input schema
-            properties: dict[str, Any] = {}
-            required: list[str] = []
-
-            for inp in workflow.inputs:
-                prop: dict[str, Any] = {"type": inp.type}
-                if inp.description:
-                    prop["description"] = inp.description
-                if inp.enum:
-                    prop["enum"] = inp.enum
-                if inp.pattern:
-                    prop["pattern"] = inp.pattern
-                if inp.minimum is not None:
-                    prop["minimum"] = inp.minimum
-                if inp.maximum is not None:
-                    prop["maximum"] = inp.maximum
-
-                properties[inp.name] = prop
-                if inp.required:
-                    required.append(inp.name)
-
-            input_schema: dict[str, Any] = {
-                "type": "object",
-                "properties": properties,
-            }
-            if required:
-                input_schema["required"] = required
+            input_schema = workflow.get_input_schema(include_defaults=False)
 
             # Create tool definition — bare name (DEC-169)
             tool = {
@@ -569,7 +559,9 @@ class WorkflowRegistry:
     def snapshot(self, name: str) -> dict[str, Any]:
         """Get workflow snapshot for execution.
 
-        Returns frozen copy of workflow definition.
+        Returns a dict representation of the workflow definition. It is built
+        once per registration and shared between callers, so treat it as
+        read-only.
 
         Args:
             name: Workflow name
@@ -581,8 +573,14 @@ class WorkflowRegistry:
             AELError(WORKFLOW_NOT_FOUND)
         """
         workflow = self.get_or_raise(name)
-
-        # Return a dict representation (frozen copy)
+        entry = self._workflows[name]
+        if entry.snapshot is None:
+            entry.snapshot = self._build_snapshot(workflow)
+        return entry.snapshot
+
+    @staticmethod
+    def _build_snapshot(workflow: WorkflowDefinition) -> dict[str, Any]:
+        """Build the dict representation of a workflow for snapshot()."""
         return {
             "name": workflow.name,
             "version": workflow.version,
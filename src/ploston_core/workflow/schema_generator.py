@@ -107,6 +107,8 @@ def _dataclass_to_schema(cls: type) -> dict[str, Any]:
     required: list[str] = []
 
     for f in dataclasses.fields(cls):
+        if not f.init:
+            continue  # Computed state (e.g. caches), not part of the format
         type_hint = hints.get(f.name, str)
         prop = _python_type_to_json_schema(type_hint)
 
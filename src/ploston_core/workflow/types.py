@@ -1,5 +1,6 @@
 """Workflow data model types."""
 
+import heapq
 from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Any
@@ -32,6 +33,30 @@ class InputDefinition:
     minimum: float | None = None
     maximum: float | None = None
 
+    def to_json_schema(self, include_default: bool = True) -> dict[str, Any]:
+        """Generate the JSON Schema property for this input.
+
+        Args:
+            include_default: Whether to include the default value
+
+        Returns:
+            JSON Schema dict
+        """
+        prop: dict[str, Any] = {"type": self.type}
+        if self.description:
+            prop["description"] = self.description
+        if self.enum:
+            prop["enum"] = self.enum
+        if self.pattern:
+            prop["pattern"] = self.pattern
+        if self.minimum is not None:
+            prop["minimum"] = self.minimum
+        if self.maximum is not None:
+            prop["maximum"] = self.maximum
+        if include_default and self.default is not None:
+            prop["default"] = self.default
+        return prop
+
 
 @dataclass
 class OutputDefinition:
@@ -110,24 +135,47 @@ class WorkflowDefinition:
     source_path: Path | None = None
     yaml_content: str | None = None
 
+    # Step ID -> position of its first step in ``steps``
+    _step_positions: dict[str, int] = field(
+        default_factory=dict, init=False, repr=False, compare=False
+    )
+
+    # Execution order cache, keyed by the steps it was computed from
+    _execution_order: list[str] | None = field(default=None, init=False, repr=False, compare=False)
+    _order_steps: tuple[StepDefinition, ...] = field(
+        default=(), init=False, repr=False, compare=False
+    )
+
     def get_step(self, step_id: str) -> StepDefinition | None:
         """Get step by ID.
 
+        Lookups go through an index of step positions, rebuilt when it
+        does not match the steps list (e.g. after steps were edited).
+
         Args:
             step_id: Step identifier
 
         Returns:
             Step definition or None if not found
         """
-        for step in self.steps:
-            if step.id == step_id:
-                return step
-        return None
+        steps = self.steps
+        position = self._step_positions.get(step_id)
+        if position is not None and position < len(steps) and steps[position].id == step_id:
+            return steps[position]
+
+        positions: dict[str, int] = {}
+        for i, step in enumerate(steps):
+            positions.setdefault(step.id, i)
+        self._step_positions = positions
+        position = positions.get(step_id)
+        return None if position is None else steps[position]
 
     def get_execution_order(self) -> list[str]:
         """Get steps in execution order (topological sort).
 
-        Respects depends_on, defaults to sequential (YAML order).
+        Respects depends_on, defaults to sequential (YAML order). The order
+        is computed once and reused (validation and execution both ask for
+        it) until a step is added, removed or replaced.
 
         Returns:
             List of step IDs in execution order
@@ -135,50 +183,61 @@ class WorkflowDefinition:
         Raises:
             ValueError if circular dependency detected
         """
+        steps = tuple(self.steps)
+        if self._execution_order is not None and steps == self._order_steps:
+            return list(self._execution_order)
+
         # Build step index for preserving YAML order
         step_index = {step.id: i for i, step in enumerate(self.steps)}
 
         # Build dependency graph
         # graph[step_id] = list of steps that step_id depends on
         graph: dict[str, list[str]] = {}
-        in_degree: dict[str, int] = {}
-
         for step in self.steps:
             graph[step.id] = step.depends_on or []
-            in_degree[step.id] = 0
 
-        # Calculate in-degrees (number of dependencies each step has)
-        for step in self.steps:
-            # Each dependency adds 1 to this step's in-degree
-            in_degree[step.id] = len(graph[step.id])
+        # in_degree[step_id] = number of dependencies step_id has
+        # dependents[dep] = steps that depend on dep (each listed once)
+        in_degree: dict[str, int] = {}
+        dependents: dict[str, list[str]] = {}
+        for step_id, deps in graph.items():
+            in_degree[step_id] = len(deps)
+            for dep in dict.fromkeys(deps):
+                dependents.setdefault(dep, []).append(step_id)
 
         # Topological sort (Kahn's algorithm)
-        # Start with steps that have no dependencies (in_degree == 0)
-        queue = [step_id for step_id, degree in in_degree.items() if degree == 0]
+        # Start with steps that have no dependencies (in_degree == 0); the
+        # heap pops ready steps in original YAML order to preserve sequential
+        # execution when there are no explicit dependencies
+        queue = [
+            (step_index[step_id], step_id) for step_id, degree in in_degree.items() if degree == 0
+        ]
+        heapq.heapify(queue)
         result: list[str] = []
 
         while queue:
-            # Sort by original YAML order to preserve sequential execution
-            # when there are no explicit dependencies
-            queue.sort(key=lambda x: step_index[x])
-            current = queue.pop(0)
+            _, current = heapq.heappop(queue)
             result.append(current)
 
             # For each step that depends on current, decrement its in-degree
-            for step in self.steps:
-                if current in graph[step.id]:
-                    in_degree[step.id] -= 1
-                    if in_degree[step.id] == 0:
-                        queue.append(step.id)
+            for step_id in dependents.get(current, ()):
+                in_degree[step_id] -= 1
+                if in_degree[step_id] == 0:
+                    heapq.heappush(queue, (step_index[step_id], step_id))
 
         if len(result) != len(self.steps):
             raise ValueError("Circular dependency detected in workflow")
 
-        return result
+        self._execution_order = result
+        self._order_steps = steps
+        return list(result)
 
-    def get_input_schema(self) -> dict[str, Any]:
+    def get_input_schema(self, include_defaults: bool = True) -> dict[str, Any]:
         """Generate JSON Schema for inputs (for MCP exposure).
 
+        Args:
+            include_defaults: Whether input properties include default values
+
         Returns:
             JSON Schema dict
         """
@@ -186,21 +245,7 @@ class WorkflowDefinition:
         required: list[str] = []
 
         for inp in self.inputs:
-            prop: dict[str, Any] = {"type": inp.type}
-            if inp.description:
-                prop["description"] = inp.description
-            if inp.enum:
-                prop["enum"] = inp.enum
-            if inp.pattern:
-                prop["pattern"] = inp.pattern
-            if inp.minimum is not None:
-                prop["minimum"] = inp.minimum
-            if inp.maximum is not None:
-                prop["maximum"] = inp.maximum
-            if inp.default is not None:
-                prop["default"] = inp.default
-
-            properties[inp.name] = prop
+            properties[inp.name] = inp.to_json_schema(include_defaults)
             if inp.required:
                 required.append(inp.name)
 
@@ -241,3 +286,6 @@ class WorkflowEntry:
     workflow: WorkflowDefinition
     registered_at: str
     source: str  # "file" | "api"
+
+    # Snapshot of the workflow, built on first request
+    snapshot: dict[str, Any] | None = field(default=None, init=False, repr=False, compare=False)
@@ -5,6 +5,7 @@ from __future__ import annotations
 import ast
 import difflib
 import re
+from collections import Counter
 from typing import TYPE_CHECKING, Any
 
 from ploston_core.template import TemplateEngine
@@ -175,16 +176,19 @@ class WorkflowValidator:
         self,
         tool_registry: ToolRegistry,
         runner_registry: RunnerRegistry | None = None,
+        template_engine: TemplateEngine | None = None,
     ):
         """Initialize validator.
 
         Args:
             tool_registry: Tool registry for CP-direct tool existence checks
             runner_registry: Optional runner registry for runner-hosted tool checks
+            template_engine: Optional template engine to share (a new one is
+                created if omitted)
         """
         self._tool_registry = tool_registry
         self._runner_registry = runner_registry
-        self._template_engine = TemplateEngine()
+        self._template_engine = template_engine or TemplateEngine()
 
     def validate(
         self,
@@ -235,12 +239,15 @@ class WorkflowValidator:
         # Check unique step IDs
         step_ids = [step.id for step in workflow.steps]
         input_names = [inp.name for inp in (workflow.inputs or [])]
-        duplicates = [sid for sid in step_ids if step_ids.count(sid) > 1]
+        # Sets for the membership checks below
+        step_id_set = set(step_ids)
+        input_name_set = set(input_names)
+        duplicates = [sid for sid, count in Counter(step_ids).items() if count > 1]
         if duplicates:
             errors.append(
                 ValidationIssue(
                     path="steps",
-                    message=f"Duplicate step IDs: {', '.join(set(duplicates))}",
+                    message=f"Duplicate step IDs: {', '.join(duplicates)}",
                     severity="error",
                 )
             )
@@ -296,7 +303,7 @@ class WorkflowValidator:
             # Validate depends_on references
             if step.depends_on:
                 for dep in step.depends_on:
-                    if dep not in step_ids:
+                    if dep not in step_id_set:
                         errors.append(
                             ValidationIssue(
                                 path=f"steps.{step.id}.depends_on",
@@ -305,8 +312,9 @@ class WorkflowValidator:
                             )
                         )
 
-            # Validate template syntax in params
-            if step.params:
+            # Validate template syntax in params (params without templates
+            # have neither syntax errors nor references)
+            if step.params and self._template_engine.has_references(step.params):
                 template_errors = self._template_engine.validate(step.params)
                 for error in template_errors:
                     errors.append(
@@ -323,7 +331,7 @@ class WorkflowValidator:
                     if len(head) < 2:
                         continue
                     root, name = head[0], head[1]
-                    if root == "inputs" and name not in input_names:
+                    if root == "inputs" and name not in input_name_set:
                         errors.append(
                             ValidationIssue(
                                 path=f"steps.{step.id}.params",
@@ -334,7 +342,7 @@ class WorkflowValidator:
                                 severity="error",
                             )
                         )
-                    elif root == "steps" and name not in step_ids:
+                    elif root == "steps" and name not in step_id_set:
                         errors.append(
                             ValidationIssue(
                                 path=f"steps.{step.id}.params",
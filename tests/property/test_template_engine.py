@@ -9,6 +9,17 @@ from hypothesis import strategies as st
 
 from ploston_core.errors import AELError
 from ploston_core.template import TemplateEngine
+from ploston_core.template.parser import (
+    TEMPLATE_PATTERN,
+    extract_all_references,
+    extract_templates,
+    has_any_reference,
+    has_templates,
+    is_pure_template,
+    parse_template,
+    template_spans,
+    validate_syntax,
+)
 from ploston_core.template.types import TemplateContext
 from ploston_core.types import StepOutput
 
@@ -162,3 +173,149 @@ class TestInputVariations:
 
         # Should return the dict
         assert result == data
+
+
+@pytest.mark.property
+class TestParseTemplate:
+    """Property tests for the single-pass template parser."""
+
+    @given(
+        st.lists(
+            st.one_of(
+                st.text(max_size=20),
+                st.sampled_from(["{{ inputs.x }}", "{{inputs.x}}", "{{ a | b(1) }}", "{{ for }}"]),
+            ),
+            max_size=4,
+        ).map("".join)
+    )
+    @settings(max_examples=200)
+    def test_parse_matches_individual_helpers(self, text):
+        """parse_template should agree with the individual parser helpers."""
+        parsed = parse_template(text)
+        assert parsed.has_templates == has_templates(text)
+        assert list(parsed.templates) == extract_templates(text)
+        assert parsed.is_pure == is_pure_template(text)
+        assert list(parsed.errors) == validate_syntax(text)
+
+    @given(st.sampled_from(["if", "for", "while", "import"]))
+    @settings(max_examples=10)
+    def test_keywords_inside_names_are_valid(self, keyword):
+        """Control-flow keywords are only rejected as whole words."""
+        assert validate_syntax(f"{{{{ inputs.{keyword}_x.plat{keyword}m }}}}") == []
+        assert validate_syntax(f"{{{{ {keyword} inputs.x }}}}") == [
+            f"Control flow not supported: {keyword} inputs.x"
+        ]
+
+
+@pytest.mark.property
+class TestCompiledTemplate:
+    """Property tests for compiled template plans."""
+
+    @given(st.integers(), st.text(max_size=20))
+    @settings(max_examples=100)
+    def test_compiled_plan_renders_each_context(self, count, name):
+        """A compiled plan is reused and renders whatever context it is given."""
+        engine = TemplateEngine()
+        template = "{{ inputs.name }} has {{ inputs.items | length }} items"
+        compiled = engine.compile(template)
+        assert engine.compile(template) is compiled
+
+        context = make_context(inputs={"name": name, "items": [0] * (count % 5)})
+        assert compiled.render(context) == f"{name} has {count % 5} items"
+        assert compiled.render(context) == engine.render_string(template, context)
+
+    def test_repeated_expression_evaluated_once(self):
+        """An expression repeated within one string is evaluated once per render."""
+        engine = TemplateEngine()
+        compiled = engine.compile("{{ inputs.x }}-{{inputs.x}}-{{ inputs.y }}-{{ inputs.x }}")
+        assert len(compiled.expressions) == 2
+        assert compiled.render(make_context(inputs={"x": 1, "y": None})) == "1-1--1"
+
+
+class TestRenderTraversal:
+    """Tests for rendering nested values."""
+
+    def test_nested_values_keep_order_and_shape(self):
+        """Nested values render in place and templates are reported in order."""
+        engine = TemplateEngine()
+        template = {
+            "a": "{{ inputs.x }}",
+            "b": [1, {"c": "{{ inputs.y }}"}, None],
+            "d": "{{ inputs.x }} and {{ inputs.y }}",
+        }
+        result = engine.render(template, make_context(inputs={"x": 1, "y": "two"}))
+
+        assert result.value == {"a": 1, "b": [1, {"c": "two"}, None], "d": "1 and two"}
+        assert result.templates_rendered == ["inputs.x", "inputs.y", "inputs.x", "inputs.y"]
+        assert template["b"][1]["c"] == "{{ inputs.y }}"
+
+    def test_deep_nesting_does_not_recurse(self):
+        """Nesting close to the depth limit renders without hitting recursion limits."""
+        engine = TemplateEngine()
+        value: dict = {"leaf": "{{ inputs.x }}"}
+        for _ in range(900):
+            value = {"child": value}
+
+        rendered = engine.render(value, make_context(inputs={"x": 7})).value
+        for _ in range(900):
+            rendered = rendered["child"]
+        assert rendered == {"leaf": 7}
+
+    def test_self_referencing_value_rejected(self):
+        """A value that contains itself fails instead of looping forever."""
+        engine = TemplateEngine()
+        value: list = ["{{ inputs.x }}"]
+        value.append(value)
+
+        with pytest.raises(AELError):
+            engine.render(value, make_context(inputs={"x": 1}))
+
+
+class TestValidate:
+    """Tests for template validation."""
+
+    def test_unknown_filter_reported(self):
+        """Unknown filters are reported by validate, before any render."""
+        engine = TemplateEngine()
+        errors = engine.validate({"a": "{{ inputs.x | length }}", "b": ["{{ inputs.x | shout }}"]})
+        assert errors == ["Unknown filter 'shout' in template: inputs.x | shout"]
+
+
+class TestExtractAllReferences:
+    """Tests for extract_all_references."""
+
+    def test_references_in_document_order(self):
+        """References come out in order, without their filters."""
+        value = {
+            "a": "{{ inputs.x | length }}",
+            "b": [1, {"c": "{{steps.s.output}} {{ config.k }}"}],
+        }
+        assert extract_all_references(value) == ["inputs.x", "steps.s.output", "config.k"]
+
+    def test_self_referencing_value_rejected(self):
+        """A value that contains itself fails instead of looping forever."""
+        value: list = ["{{ inputs.x }}"]
+        value.append(value)
+
+        with pytest.raises(RecursionError):
+            extract_all_references(value)
+
+    def test_has_any_reference(self):
+        """has_any_reference finds templates at any depth and ignores plain text."""
+        assert has_any_reference({"a": [1, {"b": "x {{ inputs.y }}"}]})
+        assert not has_any_reference({"a": ["{ not a template }", None, 3], "b": "}} {{"})
+
+
+class TestTemplateSpans:
+    """Tests for template_spans."""
+
+    @given(text=st.text(alphabet="{} a|\n", max_size=40))
+    @settings(max_examples=500)
+    def test_matches_template_pattern(self, text):
+        """Spans are exactly those of TEMPLATE_PATTERN."""
+        assert list(template_spans(text)) == [m.span() for m in TEMPLATE_PATTERN.finditer(text)]
+
+    def test_unclosed_openers_scanned_linearly(self):
+        """Many unclosed openers do not rescan the line from each one."""
+        assert extract_templates("{{" * 50_000) == []
+        assert extract_templates("{{ a " * 20_000 + "\n{{ b }}") == ["b"]
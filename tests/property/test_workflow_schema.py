@@ -149,6 +149,28 @@ steps:
         with pytest.raises(ValueError, match="[Cc]ircular"):
             parsed.get_execution_order()
 
+    @given(st.lists(step_ids, min_size=1, max_size=8, unique=True), st.randoms())
+    @settings(max_examples=50)
+    def test_backward_dependencies_keep_yaml_order(self, step_names, rnd):
+        """Steps depending only on earlier steps run in YAML order."""
+        steps_yaml = []
+        for i, name in enumerate(step_names):
+            step = f'  - id: {name}\n    code: result = "{name}"'
+            deps = rnd.sample(step_names[:i], rnd.randint(0, i))
+            if deps:
+                step += "\n    depends_on:" + "".join(f"\n      - {dep}" for dep in deps)
+            steps_yaml.append(step)
+
+        workflow_yaml = f"""
+name: test-workflow
+version: "1.0"
+steps:
+{chr(10).join(steps_yaml)}
+"""
+        parsed = parse_workflow_yaml(workflow_yaml)
+
+        assert parsed.get_execution_order() == step_names
+
 
 @pytest.mark.property
 class TestYAMLParsing:
@@ -122,6 +122,19 @@ class TestUniqueStepIds:
         duplicate_errors = [e for e in result.errors if "Duplicate step IDs" in e.message]
         assert len(duplicate_errors) == 1
 
+    @given(st.lists(valid_identifier, min_size=2, max_size=6, unique=True))
+    @settings(max_examples=50)
+    def test_duplicates_listed_once_in_step_order(self, step_ids):
+        """Each duplicated ID is reported once, in order of first appearance."""
+        steps = [make_code_step(sid) for sid in step_ids + step_ids[::-1]]
+        workflow = make_workflow(steps=steps)
+
+        validator = make_validator()
+        result = validator.validate(workflow, check_tools=False)
+
+        duplicate_errors = [e for e in result.errors if "Duplicate step IDs" in e.message]
+        assert duplicate_errors[0].message == f"Duplicate step IDs: {', '.join(step_ids)}"
+
 
 # =============================================================================
 # Property Tests for Depends On References
@@ -0,0 +1,47 @@
+"""Tests for ExecutionContext.get_template_context."""
+
+from __future__ import annotations
+
+from types import SimpleNamespace
+
+from ploston_core.engine.types import ExecutionContext, StepResult
+from ploston_core.types import StepStatus
+
+
+def _ctx() -> ExecutionContext:
+    return ExecutionContext(
+        execution_id="exec-1",
+        workflow=SimpleNamespace(name="wf", version="1.0"),
+        inputs={"x": 1},
+        config={},
+        started_at="2024-01-01T00:00:00",
+    )
+
+
+def test_template_context_reused_across_steps() -> None:
+    ctx = _ctx()
+    first = ctx.get_template_context()
+    ctx.add_step_result(
+        StepResult(step_id="fetch", status=StepStatus.COMPLETED, output={"items": [1]})
+    )
+
+    second = ctx.get_template_context()
+
+    assert second is first
+    assert second.steps["fetch"].output == {"items": [1]}
+    assert second.workflow == {"name": "wf", "version": "1.0", "start_time": "2024-01-01T00:00:00"}
+
+
+def test_template_context_rebuilt_when_source_reassigned() -> None:
+    ctx = _ctx()
+    first = ctx.get_template_context()
+
+    ctx.started_at = "2024-06-01T00:00:00"
+    second = ctx.get_template_context()
+    ctx.inputs = {"x": 2}
+    third = ctx.get_template_context()
+
+    assert second is not first
+    assert second.workflow["start_time"] == "2024-06-01T00:00:00"
+    assert third is not second
+    assert third.inputs == {"x": 2}
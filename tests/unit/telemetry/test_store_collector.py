@@ -1,15 +1,20 @@
 """Tests for telemetry collector."""
 
+from datetime import UTC, datetime, timedelta
+
 import pytest
 
-from ploston_core.telemetry.store.collector import TelemetryCollector
+from ploston_core.telemetry.store.collector import TelemetryCollector, _elapsed_ms
 from ploston_core.telemetry.store.config import RedactionConfig, TelemetryStoreConfig
 from ploston_core.telemetry.store.memory import MemoryTelemetryStore
 from ploston_core.telemetry.store.types import (
+    ExecutionRecord,
     ExecutionStatus,
     ExecutionType,
+    StepRecord,
     StepStatus,
     StepType,
+    ToolCallRecord,
 )
 
 
@@ -193,3 +198,50 @@ class TestTelemetryCollector:
         assert record is not None
         assert len(record.steps[0].tool_calls) == 1
         assert record.steps[0].tool_calls[0].tool_name == "file_read"
+
+
+def test_elapsed_ms_is_exact() -> None:
+    """Test durations are whole milliseconds without float rounding."""
+    start = datetime(2024, 1, 1, tzinfo=UTC)
+    for ms in (0, 1, 1001, 4350, 123_457):
+        assert _elapsed_ms(start, start + timedelta(milliseconds=ms, microseconds=999)) == ms
+
+
+@pytest.mark.asyncio
+async def test_metrics_filled_in_place(collector: TelemetryCollector) -> None:
+    """Test end_execution fills the record's metrics without replacing them."""
+    execution_id = await collector.start_execution(ExecutionType.DIRECT, tool_name="python_exec")
+    record = collector._active_executions[execution_id]
+    metrics = record.metrics
+    assert record.logs is None
+
+    await collector.end_execution(execution_id, ExecutionStatus.COMPLETED)
+
+    assert record.metrics is metrics
+    assert metrics.total_duration_ms == record.duration_ms
+
+
+def test_calculate_metrics(collector: TelemetryCollector) -> None:
+    """Test step status, duration and tool call tallies."""
+    start = datetime(2024, 1, 1, tzinfo=UTC)
+    steps = [
+        StepRecord("a", StepType.TOOL, StepStatus.COMPLETED, duration_ms=5),
+        StepRecord("b", StepType.CODE, StepStatus.FAILED, duration_ms=0),
+        StepRecord("c", StepType.TOOL, StepStatus.SKIPPED),
+        StepRecord("d", StepType.TOOL, StepStatus.COMPLETED, duration_ms=7),
+    ]
+    for step, names in zip(steps, (["x", "y"], ["y"], [], ["x", "x"]), strict=True):
+        step.tool_calls = [
+            ToolCallRecord(f"{step.step_id}{n}", name, start) for n, name in enumerate(names)
+        ]
+    record = ExecutionRecord("e", ExecutionType.WORKFLOW, duration_ms=20, steps=steps)
+
+    metrics = collector._calculate_metrics(record)
+
+    assert (metrics.total_steps, metrics.completed_steps, metrics.failed_steps) == (4, 2, 1)
+    assert metrics.skipped_steps == 1
+    assert metrics.step_durations_ms == {"a": 5, "d": 7}
+    assert metrics.tool_call_breakdown == {"x": 3, "y": 2}
+    assert list(metrics.tool_call_breakdown) == ["x", "y"]
+    assert metrics.total_tool_calls == 5
+    assert metrics.total_duration_ms == 20
@@ -1,14 +1,19 @@
 """Tests for in-memory telemetry store."""
 
+import asyncio
 from datetime import UTC, datetime, timedelta
 
 import pytest
 
 from ploston_core.telemetry.store.memory import MemoryTelemetryStore
 from ploston_core.telemetry.store.types import (
+    ErrorRecord,
     ExecutionRecord,
     ExecutionStatus,
     ExecutionType,
+    StepRecord,
+    StepType,
+    ToolCallRecord,
 )
 
 
@@ -18,6 +23,28 @@ def store() -> MemoryTelemetryStore:
     return MemoryTelemetryStore(max_records=10)
 
 
+def _record_with_calls(
+    execution_id: str, started_at: datetime | None, *calls: tuple[str, bool]
+) -> ExecutionRecord:
+    """Create a record with one step holding (tool_name, failed) tool calls."""
+    step = StepRecord(step_id="step-1", step_type=StepType.TOOL)
+    for i, (tool_name, failed) in enumerate(calls):
+        step.tool_calls.append(
+            ToolCallRecord(
+                call_id=f"{execution_id}-call-{i}",
+                tool_name=tool_name,
+                started_at=started_at or datetime.now(UTC),
+                error=ErrorRecord(code="E", category="TOOL", message="boom") if failed else None,
+            )
+        )
+    return ExecutionRecord(
+        execution_id=execution_id,
+        execution_type=ExecutionType.WORKFLOW,
+        started_at=started_at,
+        steps=[step],
+    )
+
+
 @pytest.fixture
 def sample_record() -> ExecutionRecord:
     """Create a sample execution record."""
@@ -169,3 +196,255 @@ class TestMemoryTelemetryStore:
 
         records, total = await store.list_executions()
         assert total == 3
+
+    @pytest.mark.asyncio
+    async def test_list_newest_first_across_pages(self, store: MemoryTelemetryStore) -> None:
+        """Test listing returns records newest-first and pages don't overlap."""
+        now = datetime.now(UTC)
+        for i in [3, 0, 4, 1, 2]:
+            record = ExecutionRecord(
+                execution_id=f"exec-{i}",
+                execution_type=ExecutionType.WORKFLOW,
+                started_at=now - timedelta(hours=i),
+            )
+            await store.save_execution(record)
+
+        first, total = await store.list_executions(page=1, page_size=2)
+        second, _ = await store.list_executions(page=2, page_size=2)
+        third, _ = await store.list_executions(page=3, page_size=2)
+
+        assert total == 5
+        assert [r.execution_id for r in first + second + third] == [
+            "exec-0",
+            "exec-1",
+            "exec-2",
+            "exec-3",
+            "exec-4",
+        ]
+
+    @pytest.mark.asyncio
+    async def test_list_after_update_and_delete(self, store: MemoryTelemetryStore) -> None:
+        """Test the time index follows updates and deletions."""
+        now = datetime.now(UTC)
+        for i in range(3):
+            record = ExecutionRecord(
+                execution_id=f"exec-{i}",
+                execution_type=ExecutionType.WORKFLOW,
+                started_at=now - timedelta(hours=i),
+            )
+            await store.save_execution(record)
+
+        moved = ExecutionRecord(
+            execution_id="exec-2",
+            execution_type=ExecutionType.WORKFLOW,
+            started_at=now + timedelta(hours=1),
+        )
+        await store.save_execution(moved)
+        await store.delete_execution("exec-0")
+
+        records, total = await store.list_executions()
+        assert total == 2
+        assert [r.execution_id for r in records] == ["exec-2", "exec-1"]
+
+    @pytest.mark.asyncio
+    async def test_list_with_combined_filters(self, store: MemoryTelemetryStore) -> None:
+        """Test several indexed filters are applied together."""
+        now = datetime.now(UTC)
+        for i in range(6):
+            record = ExecutionRecord(
+                execution_id=f"exec-{i}",
+                execution_type=ExecutionType.WORKFLOW,
+                workflow_id="wf-a" if i % 2 == 0 else "wf-b",
+                caller_id="alice" if i < 3 else "bob",
+                status=ExecutionStatus.COMPLETED,
+                started_at=now - timedelta(hours=i),
+            )
+            await store.save_execution(record)
+
+        records, total = await store.list_executions(workflow_id="wf-a", caller_id="alice")
+        assert total == 2
+        assert [r.execution_id for r in records] == ["exec-0", "exec-2"]
+
+        records, total = await store.list_executions(workflow_id="wf-missing")
+        assert total == 0
+        assert records == []
+
+    @pytest.mark.asyncio
+    async def test_list_filter_follows_status_update(
+        self, store: MemoryTelemetryStore, sample_record: ExecutionRecord
+    ) -> None:
+        """Test status filter reflects the latest saved status."""
+        sample_record.status = ExecutionStatus.RUNNING
+        await store.save_execution(sample_record)
+
+        sample_record.status = ExecutionStatus.COMPLETED
+        await store.save_execution(sample_record)
+
+        _, running = await store.list_executions(status=ExecutionStatus.RUNNING)
+        _, completed = await store.list_executions(status=ExecutionStatus.COMPLETED)
+        assert running == 0
+        assert completed == 1
+
+    @pytest.mark.asyncio
+    async def test_delete_before_keeps_records_without_start_time(
+        self, store: MemoryTelemetryStore
+    ) -> None:
+        """Test records without started_at survive retention cleanup."""
+        now = datetime.now(UTC)
+        await store.save_execution(
+            ExecutionRecord(execution_id="no-start", execution_type=ExecutionType.DIRECT)
+        )
+        await store.save_execution(
+            ExecutionRecord(
+                execution_id="old",
+                execution_type=ExecutionType.DIRECT,
+                tool_name="python_exec",
+                started_at=now - timedelta(days=3),
+            )
+        )
+
+        deleted = await store.delete_before(now)
+        assert deleted == 1
+        assert await store.get_execution("no-start") is not None
+        assert await store.get_execution("old") is None
+
+        _, total = await store.list_executions(tool_name="python_exec")
+        assert total == 0
+
+    @pytest.mark.asyncio
+    async def test_tool_call_stats(self, store: MemoryTelemetryStore) -> None:
+        """Test tool call statistics across saves, updates and deletes."""
+        now = datetime.now(UTC)
+        await store.save_execution(
+            _record_with_calls("exec-1", now, ("file_read", False), ("http_get", True))
+        )
+        await store.save_execution(_record_with_calls("exec-2", now, ("file_read", False)))
+
+        stats = await store.get_tool_call_stats()
+        assert stats == {
+            "file_read": {"total": 2, "success": 2, "error": 0},
+            "http_get": {"total": 1, "success": 0, "error": 1},
+        }
+
+        # Re-saving replaces the previous counts for that execution
+        await store.save_execution(_record_with_calls("exec-1", now, ("file_read", True)))
+        await store.delete_execution("exec-2")
+
+        stats = await store.get_tool_call_stats()
+        assert stats == {"file_read": {"total": 1, "success": 0, "error": 1}}
+
+    @pytest.mark.asyncio
+    async def test_tool_call_stats_time_range(self, store: MemoryTelemetryStore) -> None:
+        """Test tool call statistics honour since/until bounds inclusively."""
+        now = datetime.now(UTC)
+        for i in range(4):
+            await store.save_execution(
+                _record_with_calls(f"exec-{i}", now - timedelta(days=i), ("file_read", False))
+            )
+        await store.save_execution(_record_with_calls("no-start", None, ("file_read", False)))
+
+        stats = await store.get_tool_call_stats(
+            since=now - timedelta(days=2), until=now - timedelta(days=1)
+        )
+        assert stats["file_read"]["total"] == 3  # exec-1, exec-2 and no-start
+
+        await store.delete_before(now - timedelta(days=1))
+        stats = await store.get_tool_call_stats()
+        assert stats["file_read"]["total"] == 3  # exec-0, exec-1 and no-start
+
+    @pytest.mark.asyncio
+    async def test_delete_before_in_batches(self) -> None:
+        """Test retention sweeps larger than one batch delete every expired record."""
+        store = MemoryTelemetryStore(max_records=2600)
+        now = datetime.now(UTC)
+        for i in range(2500):
+            record = ExecutionRecord(
+                execution_id=f"exec-{i}",
+                execution_type=ExecutionType.WORKFLOW,
+                workflow_id="wf-1",
+                started_at=now - timedelta(minutes=i),
+            )
+            await store.save_execution(record)
+
+        deleted = await store.delete_before(now - timedelta(minutes=99, seconds=30))
+        assert deleted == 2400
+
+        records, total = await store.list_executions(workflow_id="wf-1", page_size=200)
+        assert total == 100
+        assert records[-1].execution_id == "exec-99"
+
+    @pytest.mark.asyncio
+    async def test_get_earliest_started_at(self, store: MemoryTelemetryStore) -> None:
+        """Test the earliest start time ignores records without one."""
+        assert await store.get_earliest_started_at() is None
+
+        now = datetime.now(UTC)
+        await store.save_execution(
+            ExecutionRecord(execution_id="no-start", execution_type=ExecutionType.DIRECT)
+        )
+        for i in range(3):
+            await store.save_execution(
+                ExecutionRecord(
+                    execution_id=f"exec-{i}",
+                    execution_type=ExecutionType.WORKFLOW,
+                    started_at=now - timedelta(hours=i),
+                )
+            )
+
+        assert await store.get_earliest_started_at() == now - timedelta(hours=2)
+
+    @pytest.mark.asyncio
+    async def test_list_since_until_keeps_records_without_start_time(
+        self, store: MemoryTelemetryStore
+    ) -> None:
+        """Test time filters are inclusive and don't exclude records without started_at."""
+        now = datetime.now(UTC)
+        for i in range(4):
+            await store.save_execution(
+                ExecutionRecord(
+                    execution_id=f"exec-{i}",
+                    execution_type=ExecutionType.WORKFLOW,
+                    started_at=now - timedelta(hours=i),
+                )
+            )
+        await store.save_execution(
+            ExecutionRecord(execution_id="no-start", execution_type=ExecutionType.WORKFLOW)
+        )
+
+        records, total = await store.list_executions(
+            since=now - timedelta(hours=2), until=now - timedelta(hours=1)
+        )
+        assert total == 3
+        assert [r.execution_id for r in records] == ["exec-1", "exec-2", "no-start"]
+
+    @pytest.mark.asyncio
+    async def test_list_during_batched_delete(self) -> None:
+        """Test listing interleaved with a multi-batch retention sweep stays consistent."""
+        store = MemoryTelemetryStore(max_records=3000)
+        now = datetime.now(UTC)
+        for i in range(2500):
+            await store.save_execution(
+                ExecutionRecord(
+                    execution_id=f"exec-{i}",
+                    execution_type=ExecutionType.WORKFLOW,
+                    started_at=now - timedelta(minutes=i),
+                )
+            )
+
+        async def list_repeatedly() -> list[int]:
+            totals = []
+            for _ in range(5):
+                records, total = await store.list_executions(page_size=5)
+                assert len(records) == 5
+                totals.append(total)
+                await asyncio.sleep(0)
+            return totals
+
+        deleted, totals = await asyncio.gather(
+            store.delete_before(now - timedelta(minutes=499, seconds=30)),
+            list_repeatedly(),
+        )
+
+        assert deleted == 2000
+        assert totals == sorted(totals, reverse=True)
+        assert all(total in (2500, 1500, 500) for total in totals)
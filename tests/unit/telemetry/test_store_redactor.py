@@ -1,5 +1,10 @@
 """Tests for telemetry store redactor."""
 
+import dataclasses
+from datetime import UTC, datetime
+
+import pytest
+
 from ploston_core.telemetry.store.config import RedactionConfig, RedactionPattern
 from ploston_core.telemetry.store.redactor import Redactor
 
@@ -119,3 +124,156 @@ class TestRedactor:
         assert redactor.redact(123) == 123
         assert redactor.redact(None) is None
         assert redactor.redact(True) is True
+
+    def test_redact_scalar_leaves_pass_through(self) -> None:
+        """Test scalar values inside containers are kept as-is."""
+        config = RedactionConfig.default()
+        redactor = Redactor(config)
+
+        when = datetime(2024, 1, 1, tzinfo=UTC)
+        data = {"n": 4111111111111111, "f": 1.5, "b": b"sk-x", "at": when, "flag": False}
+        result = redactor.redact(data)
+
+        assert result == data
+        assert result["at"] is when
+
+    def test_redact_multiple_patterns_single_pass(self) -> None:
+        """Test each pattern maps to its own replacement when combined."""
+        config = RedactionConfig.default()
+        redactor = Redactor(config)
+
+        text = "key sk-abcdefghijklmnopqrstuvwxyz123456 mail a@b.io card 4111111111111111"
+        result = redactor.redact(text)
+
+        assert result == "key [REDACTED_API_KEY] mail [REDACTED_EMAIL] card [REDACTED_CARD]"
+
+    def test_redact_patterns_with_backreference_replacement(self) -> None:
+        """Test template replacements fall back to sequential substitution."""
+        config = RedactionConfig(
+            enabled=True,
+            fields=[],
+            patterns=[
+                RedactionPattern.from_string(r"(user)=\w+", r"\1=[REDACTED]"),
+                RedactionPattern.from_string(r"\d{4}", "[NUM]"),
+            ],
+        )
+        redactor = Redactor(config)
+
+        assert redactor.redact("user=bob pin 1234") == "user=[REDACTED] pin [NUM]"
+
+    def test_redact_skips_strings_shorter_than_patterns(self) -> None:
+        """Test strings too short to match any pattern are returned unchanged."""
+        config = RedactionConfig(
+            enabled=True,
+            fields=[],
+            patterns=[RedactionPattern.from_string(r"\d{4}", "[NUM]")],
+        )
+        redactor = Redactor(config)
+
+        assert redactor.redact("123") == "123"
+        assert redactor.redact("1234") == "[NUM]"
+
+    def test_redact_repeated_keys_use_cached_decision(self) -> None:
+        """Test field decisions stay correct when keys repeat across payloads."""
+        config = RedactionConfig(enabled=True, fields=["Token"])
+        redactor = Redactor(config)
+
+        for _ in range(3):
+            result = redactor.redact({"TOKEN": "abc", "name": "x"})
+            assert result == {"TOKEN": "[REDACTED]", "name": "x"}
+
+    def test_pattern_from_string_reuses_compiled_regex(self) -> None:
+        """Test identical pattern strings share one compiled regex."""
+        first = RedactionPattern.from_string(r"secret-\d+", "[X]")
+        second = RedactionPattern.from_string(r"secret-\d+", "[Y]")
+
+        assert first.regex is second.regex
+        assert second.replacement == "[Y]"
+
+    def test_redact_deeply_nested(self) -> None:
+        """Test redaction of payloads nested deeper than the recursion limit."""
+        config = RedactionConfig(enabled=True, fields=["password"])
+        redactor = Redactor(config)
+
+        data: dict[str, object] = {"password": "secret"}
+        for _ in range(5000):
+            data = {"child": [data]}
+        result = redactor.redact(data)
+
+        for _ in range(5000):
+            result = result["child"][0]
+        assert result == {"password": "[REDACTED]"}
+
+    def test_redact_preserves_key_order_and_leaves(self) -> None:
+        """Test redaction keeps key order and passes non-string leaves through."""
+        config = RedactionConfig(enabled=True, fields=["token"])
+        redactor = Redactor(config)
+
+        data = {"b": 1, "token": "x", "a": [None, 2.5, {"c": True}]}
+        result = redactor.redact(data)
+
+        assert list(result) == ["b", "token", "a"]
+        assert result == {"b": 1, "token": "[REDACTED]", "a": [None, 2.5, {"c": True}]}
+
+    def test_redactors_share_pattern_function_for_same_config(self) -> None:
+        """Test redactors built from equal pattern sets reuse one specialization."""
+        first = Redactor(RedactionConfig.default())
+        second = Redactor(RedactionConfig.default())
+
+        assert first._redact_patterns is second._redact_patterns
+        assert first.redact("card 4111111111111111") == "card [REDACTED_CARD]"
+
+    def test_redact_default_email_pattern(self) -> None:
+        """Test the default email pattern redacts whole addresses."""
+        redactor = Redactor(RedactionConfig.default())
+
+        assert redactor.redact("to a.b+c@mail.example.org, x@y.io") == (
+            "to [REDACTED_EMAIL], [REDACTED_EMAIL]"
+        )
+
+    def test_redact_default_long_text_without_matches(self) -> None:
+        """Test long unmatched text is returned unchanged by the default patterns."""
+        redactor = Redactor(RedactionConfig.default())
+
+        text = "a" * 200_000
+        assert redactor.redact(text) == text
+
+    def test_config_fields_normalized_to_lowercase_frozenset(self) -> None:
+        """Test configured field names are frozen and lowercased."""
+        config = RedactionConfig(enabled=True, fields=["Password", "API_KEY"])
+
+        assert config.fields == frozenset({"password", "api_key"})
+
+    def test_redact_returns_unchanged_containers_as_is(self) -> None:
+        """Test containers with nothing to redact are not copied."""
+        config = RedactionConfig.default()
+        redactor = Redactor(config)
+
+        clean = {"name": "test", "items": [1, "two", {"three": 3}]}
+        assert redactor.redact(clean) is clean
+
+        data = {"clean": {"a": [1, 2]}, "dirty": {"token": "x"}}
+        result = redactor.redact(data)
+        assert result is not data
+        assert result["clean"] is data["clean"]
+        assert result["dirty"] == {"token": "[REDACTED]"}
+        assert data["dirty"] == {"token": "x"}  # source not mutated
+
+    def test_redact_copies_list_when_item_changes(self) -> None:
+        """Test a list is copied when one of its strings is redacted."""
+        config = RedactionConfig.default()
+        redactor = Redactor(config)
+
+        data = ["plain", "mail me at a@b.io", ["nested", "x@y.io"]]
+        result = redactor.redact(data)
+
+        assert result == ["plain", "mail me at [REDACTED_EMAIL]", ["nested", "[REDACTED_EMAIL]"]]
+        assert data[1] == "mail me at a@b.io"
+
+    def test_redaction_pattern_is_immutable(self) -> None:
+        """Test redaction patterns are frozen value objects."""
+        pattern = RedactionPattern.from_string(r"\d+", "[NUM]")
+
+        with pytest.raises(dataclasses.FrozenInstanceError):
+            pattern.replacement = "[X]"  # type: ignore[misc]
+        assert pattern == RedactionPattern.from_string(r"\d+", "[NUM]")
@@ -107,3 +107,27 @@ class TestRetentionManager:
         await manager.stop()
         await manager.stop()  # Should not raise
         assert manager._running is False
+
+    @pytest.mark.asyncio
+    async def test_next_delay_uses_interval_for_empty_store(
+        self, manager: RetentionManager
+    ) -> None:
+        """Test the configured interval (plus jitter) is used when nothing is stored."""
+        delay = await manager._next_delay()
+        assert 1.0 <= delay <= 1.1
+
+    @pytest.mark.asyncio
+    async def test_next_delay_waits_for_oldest_record(
+        self, manager: RetentionManager, store: MemoryTelemetryStore
+    ) -> None:
+        """Test cleanup sleeps until the oldest record can expire."""
+        record = ExecutionRecord(
+            execution_id="recent",
+            execution_type=ExecutionType.WORKFLOW,
+            started_at=datetime.now(UTC) - timedelta(days=6),
+        )
+        await store.save_execution(record)
+
+        delay = await manager._next_delay()
+        one_day = timedelta(days=1).total_seconds()
+        assert one_day - 60 <= delay <= one_day + 60 + 30
@@ -1,12 +1,22 @@
 """Tests for SQLite telemetry store."""
 
-from datetime import UTC, datetime, timedelta
+import asyncio
+import dataclasses
+import hashlib
+import random
+import sqlite3
+import threading
+import uuid
+from datetime import UTC, datetime, timedelta, timezone
 from pathlib import Path
+from typing import Any
 
 import pytest
 
+from ploston_core.telemetry.store import sqlite as sqlite_module
 from ploston_core.telemetry.store.sqlite import SQLiteTelemetryStore
 from ploston_core.telemetry.store.types import (
+    ErrorRecord,
     ExecutionMetrics,
     ExecutionRecord,
     ExecutionStatus,
@@ -99,6 +109,15 @@ class TestSQLiteTelemetryStore:
         assert result.steps[0].step_id == "step-1"
         assert len(result.steps[0].tool_calls) == 1
 
+    @pytest.mark.asyncio
+    async def test_save_rejects_dataclass_payload(
+        self, store: SQLiteTelemetryStore, sample_record: ExecutionRecord
+    ) -> None:
+        """Test payloads are plain JSON: a dataclass input is not serialized."""
+        sample_record.inputs = {"p": ExecutionMetrics(total_steps=1)}
+        with pytest.raises(TypeError):
+            await store.save_execution(sample_record)
+
     @pytest.mark.asyncio
     async def test_save_and_get_topology_fields(self, store: SQLiteTelemetryStore) -> None:
         """Test round-trip of runner_id and bridge_session_id (DEC-145)."""
@@ -132,6 +151,51 @@ class TestSQLiteTelemetryStore:
         assert result.runner_id is None
         assert result.bridge_session_id is None
 
+    @pytest.mark.asyncio
+    async def test_get_groups_tool_calls_by_step(self, store: SQLiteTelemetryStore) -> None:
+        """Test steps keep their order and each gets its own tool calls in sequence."""
+        now = datetime.now(UTC)
+
+        def call(step_id: str, sequence: int) -> ToolCallRecord:
+            return ToolCallRecord(
+                call_id=f"{step_id}-call-{sequence}",
+                tool_name="tool",
+                started_at=now,
+                step_id=step_id,
+                source=ToolCallSource.CODE_BLOCK,
+                sequence=sequence,
+            )
+
+        record = ExecutionRecord(
+            execution_id="exec-steps",
+            execution_type=ExecutionType.WORKFLOW,
+            started_at=now,
+            steps=[
+                StepRecord(
+                    step_id="b",
+                    step_type=StepType.CODE,
+                    status=StepStatus.COMPLETED,
+                    tool_calls=[call("b", 1), call("b", 0)],
+                ),
+                StepRecord(step_id="a", step_type=StepType.CODE, status=StepStatus.SKIPPED),
+                StepRecord(
+                    step_id="c",
+                    step_type=StepType.CODE,
+                    status=StepStatus.COMPLETED,
+                    tool_calls=[call("c", 0)],
+                ),
+            ],
+        )
+        await store.save_execution(record)
+        result = await store.get_execution("exec-steps")
+
+        assert result is not None
+        assert [s.step_id for s in result.steps] == ["b", "a", "c"]
+        assert [c.call_id for c in result.steps[0].tool_calls] == ["b-call-0", "b-call-1"]
+        assert result.steps[1].tool_calls == []
+        assert [c.call_id for c in result.steps[2].tool_calls] == ["c-call-0"]
+        assert result.steps[2].tool_calls[0].execution_id == "exec-steps"
+
     @pytest.mark.asyncio
     async def test_get_nonexistent(self, store: SQLiteTelemetryStore) -> None:
         """Test getting a nonexistent record."""
@@ -150,6 +214,86 @@ class TestSQLiteTelemetryStore:
         assert len(records) == 1
         assert records[0].execution_id == "exec-123"
 
+    @pytest.mark.asyncio
+    async def test_list_executions_returns_summaries(
+        self, store: SQLiteTelemetryStore, sample_record: ExecutionRecord
+    ) -> None:
+        """Test listed records skip payload columns that get_execution returns."""
+        await store.save_execution(sample_record)
+
+        records, _ = await store.list_executions()
+        assert records[0].status == ExecutionStatus.COMPLETED
+        assert records[0].started_at == sample_record.started_at
+        assert records[0].inputs == {}
+        assert records[0].outputs == {}
+        assert records[0].metrics == ExecutionMetrics()
+
+        full = await store.get_execution("exec-123")
+        assert full is not None
+        assert full.inputs == {"key": "value"}
+        assert full.metrics.total_steps == 1
+
+    @pytest.mark.asyncio
+    async def test_list_executions_filters(self, store: SQLiteTelemetryStore) -> None:
+        """Test each filter combination selects the matching executions."""
+        now = datetime.now(UTC)
+        for i in range(4):
+            await store.save_execution(
+                ExecutionRecord(
+                    execution_id=f"exec-{i}",
+                    execution_type=ExecutionType.WORKFLOW if i % 2 else ExecutionType.DIRECT,
+                    workflow_id="wf-1" if i < 2 else "wf-2",
+                    started_at=now - timedelta(hours=i),
+                )
+            )
+
+        records, total = await store.list_executions(workflow_id="wf-1")
+        assert total == 2
+        assert [r.execution_id for r in records] == ["exec-0", "exec-1"]
+
+        records, total = await store.list_executions(
+            execution_type=ExecutionType.WORKFLOW, workflow_id="wf-2"
+        )
+        assert total == 1
+        assert records[0].execution_id == "exec-3"
+
+        records, total = await store.list_executions(
+            since=now - timedelta(hours=2, minutes=30), page_size=1, page=2
+        )
+        assert total == 3
+        assert [r.execution_id for r in records] == ["exec-1"]
+
+        records, total = await store.list_executions(page_size=3, page=2)
+        assert total == 4
+        assert [r.execution_id for r in records] == ["exec-3"]
+
+        records, total = await store.list_executions(page_size=3, page=5)
+        assert total == 4
+        assert records == []
+
+    @pytest.mark.parametrize(
+        ("active", "index"),
+        [
+            ((False, True, False, False, False, False, False, False), "idx_exec_workflow_started"),
+            (
+                (True, False, False, True, False, False, False, False),
+                "idx_exec_type_status_started",
+            ),
+            ((False, False, False, False, False, False, False, True), "idx_exec_session_started"),
+        ],
+    )
+    def test_list_query_uses_composite_index(
+        self, store: SQLiteTelemetryStore, active: tuple[bool, ...], index: str
+    ) -> None:
+        """Test common filters pick the page from a covering composite index."""
+        assert store._conn is not None
+        _, page_sql = sqlite_module._list_queries(active)
+        params = ["x"] * sum(active) + [20, 0]
+        plan = " ".join(
+            row[3] for row in store._conn.execute(f"EXPLAIN QUERY PLAN {page_sql}", params)
+        )
+        assert f"COVERING INDEX {index}" in plan
+
     @pytest.mark.asyncio
     async def test_delete_execution(
         self, store: SQLiteTelemetryStore, sample_record: ExecutionRecord
@@ -178,6 +322,43 @@ class TestSQLiteTelemetryStore:
         deleted = await store.delete_before(cutoff)
         assert deleted == 2
 
+    @pytest.mark.asyncio
+    async def test_delete_before_in_batches(
+        self, store: SQLiteTelemetryStore, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test delete_before removes everything before the cutoff across batches."""
+        monkeypatch.setattr(sqlite_module, "DELETE_BATCH_SIZE", 2)
+        now = datetime.now(UTC)
+        for i in range(6):
+            await store.save_execution(
+                ExecutionRecord(
+                    execution_id=f"exec-{i}",
+                    execution_type=ExecutionType.WORKFLOW,
+                    started_at=now - timedelta(days=i),
+                )
+            )
+
+        assert await store.delete_before(now - timedelta(hours=1)) == 5
+        assert await store.delete_before(now - timedelta(hours=1)) == 0
+        _, total = await store.list_executions()
+        assert total == 1
+
+    @pytest.mark.asyncio
+    async def test_get_earliest_started_at(self, store: SQLiteTelemetryStore) -> None:
+        """Test reading the oldest execution start time."""
+        assert await store.get_earliest_started_at() is None
+
+        now = datetime.now(UTC)
+        for i in range(3):
+            record = ExecutionRecord(
+                execution_id=f"exec-{i}",
+                execution_type=ExecutionType.WORKFLOW,
+                started_at=now - timedelta(days=i),
+            )
+            await store.save_execution(record)
+
+        assert await store.get_earliest_started_at() == now - timedelta(days=2)
+
     @pytest.mark.asyncio
     async def test_tool_call_stats(
         self, store: SQLiteTelemetryStore, sample_record: ExecutionRecord
@@ -190,8 +371,443 @@ class TestSQLiteTelemetryStore:
         assert stats["file_read"]["total"] == 1
         assert stats["file_read"]["success"] == 1
 
+    @pytest.mark.asyncio
+    async def test_tool_call_stats_match_raw_counts(self, store: SQLiteTelemetryStore) -> None:
+        """Test day-summary stats equal a direct count over any time range."""
+        rng = random.Random(7)
+        base = datetime(2024, 3, 1, tzinfo=UTC)
+        times = [base + timedelta(hours=rng.randrange(0, 24 * 6)) for _ in range(60)]
+        for i, started_at in enumerate(times):
+            await store.save_execution(
+                ExecutionRecord(
+                    execution_id=f"exec-{i}",
+                    execution_type=ExecutionType.WORKFLOW,
+                    started_at=started_at,
+                    steps=[
+                        StepRecord(
+                            step_id="s",
+                            step_type=StepType.TOOL,
+                            status=StepStatus.COMPLETED,
+                            tool_calls=[
+                                ToolCallRecord(
+                                    call_id="c",
+                                    tool_name=rng.choice(["a", "b"]),
+                                    started_at=started_at,
+                                    error=(
+                                        ErrorRecord(code="E", category="tool", message="x")
+                                        if rng.random() < 0.3
+                                        else None
+                                    ),
+                                )
+                            ],
+                        )
+                    ],
+                )
+            )
+        # Updates and cascaded deletes must keep the summary in step
+        record = await store.get_execution("exec-0")
+        assert record is not None
+        record.steps[0].tool_calls[0].tool_name = "c"
+        await store.save_execution(record)
+        await store.delete_execution("exec-1")
+
+        calls = []
+        for i in range(len(times)):
+            saved = await store.get_execution(f"exec-{i}")
+            if saved is not None:
+                calls.append(saved.steps[0].tool_calls[0])
+
+        def raw(since: datetime | None, until: datetime | None) -> dict[str, Any]:
+            expected: dict[str, Any] = {}
+            for call in calls:
+                if (since and call.started_at < since) or (until and call.started_at > until):
+                    continue
+                entry = expected.setdefault(call.tool_name, {"total": 0, "success": 0, "error": 0})
+                entry["total"] += 1
+                entry["success" if call.error is None else "error"] += 1
+            return expected
+
+        bounds = [None, *(base + timedelta(hours=rng.randrange(-12, 24 * 7)) for _ in range(6))]
+        bounds.append(times[5])
+        for since in bounds:
+            for until in bounds:
+                stats = await store.get_tool_call_stats(since=since, until=until)
+                assert stats == raw(since, until), (since, until)
+
+    @pytest.mark.asyncio
+    async def test_wal_journal_mode(self, store: SQLiteTelemetryStore) -> None:
+        """Test the database is opened in WAL mode with foreign keys enforced."""
+        assert store._conn is not None
+        assert store._conn.execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+        assert store._conn.execute("PRAGMA foreign_keys").fetchone()[0] == 1
+
+    @pytest.mark.asyncio
+    async def test_no_transaction_left_open(
+        self, store: SQLiteTelemetryStore, sample_record: ExecutionRecord
+    ) -> None:
+        """Test the autocommit writer never leaves a transaction open."""
+        assert store._conn is not None
+        assert store._conn.isolation_level is None
+
+        await store.save_execution(sample_record)
+        assert not store._conn.in_transaction
+        await store.delete_before(datetime.now(UTC) + timedelta(days=1))
+        assert not store._conn.in_transaction
+
+    @pytest.mark.asyncio
+    async def test_delete_cascades_to_tool_calls(
+        self, store: SQLiteTelemetryStore, sample_record: ExecutionRecord
+    ) -> None:
+        """Test deleting an execution also removes its steps and tool calls."""
+        await store.save_execution(sample_record)
+        await store.delete_execution("exec-123")
+
+        assert await store.get_tool_call_stats() == {}
+
+    @pytest.mark.asyncio
+    async def test_failed_save_rolls_back(
+        self, store: SQLiteTelemetryStore, sample_record: ExecutionRecord
+    ) -> None:
+        """Test a save that fails part-way leaves the previous version intact."""
+        await store.save_execution(sample_record)
+        assert store._conn is not None
+        store._conn.execute(
+            "CREATE TRIGGER fail_steps BEFORE UPDATE ON steps BEGIN SELECT RAISE(ABORT, 'x'); END"
+        )
+
+        step = dataclasses.replace(sample_record.steps[0], status=StepStatus.FAILED)
+        broken = dataclasses.replace(sample_record, status=ExecutionStatus.FAILED, steps=[step])
+        with pytest.raises(sqlite3.IntegrityError):
+            await store.save_execution(broken)
+
+        result = await store.get_execution("exec-123")
+        assert result is not None
+        assert result.status == ExecutionStatus.COMPLETED
+        assert result.steps[0].status == StepStatus.COMPLETED
+
+    @pytest.mark.asyncio
+    async def test_resave_updates_rows_in_place(
+        self, store: SQLiteTelemetryStore, sample_record: ExecutionRecord
+    ) -> None:
+        """Test re-saving upserts existing rows and only adds new tool calls."""
+        await store.save_execution(sample_record)
+        assert store._conn is not None
+
+        step = sample_record.steps[0]
+        extra = dataclasses.replace(step.tool_calls[0], call_id="call-2", sequence=1)
+        step.tool_calls.append(extra)
+        step.status = StepStatus.FAILED
+        await store.save_execution(sample_record)
+
+        stats = await store.get_tool_call_stats()
+        assert sum(s["total"] for s in stats.values()) == 2
+        result = await store.get_execution("exec-123")
+        assert result is not None
+        assert result.steps[0].status == StepStatus.FAILED
+        assert [c.call_id for c in result.steps[0].tool_calls] == ["call-1", "call-2"]
+
+    @pytest.mark.asyncio
+    async def test_resave_removes_dropped_rows(
+        self, store: SQLiteTelemetryStore, sample_record: ExecutionRecord
+    ) -> None:
+        """Test steps and tool calls missing from a re-save are deleted."""
+        await store.save_execution(sample_record)
+
+        sample_record.steps[0].tool_calls = []
+        sample_record.steps.append(
+            StepRecord(step_id="step-2", step_type=StepType.CODE, status=StepStatus.PENDING)
+        )
+        await store.save_execution(sample_record)
+        sample_record.steps.pop(0)
+        await store.save_execution(sample_record)
+
+        result = await store.get_execution("exec-123")
+        assert result is not None
+        assert [s.step_id for s in result.steps] == ["step-2"]
+        assert await store.get_tool_call_stats() == {}
+
+    @pytest.mark.asyncio
+    async def test_tool_call_key_added_to_existing_db(self, db_path: str) -> None:
+        """Test opening a database without the tool call key deduplicates and adds it."""
+        conn = sqlite3.connect(db_path)
+        conn.execute(
+            """
+            CREATE TABLE tool_calls (
+                id INTEGER PRIMARY KEY AUTOINCREMENT, execution_id TEXT, step_id TEXT NOT NULL,
+                call_id TEXT NOT NULL, tool_name TEXT NOT NULL, started_at TEXT NOT NULL,
+                completed_at TEXT, duration_ms INTEGER, params TEXT, result TEXT, error TEXT,
+                source TEXT NOT NULL, sequence INTEGER NOT NULL
+            )
+        """
+        )
+        row = ("e", "s", "c", "t", "2024-01-01T00:00:00", "tool_step", 0)
+        conn.executemany(
+            "INSERT INTO tool_calls (execution_id, step_id, call_id, tool_name, started_at,"
+            " source, sequence) VALUES (?, ?, ?, ?, ?, ?, ?)",
+            [row, row],
+        )
+        conn.commit()
+        conn.close()
+
+        store = SQLiteTelemetryStore(db_path=db_path)
+        assert store._conn is not None
+        assert store._conn.execute("SELECT COUNT(*) FROM tool_calls").fetchone()[0] == 1
+        with pytest.raises(sqlite3.IntegrityError):
+            store._conn.execute(
+                "INSERT INTO tool_calls (execution_id, step_id, call_id, tool_name, started_at,"
+                " source, sequence) VALUES (?, ?, ?, ?, ?, ?, ?)",
+                row,
+            )
+        await store.close()
+
+    @pytest.mark.asyncio
+    async def test_enum_columns_migrated_to_codes(self, db_path: str) -> None:
+        """Test a database with enum values stored as text is migrated to codes."""
+        conn = sqlite3.connect(db_path)
+        conn.executescript(
+            """
+            CREATE TABLE executions (
+                execution_id TEXT PRIMARY KEY, execution_type TEXT NOT NULL, workflow_id TEXT,
+                workflow_version TEXT, tool_name TEXT, status TEXT NOT NULL,
+                started_at TEXT NOT NULL, completed_at TEXT, duration_ms INTEGER, inputs TEXT,
+                outputs TEXT, error TEXT, metrics TEXT, source TEXT, caller_id TEXT,
+                tenant_id TEXT, session_id TEXT, created_at TEXT DEFAULT CURRENT_TIMESTAMP
+            );
+            CREATE TABLE steps (
+                id INTEGER PRIMARY KEY AUTOINCREMENT, execution_id TEXT, step_id TEXT NOT NULL,
+                step_type TEXT NOT NULL, status TEXT NOT NULL, skip_reason TEXT,
+                started_at TEXT, completed_at TEXT, duration_ms INTEGER, tool_name TEXT,
+                tool_params TEXT, tool_result TEXT, code_hash TEXT, error TEXT,
+                attempt INTEGER DEFAULT 1, max_attempts INTEGER DEFAULT 1,
+                UNIQUE(execution_id, step_id, attempt)
+            );
+            CREATE TABLE tool_calls (
+                id INTEGER PRIMARY KEY AUTOINCREMENT, execution_id TEXT, step_id TEXT NOT NULL,
+                call_id TEXT NOT NULL, tool_name TEXT NOT NULL, started_at TEXT NOT NULL,
+                completed_at TEXT, duration_ms INTEGER, params TEXT, result TEXT, error TEXT,
+                source TEXT NOT NULL, sequence INTEGER NOT NULL
+            );
+            INSERT INTO executions (execution_id, execution_type, workflow_id, status, started_at)
+            VALUES ('exec-1', 'workflow', 'wf', 'failed', '2024-01-01T00:00:00');
+            INSERT INTO steps (execution_id, step_id, step_type, status)
+            VALUES ('exec-1', 'step-1', 'code', 'skipped'), ('exec-1', 'step-0', 'tool', 'pending'),
+                   ('exec-gone', 'step-1', 'code', 'completed');
+            INSERT INTO tool_calls (execution_id, step_id, call_id, tool_name, started_at,
+                                    source, sequence)
+            VALUES ('exec-1', 'step-1', 'call-1', 'tool', '2024-01-01T00:00:00',
+                    'code_block', 0),
+                   ('exec-gone', 'step-1', 'call-1', 'tool', '2024-01-01T00:00:00',
+                    'code_block', 0);
+        """
+        )
+        conn.close()
+
+        store = SQLiteTelemetryStore(db_path=db_path)
+        assert store._conn is not None
+        assert (
+            store._conn.execute("PRAGMA user_version").fetchone()[0] == sqlite_module.SCHEMA_VERSION
+        )
+        types = store._conn.execute(
+            "SELECT typeof(e.execution_type), typeof(e.status), typeof(s.step_type),"
+            " typeof(s.status), typeof(t.source)"
+            " FROM executions e, steps s, tool_calls t WHERE s.step_id = 'step-1'"
+        ).fetchone()
+        assert tuple(types) == ("integer",) * 5
+        # Rows left behind by deleted executions are dropped, not counted
+        for table in ("steps", "tool_calls"):
+            assert not store._conn.execute(
+                f"SELECT COUNT(*) FROM {table} WHERE execution_id = 'exec-gone'"
+            ).fetchone()[0]
+
+        record = await store.get_execution("exec-1")
+        assert record is not None
+        assert record.execution_type == ExecutionType.WORKFLOW
+        assert record.status == ExecutionStatus.FAILED
+        assert record.steps[0].step_type == StepType.CODE
+        assert record.steps[0].status == StepStatus.SKIPPED
+        assert record.steps[0].tool_calls[0].source == ToolCallSource.CODE_BLOCK
+        assert [step.step_id for step in record.steps] == ["step-1", "step-0"]
+
+        records, total = await store.list_executions(status=ExecutionStatus.FAILED)
+        assert total == 1 and records[0].execution_id == "exec-1"
+        stats = await store.get_tool_call_stats()
+        assert stats["tool"]["total"] == 1
+
+        # Deletes still cascade and keep the stats in step
+        await store.delete_execution("exec-1")
+        assert store._conn.execute("SELECT COUNT(*) FROM tool_calls").fetchone()[0] == 0
+        assert await store.get_tool_call_stats() == {}
+        await store.close()
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize(
+        ("code_hash", "stored_type"),
+        [
+            (hashlib.sha256(b"x = 1").hexdigest(), "blob"),
+            (hashlib.sha256(b"x = 1").hexdigest().upper(), "text"),
+            ("not-hex", "text"),
+        ],
+    )
+    async def test_code_hash_round_trip(
+        self, store: SQLiteTelemetryStore, code_hash: str, stored_type: str
+    ) -> None:
+        """Test hex code hashes are stored as bytes and read back unchanged."""
+        await store.save_execution(
+            ExecutionRecord(
+                execution_id="exec-1",
+                execution_type=ExecutionType.WORKFLOW,
+                started_at=datetime.now(UTC),
+                steps=[StepRecord(step_id="s", step_type=StepType.CODE, code_hash=code_hash)],
+            )
+        )
+
+        assert store._conn is not None
+        row = store._conn.execute("SELECT typeof(code_hash) FROM steps").fetchone()
+        assert row[0] == stored_type
+        record = await store.get_execution("exec-1")
+        assert record is not None
+        assert record.steps[0].code_hash == code_hash
+
+    @pytest.mark.asyncio
+    async def test_large_payloads_stored_compressed(self, store: SQLiteTelemetryStore) -> None:
+        """Test large payloads are compressed on disk and small ones stay text."""
+        large = {"rows": [{"id": i, "name": f"item-{i}"} for i in range(100)]}
+        small = {"q": "x"}
+        await store.save_execution(
+            ExecutionRecord(
+                execution_id="exec-1",
+                execution_type=ExecutionType.DIRECT,
+                started_at=datetime.now(UTC),
+                inputs=small,
+                outputs=large,
+                steps=[
+                    StepRecord(
+                        step_id="s",
+                        step_type=StepType.TOOL,
+                        tool_result=large,
+                        tool_calls=[
+                            ToolCallRecord(
+                                call_id="c",
+                                tool_name="t",
+                                started_at=datetime.now(UTC),
+                                params=small,
+                                result=large,
+                            )
+                        ],
+                    )
+                ],
+            )
+        )
+
+        assert store._conn is not None
+        row = store._conn.execute(
+            "SELECT typeof(e.inputs), typeof(e.outputs), typeof(s.tool_result),"
+            " typeof(t.params), typeof(t.result)"
+            " FROM executions e, steps s, tool_calls t"
+        ).fetchone()
+        assert tuple(row) == ("text", "blob", "blob", "text", "blob")
+        record = await store.get_execution("exec-1")
+        assert record is not None
+        assert record.inputs == small
+        assert record.outputs == large
+        assert record.steps[0].tool_result == large
+        assert record.steps[0].tool_calls[0].params == small
+        assert record.steps[0].tool_calls[0].result == large
+
+    @pytest.mark.asyncio
+    async def test_round_trip_keeps_timezone_offsets(self, store: SQLiteTelemetryStore) -> None:
+        """Test equal instants in different zones keep their own offsets."""
+        utc = datetime(2024, 1, 1, 12, 0, tzinfo=UTC)
+        plus_two = utc.astimezone(timezone(timedelta(hours=2)))
+        for execution_id, started_at in (("exec-utc", utc), ("exec-plus-two", plus_two)):
+            await store.save_execution(
+                ExecutionRecord(
+                    execution_id=execution_id,
+                    execution_type=ExecutionType.DIRECT,
+                    started_at=started_at,
+                )
+            )
+
+        result = await store.get_execution("exec-plus-two")
+        assert result is not None
+        assert result.started_at is not None
+        assert result.started_at.utcoffset() == timedelta(hours=2)
+
+    @pytest.mark.asyncio
+    async def test_reads_not_blocked_by_writer(
+        self, store: SQLiteTelemetryStore, sample_record: ExecutionRecord
+    ) -> None:
+        """Test reads use the read pool while the writer thread is busy."""
+        await store.save_execution(sample_record)
+        release = threading.Event()
+        loop = asyncio.get_running_loop()
+        busy = loop.run_in_executor(store._executor, release.wait)
+        try:
+            result = await asyncio.wait_for(store.get_execution("exec-123"), timeout=5)
+            assert result is not None
+            _, total = await asyncio.wait_for(store.list_executions(), timeout=5)
+            assert total == 1
+        finally:
+            release.set()
+            await busy
+
+    @pytest.mark.asyncio
+    async def test_in_memory_database(self, sample_record: ExecutionRecord) -> None:
+        """Test an in-memory store reads through the writer connection."""
+        store = SQLiteTelemetryStore(db_path=":memory:")
+        await store.save_execution(sample_record)
+
+        result = await store.get_execution("exec-123")
+        assert result is not None
+        assert len(result.steps[0].tool_calls) == 1
+        await store.close()
+
     @pytest.mark.asyncio
     async def test_close(self, store: SQLiteTelemetryStore) -> None:
         """Test closing the store."""
         await store.close()
         # Should not raise
+
+
+class TestJSONColumns:
+    """Test JSON column encoding."""
+
+    def test_round_trip(self) -> None:
+        """Test JSON values survive encoding, including big integers."""
+        value = {"text": "café", "big": 2**70, "nested": [1, 2.5, None, True]}
+        assert sqlite_module._loads_payload(sqlite_module._dumps_payload(value)) == value
+        assert sqlite_module._loads_payload(sqlite_module._dumps_payload({1: "a"})) == {"1": "a"}
+
+    def test_non_finite_floats_kept(self) -> None:
+        """Test NaN and infinities are stored as such, not as null."""
+        value = {"x": float("nan"), "y": float("inf")}
+        loaded = sqlite_module._loads_payload(sqlite_module._dumps_payload(value))
+        assert loaded["x"] != loaded["x"]
+        assert loaded["y"] == float("inf")
+
+    @pytest.mark.parametrize(
+        "value",
+        [datetime.now(), uuid.uuid4(), ExecutionMetrics(total_steps=1)],
+    )
+    def test_non_json_payloads_rejected(self, value: object) -> None:
+        """Test payload values with no JSON form raise, dataclasses included."""
+        with pytest.raises(TypeError):
+            sqlite_module._dumps_payload({"value": value})
+
+    def test_dataclasses_encode_as_fields(self) -> None:
+        """Test error chains and metrics encode directly from their dataclasses."""
+        error = ErrorRecord(
+            code="E1",
+            category="tool",
+            message="outer",
+            cause=ErrorRecord(code="E0", category="system", message="inner"),
+        )
+        data = sqlite_module._loads(sqlite_module._dumps_record(error))
+        assert data["cause"]["message"] == "inner"
+        assert data["cause"]["cause"] is None
+        assert data == dataclasses.asdict(error)
+
+        metrics = ExecutionMetrics(total_steps=2, tool_call_breakdown={"t": 3})
+        assert sqlite_module._loads(sqlite_module._dumps_record(metrics)) == dataclasses.asdict(
+            metrics
+        )
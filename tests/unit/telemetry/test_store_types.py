@@ -165,3 +165,51 @@ class TestExecutionRecord:
         )
         assert record.runner_id == "my-runner"
         assert record.bridge_session_id == "bridge-abc-123"
+
+
+class TestToDict:
+    """Test record to_dict conversion."""
+
+    def test_execution_record_to_dict(self) -> None:
+        """Test nested records, enums and datetimes convert to plain values."""
+        started = datetime(2024, 1, 1, tzinfo=UTC)
+        inputs = {"url": "https://example.com"}
+        record = ExecutionRecord(
+            execution_id="exec-1",
+            execution_type=ExecutionType.WORKFLOW,
+            status=ExecutionStatus.FAILED,
+            started_at=started,
+            inputs=inputs,
+            error=ErrorRecord(
+                code="E1",
+                category="tool",
+                message="outer",
+                cause=ErrorRecord(code="E0", category="system", message="inner"),
+            ),
+            steps=[
+                StepRecord(
+                    step_id="s",
+                    step_type=StepType.TOOL,
+                    tool_calls=[
+                        ToolCallRecord(
+                            call_id="c",
+                            tool_name="t",
+                            started_at=started,
+                            source=ToolCallSource.CODE_BLOCK,
+                        )
+                    ],
+                )
+            ],
+        )
+
+        data = record.to_dict()
+        assert data["execution_type"] == "workflow"
+        assert data["status"] == "failed"
+        assert data["started_at"] == started.isoformat()
+        assert data["completed_at"] is None
+        assert data["inputs"] is inputs
+        assert data["error"]["cause"]["message"] == "inner"
+        assert data["steps"][0]["step_type"] == "tool"
+        assert data["steps"][0]["tool_calls"][0]["source"] == "code_block"
+        assert data["metrics"] == ExecutionMetrics().to_dict()
+        assert set(data) == set(ExecutionRecord.__dataclass_fields__)
@@ -1,10 +1,18 @@
 """Unit tests for TokenEstimator."""
 
+import dataclasses
+from types import SimpleNamespace
+from typing import Any
+
+from opentelemetry.sdk.metrics import MeterProvider
+from opentelemetry.sdk.metrics.export import InMemoryMetricReader
+
 from ploston_core.telemetry.token_estimator import (
     DEFAULT_PRICING,
     TokenEstimationConfig,
     TokenEstimator,
     TokenSavingsResult,
+    _metric_attributes,
 )
 
 
@@ -92,6 +100,11 @@ class TestTokenEstimator:
         tokens = estimator.estimate_raw_mcp_tokens(0)
         assert tokens == 200  # Just base tokens
 
+    def test_estimate_raw_mcp_tokens_negative_steps(self):
+        """Test raw MCP estimation treats a negative step count as zero."""
+        estimator = TokenEstimator()
+        assert estimator.estimate_raw_mcp_tokens(-3) == 200
+
     def test_estimate_ploston_tokens_small_output(self):
         """Test Ploston estimation for small output."""
         estimator = TokenEstimator()
@@ -134,6 +147,7 @@ class TestTokenEstimator:
         assert result.tokens_saved == 2775
         assert result.savings_percentage > 80  # Should be ~86%
         assert result.cost_saved_usd > 0
+        assert result.to_dict() == dataclasses.asdict(result)
 
     def test_calculate_savings_five_step_workflow(self):
         """Test savings for 5-step workflow (spec example)."""
@@ -183,3 +197,47 @@ class TestDefaultPricing:
         """Test GPT-4o-mini pricing."""
         assert DEFAULT_PRICING["gpt4o_mini"]["input"] == 0.15
         assert DEFAULT_PRICING["gpt4o_mini"]["output"] == 0.6
+
+
+class TestRecordWorkflowSavings:
+    """Tests for metric emission in record_workflow_savings."""
+
+    @staticmethod
+    def _points(reader: InMemoryMetricReader) -> dict[str, list[Any]]:
+        data = reader.get_metrics_data()
+        assert data is not None
+        return {
+            metric.name: list(metric.data.data_points)
+            for resource_metrics in data.resource_metrics
+            for scope_metrics in resource_metrics.scope_metrics
+            for metric in scope_metrics.metrics
+        }
+
+    def test_counters_accumulate_per_workflow(self):
+        """Test counters report running totals at collection."""
+        reader = InMemoryMetricReader()
+        meter = MeterProvider(metric_readers=[reader]).get_meter("test")
+        estimator = TokenEstimator(meter=meter)
+        result = SimpleNamespace(
+            workflow_id="wf", outputs={"ok": True}, steps_completed=5, steps_failed=0
+        )
+
+        savings = estimator.record_workflow_savings(result)  # type: ignore[arg-type]
+        estimator.record_workflow_savings(result)  # type: ignore[arg-type]
+        points = self._points(reader)
+
+        (tokens,) = points["ploston_tokens_saved_total"]
+        assert tokens.value == 2 * savings.tokens_saved
+        assert tokens.attributes == {"workflow_name": "wf"}
+        (cost,) = points["ploston_cost_saved_cents_total"]
+        assert cost.value == 2 * int(savings.cost_saved_usd * 100)
+        assert cost.attributes == {"workflow_name": "wf", "model": "claude_sonnet"}
+        (raw,) = points["ploston_raw_mcp_estimate_total"]
+        assert raw.value == 2 * savings.raw_mcp_tokens
+        (per_execution,) = points["ploston_tokens_saved_per_execution"]
+        assert per_execution.count == 2
+
+    def test_metric_attributes_interned(self):
+        """Test attribute sets are built once per workflow and model."""
+        assert _metric_attributes("wf") is _metric_attributes("wf")
+        assert _metric_attributes("wf", "gpt4o") == {"workflow_name": "wf", "model": "gpt4o"}
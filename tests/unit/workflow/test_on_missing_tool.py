@@ -1,5 +1,7 @@
 """Tests for T-689: on_missing_tool: skip workflow schema field."""
 
+import pytest
+
 from ploston_core.types import OnMissingTool, StepType
 from ploston_core.workflow.parser import parse_workflow_yaml
 from ploston_core.workflow.schema_generator import generate_workflow_schema
@@ -47,6 +49,18 @@ steps:
         workflow = parse_workflow_yaml(yaml_content)
         assert workflow.steps[0].on_missing_tool is None
 
+    def test_on_missing_tool_invalid_value_rejected(self) -> None:
+        """An unknown on_missing_tool value should raise ValueError."""
+        yaml_content = """
+name: test-workflow
+steps:
+  - id: fetch_data
+    tool: some_tool
+    on_missing_tool: [skip]
+"""
+        with pytest.raises(ValueError):
+            parse_workflow_yaml(yaml_content)
+
 
 class TestOnMissingToolEnum:
     """Test OnMissingTool enum values."""
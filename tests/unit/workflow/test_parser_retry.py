@@ -0,0 +1,64 @@
+"""Tests for retry parsing in parse_workflow_yaml."""
+
+import dataclasses
+
+import pytest
+
+from ploston_core.types import BackoffType
+from ploston_core.workflow.parser import parse_workflow_yaml
+
+YAML = """
+name: retry-workflow
+defaults:
+  retry:
+    max_attempts: 2
+    backoff: exponential
+steps:
+  - id: a
+    tool: t
+    retry:
+      max_attempts: 2
+      backoff: exponential
+  - id: b
+    tool: t
+    retry:
+      max_attempts: 5
+  - id: c
+    tool: t
+  - id: d
+    tool: t
+    retry:
+      max_attempts: 5
+      delay_seconds: 1
+"""
+
+
+class TestRetryParsing:
+    """Test retry blocks are parsed and shared."""
+
+    def test_retry_values(self) -> None:
+        """Retry blocks parse with defaults for missing keys."""
+        workflow = parse_workflow_yaml(YAML)
+        assert workflow.defaults is not None
+        assert workflow.defaults.retry is not None
+        assert workflow.defaults.retry.backoff == BackoffType.EXPONENTIAL
+        b, c, d = workflow.steps[1:]
+        assert b.retry is not None
+        assert (b.retry.max_attempts, b.retry.backoff, b.retry.delay_seconds) == (
+            5,
+            BackoffType.FIXED,
+            1.0,
+        )
+        assert c.retry is None
+        assert d.retry is not None
+        assert d.retry == b.retry
+        assert type(d.retry.delay_seconds) is int
+
+    def test_equal_retry_policies_shared(self) -> None:
+        """Equal retry blocks share one frozen RetryConfig."""
+        workflow = parse_workflow_yaml(YAML)
+        assert workflow.defaults is not None
+        assert workflow.steps[0].retry is workflow.defaults.retry
+        assert workflow.steps[3].retry is not workflow.steps[1].retry
+        with pytest.raises(dataclasses.FrozenInstanceError):
+            workflow.steps[0].retry.max_attempts = 9  # type: ignore[misc,union-attr]
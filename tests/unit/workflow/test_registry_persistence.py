@@ -293,6 +293,54 @@ steps:
         assert registry.get("uses-unknown-tool") is not None
 
 
+class TestInitializeFromDisk:
+    """Tests for initialize() loading workflow files."""
+
+    def test_initialize_skips_invalid_files(self, tmp_path: Path):
+        """A file that fails to parse is logged; the others still load."""
+        config = _make_config(tmp_path)
+        workflows_dir = Path(config.directory)
+        workflows_dir.mkdir(parents=True, exist_ok=True)
+        for i in range(5):
+            (workflows_dir / f"wf-{i}.yaml").write_text(
+                SAMPLE_YAML.replace("test-workflow", f"wf-{i}")
+            )
+        (workflows_dir / "broken.yaml").write_text("name: [unclosed\n")
+        logger = MagicMock()
+
+        registry = WorkflowRegistry(_make_tool_registry(), config, logger=logger)
+
+        loop = asyncio.new_event_loop()
+        try:
+            count = loop.run_until_complete(registry.initialize())
+        finally:
+            loop.close()
+
+        assert count == 5
+        for i in range(5):
+            assert registry._workflows[f"wf-{i}"].source == "file"
+        failures = [c for c in logger._log.call_args_list if c.args[2] == "Failed to load workflow"]
+        assert len(failures) == 1
+        assert failures[0].args[3]["file"] == str(workflows_dir / "broken.yaml")
+
+
+class TestSnapshot:
+    """Tests for snapshot() caching."""
+
+    def test_snapshot_built_once_per_registration(self, tmp_path: Path):
+        """Snapshots are reused until the workflow is registered again."""
+        registry = WorkflowRegistry(_make_tool_registry(), _make_config(tmp_path))
+        registry.register_from_yaml(SAMPLE_YAML)
+
+        first = registry.snapshot("test-workflow")
+        assert first["version"] == "1.0.0"
+        assert first["steps"][0]["params"] == {"message": "hello"}
+        assert registry.snapshot("test-workflow") is first
+
+        registry.register_from_yaml(SAMPLE_YAML_V2)
+        assert registry.snapshot("test-workflow")["version"] == "2.0.0"
+
+
 class TestYamlContentPreserved:
     """Tests that yaml_content is preserved through registration."""
 
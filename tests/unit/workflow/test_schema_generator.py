@@ -32,10 +32,11 @@ class TestSchemaCompleteness:
         schema = generate_workflow_schema()
         wf_props = schema["properties"]
 
-        # These are the user-facing YAML keys (source_path/yaml_content are internal)
+        # These are the user-facing YAML keys (source_path/yaml_content are
+        # internal, and non-init fields are computed caches)
         internal_fields = {"source_path", "yaml_content"}
         for f in dataclasses.fields(WorkflowDefinition):
-            if f.name in internal_fields:
+            if f.name in internal_fields or not f.init:
                 continue
             assert f.name in wf_props, f"WorkflowDefinition.{f.name} missing from schema"
 
@@ -0,0 +1,96 @@
+"""Tests for WorkflowDefinition step lookup, execution order and input schema."""
+
+from ploston_core.workflow.types import InputDefinition, StepDefinition, WorkflowDefinition
+
+
+def make_workflow() -> WorkflowDefinition:
+    return WorkflowDefinition(
+        name="order-workflow",
+        version="1.0",
+        steps=[
+            StepDefinition(id="b", code="result = 1", depends_on=["a"]),
+            StepDefinition(id="a", code="result = 1"),
+        ],
+    )
+
+
+def test_order_is_reused():
+    workflow = make_workflow()
+    first = workflow.get_execution_order()
+    cached = workflow._execution_order
+
+    assert first == ["a", "b"]
+    assert workflow.get_execution_order() == first
+    assert workflow._execution_order is cached
+
+
+def test_returned_order_is_a_copy():
+    workflow = make_workflow()
+    workflow.get_execution_order().append("x")
+
+    assert workflow.get_execution_order() == ["a", "b"]
+
+
+def test_order_recomputed_when_steps_change():
+    workflow = make_workflow()
+    workflow.get_execution_order()
+
+    workflow.steps.append(StepDefinition(id="c", code="result = 1"))
+    assert workflow.get_execution_order() == ["a", "b", "c"]
+
+    workflow.steps = [StepDefinition(id="d", code="result = 1")]
+    assert workflow.get_execution_order() == ["d"]
+
+
+def test_cache_not_part_of_equality():
+    workflow = make_workflow()
+    workflow.get_execution_order()
+
+    assert workflow == make_workflow()
+
+
+def test_get_step_uses_index():
+    workflow = make_workflow()
+
+    assert workflow.get_step("a") is workflow.steps[1]
+    assert workflow._step_positions == {"b": 0, "a": 1}
+    assert workflow.get_step("missing") is None
+
+
+def test_get_step_returns_first_duplicate():
+    workflow = make_workflow()
+    workflow.steps.append(StepDefinition(id="a", code="result = 2"))
+
+    assert workflow.get_step("a") is workflow.steps[1]
+
+
+def test_get_step_follows_edited_steps():
+    workflow = make_workflow()
+    workflow.get_step("a")
+
+    workflow.steps.insert(0, StepDefinition(id="c", code="result = 1"))
+    assert workflow.get_step("a") is workflow.steps[2]
+    assert workflow.get_step("c") is workflow.steps[0]
+
+    workflow.steps = [StepDefinition(id="d", code="result = 1")]
+    assert workflow.get_step("a") is None
+    assert workflow.get_step("d") is workflow.steps[0]
+
+
+def test_input_schema_defaults_optional():
+    workflow = make_workflow()
+    workflow.inputs = [
+        InputDefinition(name="count", type="integer", default=3, minimum=0, required=False),
+        InputDefinition(name="url", description="Page URL", pattern="^https://"),
+    ]
+
+    assert workflow.get_input_schema() == {
+        "type": "object",
+        "properties": {
+            "count": {"type": "integer", "minimum": 0, "default": 3},
+            "url": {"type": "string", "description": "Page URL", "pattern": "^https://"},
+        },
+        "required": ["url"],
+    }
+    without_defaults = workflow.get_input_schema(include_defaults=False)
+    assert without_defaults["properties"]["count"] == {"type": "integer", "minimum": 0}